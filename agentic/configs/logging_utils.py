@@ -5,13 +5,67 @@ Logging utilities for AI Portfolio project.
 import logging
 import logging.config
 import os
-import yaml
+import threading
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Optional, Union
+
+from yaml import load as yaml_load
+
+try:
+    # libyaml C bindings are several times faster than the pure-Python parser
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# Static paths, computed once at import
+_DEFAULT_CONFIG_PATH = Path(__file__).parent / "logging.yaml"
+
+# Logging is configured lazily on first use rather than at import time
+_configured = False
+_configure_lock = threading.Lock()
+
+# Structured-logging targets, resolved once instead of on every helper call
+_AGENT_LOG = logging.getLogger("agentic.agents")
+_CREW_LOG = logging.getLogger("agentic.crews")
+_TASK_LOG = logging.getLogger("agentic.tasks")
+
+
+def _load_config(f) -> Dict[str, Any]:
+    """
+    Parse a YAML logging config.
+    
+    Args:
+        f: Config file, already opened in binary mode
+        
+    Returns:
+        Parsed logging configuration dictionary
+    """
+    # Bytes go straight to libyaml, skipping Python-level text decoding
+    return yaml_load(f, Loader=_YamlLoader)
+
+
+def _ensure_log_dirs(config: Dict[str, Any]) -> None:
+    """
+    Create the parent directories of any file handlers in a logging config.
+    
+    File handlers open their file as soon as dictConfig() builds them, so this
+    must run beforehand. Console-only configs touch the filesystem not at all.
+    
+    Args:
+        config: Parsed logging configuration dictionary
+    """
+    dirs = {
+        os.path.dirname(handler["filename"])
+        for handler in config.get("handlers", {}).values()
+        if "filename" in handler
+    }
+    for directory in dirs:
+        if directory:
+            os.makedirs(directory, exist_ok=True)
 
 
 def setup_logging(
-    config_path: Optional[str] = None,
+    config_path: Optional[Union[str, Path]] = None,
     default_level: int = logging.INFO,
     env_key: str = "LOG_CFG"
 ) -> None:
@@ -23,32 +77,49 @@ def setup_logging(
         default_level: Default logging level if config file not found
         env_key: Environment variable name for config path override
     """
-    # Create logs directory if it doesn't exist
-    logs_dir = Path("logs")
-    logs_dir.mkdir(exist_ok=True)
+    global _configured
     
     # Determine config path
     if config_path is None:
-        config_path = os.getenv(env_key, None)
+        # Fall back to the env override, then the config shipped next to this file
+        config_path = os.getenv(env_key) or _DEFAULT_CONFIG_PATH
     
-    if config_path is None:
-        # Use default config path relative to this file
-        config_path = Path(__file__).parent / "logging.yaml"
+    # A single open() both checks for the file and reads it
+    try:
+        f = open(config_path, 'rb')
+    except FileNotFoundError:
+        # Fallback to a console handler, written through unbuffered so
+        # warnings show up immediately.
+        # Like basicConfig(), leave an already-configured root logger alone.
+        root = logging.getLogger()
+        if not root.handlers:
+            console = logging.StreamHandler()
+            console.setFormatter(logging.Formatter(
+                "{asctime} - {name} - {levelname} - {message}",
+                datefmt="%Y-%m-%d %H:%M:%S",
+                style="{",
+                validate=True
+            ))
+            root.setLevel(default_level)
+            root.addHandler(console)
+        logging.warning(f"Logging config file not found at {config_path}. Using basic configuration.")
+    else:
+        with f:
+            config = _load_config(f)
+        _ensure_log_dirs(config)
+        logging.config.dictConfig(config)
     
-    config_path = Path(config_path)
+    _configured = True
+
+
+def ensure_configured() -> None:
+    """Run setup_logging() once, unless logging has already been configured."""
+    if _configured:
+        return
     
-    if config_path.exists():
-        with open(config_path, 'r') as f:
-            config = yaml.safe_load(f.read())
-        logging.config.dictConfig(config)
-    else:
-        # Fallback to basic configuration
-        logging.basicConfig(
-            level=default_level,
-            format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-            datefmt="%Y-%m-%d %H:%M:%S"
-        )
-        logging.warning(f"Logging config file not found at {config_path}. Using basic configuration.")
+    with _configure_lock:
+        if not _configured:
+            setup_logging()
 
 
 def get_logger(name: str) -> logging.Logger:
@@ -61,6 +132,7 @@ def get_logger(name: str) -> logging.Logger:
     Returns:
         Logger instance
     """
+    ensure_configured()
     return logging.getLogger(name)
 
 
@@ -73,15 +145,13 @@ def log_agent_action(agent_name: str, action: str, details: Optional[dict] = Non
         action: Action being performed
         details: Additional details about the action
     """
-    logger = get_logger("agentic.agents")
+    ensure_configured()
+    if not _AGENT_LOG.isEnabledFor(logging.INFO):
+        return
     
-    log_data = {
-        "agent": agent_name,
-        "action": action,
-        "details": details or {}
-    }
+    log_data = {"agent": agent_name, "action": action, "details": details or {}}
     
-    logger.info("Agent action", extra=log_data)
+    _AGENT_LOG.info("Agent action", extra=log_data)
 
 
 def log_crew_execution(crew_name: str, status: str, metrics: Optional[dict] = None) -> None:
@@ -93,18 +163,15 @@ def log_crew_execution(crew_name: str, status: str, metrics: Optional[dict] = No
         status: Execution status (started, completed, failed, etc.)
         metrics: Execution metrics (duration, tasks completed, etc.)
     """
-    logger = get_logger("agentic.crews")
+    level = logging.ERROR if status == "failed" else logging.INFO
     
-    log_data = {
-        "crew": crew_name,
-        "status": status,
-        "metrics": metrics or {}
-    }
+    ensure_configured()
+    if not _CREW_LOG.isEnabledFor(level):
+        return
     
-    if status == "failed":
-        logger.error("Crew execution", extra=log_data)
-    else:
-        logger.info("Crew execution", extra=log_data)
+    log_data = {"crew": crew_name, "status": status, "metrics": metrics or {}}
+    
+    _CREW_LOG.log(level, "Crew execution", extra=log_data)
 
 
 def log_task_progress(task_name: str, progress: float, details: Optional[str] = None) -> None:
@@ -116,16 +183,10 @@ def log_task_progress(task_name: str, progress: float, details: Optional[str] =
         progress: Progress percentage (0.0 to 1.0)
         details: Additional progress details
     """
-    logger = get_logger("agentic.tasks")
+    ensure_configured()
+    if not _TASK_LOG.isEnabledFor(logging.DEBUG):
+        return
     
-    log_data = {
-        "task": task_name,
-        "progress": progress,
-        "details": details
-    }
+    log_data = {"task": task_name, "progress": progress, "details": details}
     
-    logger.debug("Task progress", extra=log_data)
-
-
-# Initialize logging when module is imported
-setup_logging()
\ No newline at end of file
+    _TASK_LOG.debug("Task progress", extra=log_data)
@@ -6,120 +6,176 @@ A specialized CrewAI implementation for content analysis featuring:
 - Content analyzer for extracting insights
 - Data scientist for statistical analysis
 - Report generator for comprehensive reporting
+
+Run from the agentic directory: python -m examples.content_analysis_crew
 """
 
-import os
+import threading
+from typing import Optional
+
 from crewai import Agent, Task, Crew, Process
 from crewai_tools import FileReaderTool, FileWriterTool
-from dotenv import load_dotenv
-
-# Load environment variables
-load_dotenv()
-
-# Initialize tools
-file_reader = FileReaderTool()
-file_writer = FileWriterTool()
-
-# Define agents
-content_analyzer = Agent(
-    role='Content Analyst',
-    goal='Analyze text content for themes, sentiment, and key insights',
-    backstory="""You are an expert content analyst with deep expertise in natural language processing.
-    You excel at identifying patterns, themes, and sentiment in written content.
-    Your analyses provide valuable insights for content strategy and optimization.""",
-    tools=[file_reader],
-    verbose=True,
-    allow_delegation=False
+
+from configs.logging_utils import setup_logging
+from src.config.env import load_env_once
+
+# Load environment variables (shared across example modules)
+load_env_once()
+
+# Agent backstories and task descriptions, kept byte-for-byte as the LLM sees them
+_CONTENT_ANALYZER_BACKSTORY = (
+    "You are an expert content analyst with deep expertise in natural language processing.\n"
+    "    You excel at identifying patterns, themes, and sentiment in written content.\n"
+    "    Your analyses provide valuable insights for content strategy and optimization."
 )
 
-data_scientist = Agent(
-    role='Data Scientist',
-    goal='Perform statistical analysis and extract quantitative insights',
-    backstory="""You are a data scientist specializing in text analytics and metrics.
-    You transform qualitative content analysis into actionable quantitative insights.
-    Your statistical approach provides objective measurements and trends.""",
-    tools=[],
-    verbose=True,
-    allow_delegation=False
+_DATA_SCIENTIST_BACKSTORY = (
+    "You are a data scientist specializing in text analytics and metrics.\n"
+    "    You transform qualitative content analysis into actionable quantitative insights.\n"
+    "    Your statistical approach provides objective measurements and trends."
 )
 
-report_generator = Agent(
-    role='Report Writer',
-    goal='Create comprehensive analysis reports with actionable recommendations',
-    backstory="""You are a professional report writer who specializes in business intelligence.
-    You transform complex analysis into clear, actionable business recommendations.
-    Your reports drive strategic decision-making and content optimization.""",
-    tools=[file_writer],
-    verbose=True,
-    allow_delegation=False
+_REPORT_GENERATOR_BACKSTORY = (
+    "You are a professional report writer who specializes in business intelligence.\n"
+    "    You transform complex analysis into clear, actionable business recommendations.\n"
+    "    Your reports drive strategic decision-making and content optimization."
 )
 
-# Define tasks
-content_analysis_task = Task(
-    description="""Analyze the content in the file: {content_file}
-    
-    Perform comprehensive analysis including:
-    - Main themes and topics identification
-    - Sentiment analysis (positive, negative, neutral)
-    - Key message extraction
-    - Writing style assessment
-    - Target audience identification
-    - Content structure evaluation
-    
-    Provide detailed findings with specific examples from the text.""",
-    agent=content_analyzer,
-    expected_output="Detailed content analysis with themes, sentiment, and key insights"
+_CONTENT_ANALYSIS_TASK_DESCRIPTION = (
+    "Analyze the content in the file: {content_file}\n"
+    "    \n"
+    "    Perform comprehensive analysis including:\n"
+    "    - Main themes and topics identification\n"
+    "    - Sentiment analysis (positive, negative, neutral)\n"
+    "    - Key message extraction\n"
+    "    - Writing style assessment\n"
+    "    - Target audience identification\n"
+    "    - Content structure evaluation\n"
+    "    \n"
+    "    Provide detailed findings with specific examples from the text."
 )
 
-statistical_analysis_task = Task(
-    description="""Based on the content analysis, perform statistical evaluation:
-    
-    Calculate and analyze:
-    - Word count and readability metrics
-    - Sentence structure patterns
-    - Keyword density and frequency
-    - Sentiment score distribution
-    - Content complexity metrics
-    - Engagement potential indicators
-    
-    Provide quantitative metrics and statistical insights.""",
-    agent=data_scientist,
-    expected_output="Statistical analysis with metrics and quantitative insights",
-    context=[content_analysis_task]
+_STATISTICAL_ANALYSIS_TASK_DESCRIPTION = (
+    "Based on the content analysis, perform statistical evaluation:\n"
+    "    \n"
+    "    Calculate and analyze:\n"
+    "    - Word count and readability metrics\n"
+    "    - Sentence structure patterns\n"
+    "    - Keyword density and frequency\n"
+    "    - Sentiment score distribution\n"
+    "    - Content complexity metrics\n"
+    "    - Engagement potential indicators\n"
+    "    \n"
+    "    Provide quantitative metrics and statistical insights."
+)
+
+_REPORT_GENERATION_TASK_DESCRIPTION = (
+    "Create a comprehensive content analysis report based on previous findings.\n"
+    "    \n"
+    "    The report should include:\n"
+    "    - Executive summary of key findings\n"
+    "    - Detailed analysis results\n"
+    "    - Statistical metrics and trends\n"
+    "    - Content strengths and weaknesses\n"
+    "    - Actionable recommendations for improvement\n"
+    "    - Conclusion with strategic insights\n"
+    "    \n"
+    "    Save the report as '{content_file}_analysis_report.md'"
 )
 
-report_generation_task = Task(
-    description="""Create a comprehensive content analysis report based on previous findings.
+
+# Crew is built on first use so importing this module stays cheap
+_CREW: Optional[Crew] = None
+_CREW_LOCK = threading.Lock()
+
+
+def _build_crew() -> Crew:
+    """Build the content analysis crew once and reuse it on later runs."""
+    global _CREW
     
-    The report should include:
-    - Executive summary of key findings
-    - Detailed analysis results
-    - Statistical metrics and trends
-    - Content strengths and weaknesses
-    - Actionable recommendations for improvement
-    - Conclusion with strategic insights
+    if _CREW is not None:
+        return _CREW
     
-    Save the report as '{content_file}_analysis_report.md'""",
-    agent=report_generator,
-    expected_output="Professional analysis report saved to markdown file",
-    context=[content_analysis_task, statistical_analysis_task]
-)
+    with _CREW_LOCK:
+        # Another thread may have built it while this one waited
+        if _CREW is not None:
+            return _CREW
+        
+        # Initialize tools
+        file_reader = FileReaderTool()
+        file_writer = FileWriterTool()
+
+        # Define agents
+        content_analyzer = Agent(
+            role='Content Analyst',
+            goal='Analyze text content for themes, sentiment, and key insights',
+            backstory=_CONTENT_ANALYZER_BACKSTORY,
+            tools=[file_reader],
+            verbose=True,
+            allow_delegation=False
+        )
+
+        data_scientist = Agent(
+            role='Data Scientist',
+            goal='Perform statistical analysis and extract quantitative insights',
+            backstory=_DATA_SCIENTIST_BACKSTORY,
+            tools=[],
+            verbose=True,
+            allow_delegation=False
+        )
+
+        report_generator = Agent(
+            role='Report Writer',
+            goal='Create comprehensive analysis reports with actionable recommendations',
+            backstory=_REPORT_GENERATOR_BACKSTORY,
+            tools=[file_writer],
+            verbose=True,
+            allow_delegation=False
+        )
+
+        # Define tasks
+        content_analysis_task = Task(
+            description=_CONTENT_ANALYSIS_TASK_DESCRIPTION,
+            agent=content_analyzer,
+            expected_output="Detailed content analysis with themes, sentiment, and key insights"
+        )
+
+        statistical_analysis_task = Task(
+            description=_STATISTICAL_ANALYSIS_TASK_DESCRIPTION,
+            agent=data_scientist,
+            expected_output="Statistical analysis with metrics and quantitative insights",
+            context=[content_analysis_task]
+        )
+
+        report_generation_task = Task(
+            description=_REPORT_GENERATION_TASK_DESCRIPTION,
+            agent=report_generator,
+            expected_output="Professional analysis report saved to markdown file",
+            context=[content_analysis_task, statistical_analysis_task]
+        )
+    
+        _CREW = Crew(
+            agents=[content_analyzer, data_scientist, report_generator],
+            tasks=[content_analysis_task, statistical_analysis_task, report_generation_task],
+            process=Process.sequential,
+            verbose=True
+        )
+    return _CREW
+
 
 # Create and run the crew
 def run_analysis_crew(content_file: str):
     """Run the content analysis crew for a given file."""
     
-    crew = Crew(
-        agents=[content_analyzer, data_scientist, report_generator],
-        tasks=[content_analysis_task, statistical_analysis_task, report_generation_task],
-        process=Process.sequential,
-        verbose=True
-    )
+    crew = _build_crew()
     
     result = crew.kickoff(inputs={'content_file': content_file})
     return result
 
+
 if __name__ == "__main__":
+    setup_logging()
+    
     # Example usage
     content_file = "sample_content.txt"
     print(f"Starting content analysis crew for file: {content_file}")
@@ -6,117 +6,178 @@ A creative writing team featuring:
 - Story planner for plot development
 - Creative writer for content creation
 - Editor for refinement and polish
+
+Run from the agentic directory: python -m examples.creative_writing_crew
 """
 
-import os
+import threading
+from typing import Optional
+
 from crewai import Agent, Task, Crew, Process
 from crewai_tools import FileWriterTool
-from dotenv import load_dotenv
-
-# Load environment variables
-load_dotenv()
-
-# Initialize tools
-file_writer = FileWriterTool()
-
-# Define agents
-story_planner = Agent(
-    role='Story Planner',
-    goal='Develop compelling story structures, characters, and plot outlines',
-    backstory="""You are a master storyteller with expertise in narrative structure and character development.
-    You create detailed outlines that serve as blueprints for engaging stories.
-    Your planning ensures stories have strong arcs, memorable characters, and satisfying conclusions.""",
-    tools=[],
-    verbose=True,
-    allow_delegation=False
+
+from configs.logging_utils import setup_logging
+from src.config.env import load_env_once
+
+# Load environment variables (shared across example modules)
+load_env_once()
+
+# Agent backstories and task descriptions, kept byte-for-byte as the LLM sees them
+_STORY_PLANNER_BACKSTORY = (
+    "You are a master storyteller with expertise in narrative structure and character "
+    "development.\n"
+    "    You create detailed outlines that serve as blueprints for engaging stories.\n"
+    "    Your planning ensures stories have strong arcs, memorable characters, and satisfying "
+    "conclusions."
 )
 
-creative_writer = Agent(
-    role='Creative Writer',
-    goal='Transform story plans into engaging, well-written narratives',
-    backstory="""You are a talented creative writer with a gift for bringing stories to life.
-    You excel at dialogue, descriptive prose, and maintaining reader engagement.
-    Your writing style adapts to different genres while maintaining quality and authenticity.""",
-    tools=[file_writer],
-    verbose=True,
-    allow_delegation=False
+_CREATIVE_WRITER_BACKSTORY = (
+    "You are a talented creative writer with a gift for bringing stories to life.\n"
+    "    You excel at dialogue, descriptive prose, and maintaining reader engagement.\n"
+    "    Your writing style adapts to different genres while maintaining quality and authenticity."
 )
 
-editor = Agent(
-    role='Editor',
-    goal='Refine and polish written content for maximum impact and readability',
-    backstory="""You are an experienced editor with a keen eye for detail and flow.
-    You enhance clarity, fix inconsistencies, and ensure the narrative maintains its intended tone.
-    Your editing transforms good writing into exceptional storytelling.""",
-    tools=[file_writer],
-    verbose=True,
-    allow_delegation=False
+_EDITOR_BACKSTORY = (
+    "You are an experienced editor with a keen eye for detail and flow.\n"
+    "    You enhance clarity, fix inconsistencies, and ensure the narrative maintains its "
+    "intended tone.\n"
+    "    Your editing transforms good writing into exceptional storytelling."
 )
 
-# Define tasks
-planning_task = Task(
-    description="""Create a detailed story plan for: {story_prompt}
-    
-    Develop:
-    - Main character profiles with motivations and backgrounds
-    - Plot structure with beginning, middle, and end
-    - Key scenes and story beats
-    - Setting and world-building elements
-    - Conflict and resolution framework
-    - Themes and underlying messages
-    
-    Genre: {genre}
-    Target length: {target_length} words
-    
-    Provide a comprehensive story outline ready for writing.""",
-    agent=story_planner,
-    expected_output="Detailed story plan with characters, plot structure, and key scenes"
+_PLANNING_TASK_DESCRIPTION = (
+    "Create a detailed story plan for: {story_prompt}\n"
+    "    \n"
+    "    Develop:\n"
+    "    - Main character profiles with motivations and backgrounds\n"
+    "    - Plot structure with beginning, middle, and end\n"
+    "    - Key scenes and story beats\n"
+    "    - Setting and world-building elements\n"
+    "    - Conflict and resolution framework\n"
+    "    - Themes and underlying messages\n"
+    "    \n"
+    "    Genre: {genre}\n"
+    "    Target length: {target_length} words\n"
+    "    \n"
+    "    Provide a comprehensive story outline ready for writing."
 )
 
-writing_task = Task(
-    description="""Using the story plan, write the complete story.
-    
-    Requirements:
-    - Follow the planned structure and character development
-    - Write approximately {target_length} words
-    - Maintain consistent tone and style for {genre} genre
-    - Include engaging dialogue and vivid descriptions
-    - Ensure proper pacing and narrative flow
-    - Create compelling opening and satisfying conclusion
-    
-    Save the story as '{story_title}.md'""",
-    agent=creative_writer,
-    expected_output="Complete story written and saved to file",
-    context=[planning_task]
+_WRITING_TASK_DESCRIPTION = (
+    "Using the story plan, write the complete story.\n"
+    "    \n"
+    "    Requirements:\n"
+    "    - Follow the planned structure and character development\n"
+    "    - Write approximately {target_length} words\n"
+    "    - Maintain consistent tone and style for {genre} genre\n"
+    "    - Include engaging dialogue and vivid descriptions\n"
+    "    - Ensure proper pacing and narrative flow\n"
+    "    - Create compelling opening and satisfying conclusion\n"
+    "    \n"
+    "    Save the story as '{story_title}.md'"
 )
 
-editing_task = Task(
-    description="""Edit and refine the written story for publication quality.
+_EDITING_TASK_DESCRIPTION = (
+    "Edit and refine the written story for publication quality.\n"
+    "    \n"
+    "    Focus on:\n"
+    "    - Grammar, punctuation, and spelling corrections\n"
+    "    - Sentence structure and flow improvements\n"
+    "    - Character consistency and development\n"
+    "    - Plot coherence and pacing\n"
+    "    - Dialogue naturalness and effectiveness\n"
+    "    - Overall readability and engagement\n"
+    "    \n"
+    "    Save the edited version as '{story_title}_final.md'"
+)
+
+
+# Crew is built on first use so importing this module stays cheap
+_CREW: Optional[Crew] = None
+_CREW_LOCK = threading.Lock()
+
+
+def _build_crew() -> Crew:
+    """Build the creative writing crew once and reuse it on later runs."""
+    global _CREW
     
-    Focus on:
-    - Grammar, punctuation, and spelling corrections
-    - Sentence structure and flow improvements
-    - Character consistency and development
-    - Plot coherence and pacing
-    - Dialogue naturalness and effectiveness
-    - Overall readability and engagement
+    if _CREW is not None:
+        return _CREW
     
-    Save the edited version as '{story_title}_final.md'""",
-    agent=editor,
-    expected_output="Polished, publication-ready story saved to file",
-    context=[writing_task]
-)
+    with _CREW_LOCK:
+        # Another thread may have built it while this one waited
+        if _CREW is not None:
+            return _CREW
+        
+        # Initialize tools
+        file_writer = FileWriterTool()
+
+        # Define agents
+        story_planner = Agent(
+            role='Story Planner',
+            goal='Develop compelling story structures, characters, and plot outlines',
+            backstory=_STORY_PLANNER_BACKSTORY,
+            tools=[],
+            verbose=True,
+            allow_delegation=False
+        )
+
+        creative_writer = Agent(
+            role='Creative Writer',
+            goal='Transform story plans into engaging, well-written narratives',
+            backstory=_CREATIVE_WRITER_BACKSTORY,
+            tools=[file_writer],
+            verbose=True,
+            allow_delegation=False
+        )
+
+        editor = Agent(
+            role='Editor',
+            goal='Refine and polish written content for maximum impact and readability',
+            backstory=_EDITOR_BACKSTORY,
+            tools=[file_writer],
+            verbose=True,
+            allow_delegation=False
+        )
+
+        # Define tasks
+        planning_task = Task(
+            description=_PLANNING_TASK_DESCRIPTION,
+            agent=story_planner,
+            expected_output="Detailed story plan with characters, plot structure, and key scenes"
+        )
+
+        writing_task = Task(
+            description=_WRITING_TASK_DESCRIPTION,
+            agent=creative_writer,
+            expected_output="Complete story written and saved to file",
+            context=[planning_task]
+        )
+
+        editing_task = Task(
+            description=_EDITING_TASK_DESCRIPTION,
+            agent=editor,
+            expected_output="Polished, publication-ready story saved to file",
+            context=[writing_task]
+        )
+    
+        _CREW = Crew(
+            agents=[story_planner, creative_writer, editor],
+            tasks=[planning_task, writing_task, editing_task],
+            process=Process.sequential,
+            verbose=True
+        )
+    return _CREW
+
 
 # Create and run the crew
-def run_writing_crew(story_prompt: str, genre: str = "fiction", target_length: int = 1500, story_title: str = "generated_story"):
+def run_writing_crew(
+    story_prompt: str,
+    genre: str = "fiction",
+    target_length: int = 1500,
+    story_title: str = "generated_story"
+):
     """Run the creative writing crew."""
     
-    crew = Crew(
-        agents=[story_planner, creative_writer, editor],
-        tasks=[planning_task, writing_task, editing_task],
-        process=Process.sequential,
-        verbose=True
-    )
+    crew = _build_crew()
     
     inputs = {
         'story_prompt': story_prompt,
@@ -128,9 +189,15 @@ def run_writing_crew(story_prompt: str, genre: str = "fiction", target_length: i
     result = crew.kickoff(inputs=inputs)
     return result
 
+
 if __name__ == "__main__":
+    setup_logging()
+    
     # Example usage
-    story_prompt = "A time traveler discovers they can only travel to moments of great historical significance, but each trip erases one of their own memories."
+    story_prompt = (
+        "A time traveler discovers they can only travel to moments of great historical "
+        "significance, but each trip erases one of their own memories."
+    )
     genre = "science fiction"
     target_length = 2000
     story_title = "memory_traveler"
@@ -6,89 +6,139 @@ A basic CrewAI implementation demonstrating:
 - Research agent for gathering information
 - Writer agent for creating content
 - Sequential task execution
+
+Run from the agentic directory: python -m examples.simple_research_crew
 """
 
-import os
+import threading
+from typing import Optional
+
 from crewai import Agent, Task, Crew, Process
 from crewai_tools import SerperDevTool, FileWriterTool
-from dotenv import load_dotenv
-
-# Load environment variables
-load_dotenv()
-
-# Initialize tools
-search_tool = SerperDevTool()
-file_writer = FileWriterTool()
-
-# Define agents
-researcher = Agent(
-    role='Research Specialist',
-    goal='Conduct thorough research on given topics and gather accurate information',
-    backstory="""You are an experienced researcher with a keen eye for detail.
-    You excel at finding reliable sources and extracting key insights from complex information.
-    Your research forms the foundation for high-quality content creation.""",
-    tools=[search_tool],
-    verbose=True,
-    allow_delegation=False
+
+from configs.logging_utils import setup_logging
+from src.config.env import load_env_once
+
+# Load environment variables (shared across example modules)
+load_env_once()
+
+# Agent backstories and task descriptions, kept byte-for-byte as the LLM sees them
+_RESEARCHER_BACKSTORY = (
+    "You are an experienced researcher with a keen eye for detail.\n"
+    "    You excel at finding reliable sources and extracting key insights from complex "
+    "information.\n"
+    "    Your research forms the foundation for high-quality content creation."
 )
 
-writer = Agent(
-    role='Content Writer',
-    goal='Create engaging and informative content based on research findings',
-    backstory="""You are a skilled writer who transforms research into compelling narratives.
-    You have a talent for making complex topics accessible and engaging for various audiences.
-    Your writing is clear, well-structured, and factually accurate.""",
-    tools=[file_writer],
-    verbose=True,
-    allow_delegation=False
+_WRITER_BACKSTORY = (
+    "You are a skilled writer who transforms research into compelling narratives.\n"
+    "    You have a talent for making complex topics accessible and engaging for various "
+    "audiences.\n"
+    "    Your writing is clear, well-structured, and factually accurate."
 )
 
-# Define tasks
-research_task = Task(
-    description="""Research the topic: {topic}
-    
-    Focus on:
-    - Key concepts and definitions
-    - Recent developments and trends
-    - Important statistics or data points
-    - Expert opinions and perspectives
-    
-    Provide a comprehensive research summary with sources.""",
-    agent=researcher,
-    expected_output="A detailed research summary with key findings and source references"
+_RESEARCH_TASK_DESCRIPTION = (
+    "Research the topic: {topic}\n"
+    "    \n"
+    "    Focus on:\n"
+    "    - Key concepts and definitions\n"
+    "    - Recent developments and trends\n"
+    "    - Important statistics or data points\n"
+    "    - Expert opinions and perspectives\n"
+    "    \n"
+    "    Provide a comprehensive research summary with sources."
+)
+
+_WRITING_TASK_DESCRIPTION = (
+    "Using the research findings, write a comprehensive article about {topic}.\n"
+    "    \n"
+    "    The article should:\n"
+    "    - Be 800-1200 words long\n"
+    "    - Include an engaging introduction\n"
+    "    - Cover all key points from the research\n"
+    "    - Have a clear structure with headings\n"
+    "    - End with a meaningful conclusion\n"
+    "    \n"
+    "    Save the article to a file named '{topic}_article.md'"
 )
 
-writing_task = Task(
-    description="""Using the research findings, write a comprehensive article about {topic}.
+
+# Crew is built on first use so importing this module stays cheap
+_CREW: Optional[Crew] = None
+_CREW_LOCK = threading.Lock()
+
+
+def _build_crew() -> Crew:
+    """Build the research crew once and reuse it on later runs."""
+    global _CREW
     
-    The article should:
-    - Be 800-1200 words long
-    - Include an engaging introduction
-    - Cover all key points from the research
-    - Have a clear structure with headings
-    - End with a meaningful conclusion
+    if _CREW is not None:
+        return _CREW
     
-    Save the article to a file named '{topic}_article.md'""",
-    agent=writer,
-    expected_output="A well-written article saved to a markdown file",
-    context=[research_task]
-)
+    with _CREW_LOCK:
+        # Another thread may have built it while this one waited
+        if _CREW is not None:
+            return _CREW
+        
+        # Initialize tools
+        search_tool = SerperDevTool()
+        file_writer = FileWriterTool()
+
+        # Define agents
+        researcher = Agent(
+            role='Research Specialist',
+            goal='Conduct thorough research on given topics and gather accurate information',
+            backstory=_RESEARCHER_BACKSTORY,
+            tools=[search_tool],
+            verbose=True,
+            allow_delegation=False
+        )
+
+        writer = Agent(
+            role='Content Writer',
+            goal='Create engaging and informative content based on research findings',
+            backstory=_WRITER_BACKSTORY,
+            tools=[file_writer],
+            verbose=True,
+            allow_delegation=False
+        )
+
+        # Define tasks
+        research_task = Task(
+            description=_RESEARCH_TASK_DESCRIPTION,
+            agent=researcher,
+            expected_output="A detailed research summary with key findings and source references"
+        )
+
+        writing_task = Task(
+            description=_WRITING_TASK_DESCRIPTION,
+            agent=writer,
+            expected_output="A well-written article saved to a markdown file",
+            context=[research_task]
+        )
+    
+        _CREW = Crew(
+            agents=[researcher, writer],
+            tasks=[research_task, writing_task],
+            process=Process.sequential,
+            verbose=True
+        )
+    return _CREW
+
 
 # Create and run the crew
 def run_research_crew(topic: str):
     """Run the research crew for a given topic."""
     
-    crew = Crew(
-        agents=[researcher, writer],
-        tasks=[research_task, writing_task],
-        process=Process.sequential,
-        verbose=True
-    )
+    crew = _build_crew()
     
     result = crew.kickoff(inputs={'topic': topic})
     return result
 
+
 if __name__ == "__main__":
+    setup_logging()
+    
     # Example usage
     topic = "Artificial Intelligence in Healthcare"
     print(f"Starting research crew for topic: {topic}")
@@ -7,16 +7,52 @@ crew configurations and managing agent workflows.
 """
 
 import argparse
-import asyncio
 import sys
+import threading
 import time
-from pathlib import Path
-from typing import Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional
+from uuid import uuid4
 
-from src.config.settings import Settings
-from src.utils.logging_utils import setup_logging, get_logger, log_crew_execution
-from src.utils.crew_factory import CrewFactory
-from src.utils.performance_monitor import PerformanceMonitor
+try:
+    import orjson
+    _HAS_ORJSON = True
+except ImportError:  # optional: pip install ai-portfolio[performance]
+    _HAS_ORJSON = False
+
+from src.config.settings import Settings, get_settings
+from src.utils.logging_utils import CrewStatus, setup_logging, get_logger, log_crew_execution
+from src.utils.rate_limiter import TokenBucket
+
+
+# Crew configurations offered by the CLI, in display order. Read-only, so it
+# can be handed out as-is and shared across batch worker threads.
+_AVAILABLE_CREWS: Mapping[str, str] = MappingProxyType({
+    "research": "Research crew for information gathering and analysis",
+    "content_analysis": "Content analysis crew for text evaluation",
+    "creative_writing": "Creative writing crew for story generation",
+    "data_analysis": "Data analysis crew for statistical insights",
+    "social_media": "Social media crew for content creation and management"
+})
+_CREWS = tuple(_AVAILABLE_CREWS)
+
+
+def _loads(data: bytes) -> Any:
+    """Parse JSON from bytes, with orjson when it is installed."""
+    if _HAS_ORJSON:
+        return orjson.loads(data)
+    
+    import json
+    return json.loads(data)
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize to indented JSON bytes, stringifying unsupported values."""
+    # Always the stdlib: orjson would write NaN as null and encode numpy
+    # scalars, enums and non-ASCII text differently from default=str
+    import json
+    return json.dumps(obj, indent=2, default=str).encode("utf-8")
 
 
 class CrewOrchestrator:
@@ -29,30 +65,33 @@ class CrewOrchestrator:
         Args:
             settings: Application settings
         """
-        self.settings = settings or Settings()
+        # Deferred so that lightweight commands (--help, --list-crews) don't
+        # pay for importing crewai and psutil
+        from src.utils.crew_factory import CrewFactory
+        from src.utils.performance_monitor import PerformanceMonitor
+        
+        self._start_time = time.monotonic()
+        self.settings = settings or get_settings()
         self.logger = get_logger("orchestrator")
         self.crew_factory = CrewFactory(self.settings)
         self.performance_monitor = PerformanceMonitor()
+        # Batch crews run on worker threads and share the monitor
+        self._monitor_lock = threading.Lock()
         
         # Setup logging
         setup_logging()
         
         self.logger.info("CrewAI Orchestrator initialized")
     
-    def list_available_crews(self) -> Dict[str, str]:
+    @staticmethod
+    def list_available_crews() -> Mapping[str, str]:
         """
         Get list of available crew configurations.
         
         Returns:
-            Dictionary mapping crew names to descriptions
+            Read-only mapping of crew names to descriptions
         """
-        return {
-            "research": "Research crew for information gathering and analysis",
-            "content_analysis": "Content analysis crew for text evaluation",
-            "creative_writing": "Creative writing crew for story generation",
-            "data_analysis": "Data analysis crew for statistical insights",
-            "social_media": "Social media crew for content creation and management"
-        }
+        return _AVAILABLE_CREWS
     
     def run_crew(
         self,
@@ -69,26 +108,34 @@ class CrewOrchestrator:
             config_override: Optional configuration overrides
             
         Returns:
-            Results from crew execution
+            Results from crew execution, including the ``session_id`` its
+            performance metrics are recorded under
         """
         self.logger.info(f"Starting crew execution: {crew_name}")
-        log_crew_execution(crew_name, "started")
+        log_crew_execution(crew_name, CrewStatus.STARTED)
         
-        start_time = time.time()
+        # Monotonic clock: interval timing unaffected by wall-clock adjustments
+        start_time = time.monotonic()
+        # Batch runs may repeat a crew name, so each run gets its own session
+        session_id = f"{crew_name}:{uuid4()}"
+        monitoring = False
         
         try:
             # Create crew
             crew = self.crew_factory.create_crew(crew_name, config_override)
             
             # Start performance monitoring
-            self.performance_monitor.start_monitoring(crew_name)
+            with self._monitor_lock:
+                self.performance_monitor.start_monitoring(session_id)
+            monitoring = True
             
             # Execute crew
-            self.logger.info(f"Executing crew {crew_name} with inputs: {list(inputs.keys())}")
+            # Lazy %-formatting: the keys view is only rendered if the record is emitted
+            self.logger.info("Executing crew %s with inputs: %s", crew_name, inputs.keys())
             result = crew.kickoff(inputs=inputs)
             
             # Calculate execution time
-            execution_time = time.time() - start_time
+            execution_time = time.monotonic() - start_time
             
             # Log success
             metrics = {
@@ -97,37 +144,49 @@ class CrewOrchestrator:
                 "agents_used": len(crew.agents)
             }
             
-            log_crew_execution(crew_name, "completed", metrics)
+            log_crew_execution(crew_name, CrewStatus.COMPLETED, metrics)
+            # The run completed normally, so the crew can serve the next request
+            self.crew_factory.release_crew(crew_name, crew, config_override)
             self.logger.info(f"Crew {crew_name} completed successfully in {execution_time:.2f}s")
             
             # Stop monitoring and get metrics
-            performance_metrics = self.performance_monitor.stop_monitoring(crew_name)
+            with self._monitor_lock:
+                performance_metrics = self.performance_monitor.stop_monitoring(session_id)
+            monitoring = False
             
             return {
                 "result": result,
                 "execution_time": execution_time,
                 "metrics": metrics,
                 "performance": performance_metrics,
+                "session_id": session_id,
                 "status": "success"
             }
             
         except Exception as e:
-            execution_time = time.time() - start_time
+            execution_time = time.monotonic() - start_time
             error_details = {
                 "error": str(e),
                 "execution_time": execution_time,
                 "error_type": type(e).__name__
             }
             
-            log_crew_execution(crew_name, "failed", error_details)
+            log_crew_execution(crew_name, CrewStatus.FAILED, error_details)
             self.logger.error(f"Crew {crew_name} failed: {e}", exc_info=True)
             
             return {
                 "result": None,
                 "execution_time": execution_time,
                 "error": str(e),
+                "session_id": session_id,
                 "status": "failed"
             }
+        
+        finally:
+            # A failed run must not leave its session (and the sampler) running
+            if monitoring:
+                with self._monitor_lock:
+                    self.performance_monitor.stop_monitoring(session_id)
     
     async def run_crew_async(
         self,
@@ -146,44 +205,57 @@ class CrewOrchestrator:
         Returns:
             Results from crew execution
         """
-        # Run in thread pool to avoid blocking
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            None, 
-            self.run_crew, 
-            crew_name, 
-            inputs, 
-            config_override
-        )
+        import asyncio
+        
+        # Run in the default thread pool to avoid blocking the event loop
+        return await asyncio.to_thread(self.run_crew, crew_name, inputs, config_override)
     
     def run_batch_crews(
         self,
         crew_configs: list[Dict[str, Any]]
     ) -> Dict[str, Dict[str, Any]]:
         """
-        Run multiple crews in sequence.
+        Run multiple crews concurrently.
+        
+        Crew execution is dominated by LLM API calls, so crews run on a
+        thread pool of up to ``settings.max_workers`` threads.
         
         Args:
             crew_configs: List of crew configurations
             
         Returns:
-            Dictionary mapping crew names to results
+            Dictionary mapping crew names to results, in configuration order
         """
-        results = {}
+        if not crew_configs:
+            return {}
         
-        for config in crew_configs:
-            crew_name = config["name"]
-            inputs = config["inputs"]
-            config_override = config.get("config_override")
-            
-            self.logger.info(f"Running batch crew: {crew_name}")
-            result = self.run_crew(crew_name, inputs, config_override)
-            results[crew_name] = result
-            
-            # Short delay between crews
-            time.sleep(1)
+        # Honor the per-minute API quota without a fixed delay between crews;
+        # up to max_workers crews may start back to back. A limit of zero or
+        # less disables rate limiting.
+        rate_limiter = None
+        if self.settings.api_rate_limit > 0:
+            rate_limiter = TokenBucket(
+                rate_per_sec=self.settings.api_rate_limit / 60,
+                capacity=max(self.settings.max_workers, 1)
+            )
         
-        return results
+        max_workers = min(self.settings.max_workers, len(crew_configs))
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="crew") as executor:
+            futures = []
+            for config in crew_configs:
+                crew_name = config["name"]
+                if rate_limiter is not None:
+                    rate_limiter.acquire()
+                self.logger.info(f"Running batch crew: {crew_name}")
+                futures.append((crew_name, executor.submit(
+                    self.run_crew,
+                    crew_name,
+                    config["inputs"],
+                    config.get("config_override")
+                )))
+            
+            # run_crew() reports its own failures, so result() doesn't raise
+            return {crew_name: future.result() for crew_name, future in futures}
     
     def get_system_status(self) -> Dict[str, Any]:
         """
@@ -195,9 +267,9 @@ class CrewOrchestrator:
         return {
             "orchestrator_status": "running",
             "settings": self.settings.model_dump(),
-            "available_crews": list(self.list_available_crews().keys()),
+            "available_crews": list(_CREWS),
             "performance_metrics": self.performance_monitor.get_global_metrics(),
-            "uptime": time.time() - getattr(self, '_start_time', time.time())
+            "uptime": time.monotonic() - self._start_time
         }
 
 
@@ -219,22 +291,19 @@ def main():
     
     args = parser.parse_args()
     
-    # Initialize orchestrator
-    settings = Settings()
-    if args.config:
-        settings = Settings.from_file(args.config)
-    
-    orchestrator = CrewOrchestrator(settings)
-    orchestrator._start_time = time.time()
-    
-    # List crews if requested
+    # List crews if requested; needs no orchestrator, so skip building one
     if args.list_crews:
-        crews = orchestrator.list_available_crews()
+        crews = CrewOrchestrator.list_available_crews()
         print("Available crews:")
         for name, description in crews.items():
             print(f"  {name}: {description}")
         return
     
+    # Initialize orchestrator
+    settings = Settings.from_file(args.config) if args.config else get_settings()
+    
+    orchestrator = CrewOrchestrator(settings)
+    
     # Run specific crew
     if args.crew:
         # Prepare inputs based on crew type and arguments
@@ -254,17 +323,18 @@ def main():
         
         # Load inputs from file if specified
         if args.input_file:
-            import json
-            with open(args.input_file, 'r') as f:
-                file_inputs = json.load(f)
+            with open(args.input_file, 'rb') as f:
+                file_inputs = _loads(f.read())
                 inputs.update(file_inputs)
         
         if not inputs:
             print(f"No inputs provided for crew '{args.crew}'. Use --help for options.")
             sys.exit(1)
         
-        # Run crew
-        if args.async:
+        # Run crew ('async' is a keyword, so it can't be read as an attribute)
+        if getattr(args, "async"):
+            import asyncio
+            
             async def run_async():
                 return await orchestrator.run_crew_async(args.crew, inputs)
             
@@ -274,9 +344,9 @@ def main():
         
         # Output results
         if args.output_file:
-            import json
-            with open(args.output_file, 'w') as f:
-                json.dump(result, f, indent=2, default=str)
+            # Binary mode: both serializers already produce UTF-8 bytes
+            with open(args.output_file, 'wb') as f:
+                f.write(_dumps(result))
             print(f"Results saved to {args.output_file}")
         else:
             print("Execution completed:")
@@ -2,30 +2,108 @@
 Base Agent class for CrewAI agents with common functionality.
 """
 
+import functools
 import logging
+import sys
+from dataclasses import dataclass, fields
 from typing import Any, Dict, List, Optional, Union
 from abc import ABC, abstractmethod
 from crewai import Agent
 from crewai.tools import BaseTool
-from pydantic import BaseModel, Field
 
-from ..config.settings import Settings
+from ..config.settings import Settings, get_settings
 from ..utils.logging_utils import get_logger, log_agent_action
 
 
-class AgentConfig(BaseModel):
-    """Configuration model for agents."""
+@functools.lru_cache(maxsize=None)
+def _logger_for(cls_name: str) -> logging.Logger:
+    """Return the shared logger for an agent class."""
+    return get_logger(f"agents.{cls_name}")
+
+
+# dataclass(slots=True) is only available on Python 3.10+
+_DATACLASS_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# String spellings accepted for bool fields, as pydantic accepted them
+_TRUE_STRINGS = frozenset({"1", "true", "t", "yes", "y", "on"})
+_FALSE_STRINGS = frozenset({"0", "false", "f", "no", "n", "off"})
+
+
+def _to_bool(name: str, value: Any) -> bool:
+    """Coerce a bool field value, rejecting anything ambiguous."""
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, int) and value in (0, 1):
+        return bool(value)
+    if isinstance(value, str):
+        text = value.strip().lower()
+        if text in _TRUE_STRINGS:
+            return True
+        if text in _FALSE_STRINGS:
+            return False
+    raise ValueError(f"Agent {name} must be a boolean, got {value!r}")
+
+
+def _to_int(name: str, value: Any) -> int:
+    """Coerce an int field value from an int or an integer string."""
+    if isinstance(value, bool) or (isinstance(value, float) and not value.is_integer()):
+        raise ValueError(f"Agent {name} must be an integer, got {value!r}")
+    try:
+        return int(value)
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"Agent {name} must be an integer, got {value!r}") from e
+
+
+@dataclass(**_DATACLASS_SLOTS)
+class AgentConfig:
+    """
+    Configuration for agents.
+    
+    Attributes:
+        role: The role of the agent
+        goal: The goal of the agent
+        backstory: The backstory of the agent
+        verbose: Whether to enable verbose logging
+        allow_delegation: Whether to allow delegation
+        max_iter: Maximum iterations for agent execution
+        memory: Whether to enable memory
+        max_execution_time: Maximum execution time in seconds
+        system_template: Custom system template
+        prompt_template: Custom prompt template
+    """
     
-    role: str = Field(..., description="The role of the agent")
-    goal: str = Field(..., description="The goal of the agent")
-    backstory: str = Field(..., description="The backstory of the agent")
-    verbose: bool = Field(default=True, description="Whether to enable verbose logging")
-    allow_delegation: bool = Field(default=False, description="Whether to allow delegation")
-    max_iter: int = Field(default=5, description="Maximum iterations for agent execution")
-    memory: bool = Field(default=True, description="Whether to enable memory")
-    max_execution_time: Optional[int] = Field(default=None, description="Maximum execution time in seconds")
-    system_template: Optional[str] = Field(default=None, description="Custom system template")
-    prompt_template: Optional[str] = Field(default=None, description="Custom prompt template")
+    role: str
+    goal: str
+    backstory: str
+    verbose: bool = True
+    allow_delegation: bool = False
+    max_iter: int = 5
+    memory: bool = True
+    max_execution_time: Optional[int] = None
+    system_template: Optional[str] = None
+    prompt_template: Optional[str] = None
+    
+    def __post_init__(self) -> None:
+        """Coerce the bool and int fields and reject empty text fields."""
+        self.verbose = _to_bool("verbose", self.verbose)
+        self.allow_delegation = _to_bool("allow_delegation", self.allow_delegation)
+        self.memory = _to_bool("memory", self.memory)
+        self.max_iter = _to_int("max_iter", self.max_iter)
+        if self.max_execution_time is not None:
+            self.max_execution_time = _to_int("max_execution_time", self.max_execution_time)
+        
+        if not self.role.strip():
+            raise ValueError("Agent role cannot be empty")
+        
+        if not self.goal.strip():
+            raise ValueError("Agent goal cannot be empty")
+        
+        if not self.backstory.strip():
+            raise ValueError("Agent backstory cannot be empty")
+
+
+# Keys a config dict may set; others are ignored, as the pydantic model did
+_AGENT_CONFIG_FIELDS = frozenset(f.name for f in fields(AgentConfig))
 
 
 class BaseAgent(ABC):
@@ -38,8 +116,24 @@ class BaseAgent(ABC):
     - Error handling
     - Performance monitoring
     - Tool management
+    
+    Instances use __slots__ rather than a per-instance __dict__. Subclasses
+    must declare their own __slots__ (an empty tuple if they add no
+    attributes), otherwise Python silently gives them a __dict__ again.
     """
     
+    __slots__ = (
+        "config",
+        "_tools",
+        "_tools_list",
+        "settings",
+        "_name",
+        "logger",
+        "_agent",
+        "execution_count",
+        "total_execution_time",
+    )
+    
     def __init__(
         self,
         config: Union[AgentConfig, Dict[str, Any]],
@@ -56,12 +150,20 @@ class BaseAgent(ABC):
         """
         # Convert dict to AgentConfig if needed
         if isinstance(config, dict):
-            config = AgentConfig(**config)
+            config = AgentConfig(**{
+                key: value for key, value in config.items() if key in _AGENT_CONFIG_FIELDS
+            })
         
         self.config = config
-        self.tools = tools or []
-        self.settings = settings or Settings()
-        self.logger = get_logger(f"agents.{self.__class__.__name__}")
+        # Tools are looked up by class name, so they are stored keyed by it;
+        # a later tool of the same class replaces an earlier one
+        self._tools: Dict[str, BaseTool] = {
+            tool.__class__.__name__: tool for tool in tools or ()
+        }
+        self._tools_list: Optional[List[BaseTool]] = None
+        self.settings = settings or get_settings()
+        self._name = type(self).__name__
+        self.logger = _logger_for(self._name)
         
         # Initialize CrewAI agent
         self._agent = self._create_crewai_agent()
@@ -70,30 +172,41 @@ class BaseAgent(ABC):
         self.execution_count = 0
         self.total_execution_time = 0.0
         
-        self.logger.info(f"Initialized {self.__class__.__name__} agent with role: {config.role}")
+        self.logger.info("Initialized %s agent with role: %s", self._name, config.role)
     
     def _create_crewai_agent(self) -> Agent:
         """Create the underlying CrewAI agent."""
-        agent_kwargs = {
-            "role": self.config.role,
-            "goal": self.config.goal,
-            "backstory": self.config.backstory,
-            "tools": self.tools,
-            "verbose": self.config.verbose,
-            "allow_delegation": self.config.allow_delegation,
-            "max_iter": self.config.max_iter,
-            "memory": self.config.memory,
-        }
+        c = self.config
+        # Optional parameters are only passed through when set
+        optional = (
+            ("max_execution_time", c.max_execution_time),
+            ("system_template", c.system_template),
+            ("prompt_template", c.prompt_template),
+        )
         
-        # Add optional parameters if they exist
-        if self.config.max_execution_time:
-            agent_kwargs["max_execution_time"] = self.config.max_execution_time
-        if self.config.system_template:
-            agent_kwargs["system_template"] = self.config.system_template
-        if self.config.prompt_template:
-            agent_kwargs["prompt_template"] = self.config.prompt_template
+        return Agent(
+            role=c.role,
+            goal=c.goal,
+            backstory=c.backstory,
+            tools=self.tools,
+            verbose=c.verbose,
+            allow_delegation=c.allow_delegation,
+            max_iter=c.max_iter,
+            memory=c.memory,
+            **{key: value for key, value in optional if value}
+        )
+    
+    @property
+    def tools(self) -> List[BaseTool]:
+        """
+        Get the agent's tools as a list.
         
-        return Agent(**agent_kwargs)
+        The list is cached until the next add_tool()/remove_tool() call and
+        should be treated as read-only.
+        """
+        if self._tools_list is None:
+            self._tools_list = list(self._tools.values())
+        return self._tools_list
     
     @property
     def agent(self) -> Agent:
@@ -103,41 +216,56 @@ class BaseAgent(ABC):
     @property
     def name(self) -> str:
         """Get the agent name (class name)."""
-        return self.__class__.__name__
+        return self._name
     
     @property
     def role(self) -> str:
         """Get the agent role."""
         return self.config.role
     
-    def add_tool(self, tool: BaseTool) -> None:
+    def add_tool(self, tool: BaseTool, sync: bool = True) -> None:
         """
-        Add a tool to the agent.
+        Add a tool to the agent, replacing any existing tool of the same class.
         
         Args:
             tool: Tool to add
+            sync: Whether to push the tool list to the CrewAI agent immediately.
+                Pass False when adding several tools and call sync_tools() once.
         """
-        self.tools.append(tool)
-        self._agent.tools = self.tools
-        self.logger.info(f"Added tool {tool.__class__.__name__} to agent {self.name}")
+        self._tools[tool.__class__.__name__] = tool
+        self._tools_list = None
+        if sync:
+            self.sync_tools()
+        self.logger.info("Added tool %s to agent %s", tool.__class__.__name__, self._name)
     
-    def remove_tool(self, tool_name: str) -> bool:
+    def remove_tool(self, tool_name: str, sync: bool = True) -> bool:
         """
         Remove a tool from the agent by name.
         
         Args:
             tool_name: Name of the tool to remove
+            sync: Whether to push the tool list to the CrewAI agent immediately
             
         Returns:
             True if tool was removed, False if not found
         """
-        for i, tool in enumerate(self.tools):
-            if tool.__class__.__name__ == tool_name:
-                removed_tool = self.tools.pop(i)
-                self._agent.tools = self.tools
-                self.logger.info(f"Removed tool {removed_tool.__class__.__name__} from agent {self.name}")
-                return True
-        return False
+        if self._tools.pop(tool_name, None) is None:
+            return False
+        
+        self._tools_list = None
+        if sync:
+            self.sync_tools()
+        self.logger.info("Removed tool %s from agent %s", tool_name, self._name)
+        return True
+    
+    def sync_tools(self) -> None:
+        """
+        Push the current tool list to the underlying CrewAI agent.
+        
+        CrewAI validates (and copies) the tools list on assignment, so tool
+        changes are not visible to the agent until this is called.
+        """
+        self._agent.tools = self.tools
     
     def get_tool(self, tool_name: str) -> Optional[BaseTool]:
         """
@@ -149,10 +277,7 @@ class BaseAgent(ABC):
         Returns:
             Tool instance if found, None otherwise
         """
-        for tool in self.tools:
-            if tool.__class__.__name__ == tool_name:
-                return tool
-        return None
+        return self._tools.get(tool_name)
     
     def log_action(self, action: str, details: Optional[Dict[str, Any]] = None) -> None:
         """
@@ -162,7 +287,7 @@ class BaseAgent(ABC):
             action: Action being performed
             details: Additional details about the action
         """
-        log_agent_action(self.name, action, details)
+        log_agent_action(self._name, action, details)
     
     def get_performance_metrics(self) -> Dict[str, Any]:
         """
@@ -180,7 +305,7 @@ class BaseAgent(ABC):
             "execution_count": self.execution_count,
             "total_execution_time": self.total_execution_time,
             "average_execution_time": avg_execution_time,
-            "tools_count": len(self.tools),
+            "tools_count": len(self._tools),
             "agent_name": self.name,
             "agent_role": self.role
         }
@@ -205,15 +330,7 @@ class BaseAgent(ABC):
         Raises:
             ValueError: If configuration is invalid
         """
-        if not self.config.role.strip():
-            raise ValueError("Agent role cannot be empty")
-        
-        if not self.config.goal.strip():
-            raise ValueError("Agent goal cannot be empty")
-        
-        if not self.config.backstory.strip():
-            raise ValueError("Agent backstory cannot be empty")
-        
+        # role/goal/backstory are already checked in AgentConfig.__post_init__
         if self.config.max_iter <= 0:
             raise ValueError("max_iter must be greater than 0")
         
@@ -223,19 +340,15 @@ class BaseAgent(ABC):
         """Reset performance tracking metrics."""
         self.execution_count = 0
         self.total_execution_time = 0.0
-        self.logger.info(f"Reset performance metrics for agent {self.name}")
+        self.logger.info("Reset performance metrics for agent %s", self._name)
     
     def __str__(self) -> str:
         """String representation of the agent."""
-        return f"{self.__class__.__name__}(role='{self.config.role}', tools={len(self.tools)})"
+        return f"{self._name}(role='{self.config.role}', tools={len(self._tools)})"
     
     def __repr__(self) -> str:
         """Detailed string representation of the agent."""
         return (
-            f"{self.__class__.__name__}("
-            f"role='{self.config.role}', "
-            f"goal='{self.config.goal[:50]}...', "
-            f"tools={len(self.tools)}, "
-            f"executions={self.execution_count}"
-            f")"
+            f"{self._name}(role={self.config.role!r}, "
+            f"tools={len(self._tools)}, executions={self.execution_count})"
         )
\ No newline at end of file
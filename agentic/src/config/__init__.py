@@ -1,6 +1,15 @@
 """Configuration management module."""
 
-from .settings import Settings
+from .settings import Settings, get_settings, reset_settings
 from .environments import Environment, get_environment
+from .env import load_env_once, get_env_var
 
-__all__ = ["Settings", "Environment", "get_environment"]
\ No newline at end of file
+__all__ = [
+    "Settings",
+    "get_settings",
+    "reset_settings",
+    "Environment",
+    "get_environment",
+    "load_env_once",
+    "get_env_var",
+]
@@ -0,0 +1,40 @@
+"""
+Process-wide .env loading and environment variable caching.
+"""
+
+import functools
+import os
+from typing import Optional
+
+from dotenv import load_dotenv
+
+
+@functools.lru_cache(maxsize=1)
+def load_env_once() -> bool:
+    """
+    Load environment variables from .env, at most once per process.
+    
+    Returns:
+        True if a .env file was found and loaded
+    """
+    loaded = load_dotenv()
+    # Values read before .env was loaded may now be stale
+    get_env_var.cache_clear()
+    return loaded
+
+
+@functools.lru_cache(maxsize=None)
+def get_env_var(name: str) -> Optional[str]:
+    """
+    Read an environment variable, caching the result for the process.
+    
+    Meant for values such as API keys that don't change after startup.
+    The cache is refreshed when load_env_once() loads .env.
+    
+    Args:
+        name: Environment variable name
+        
+    Returns:
+        The variable's value, or None if it is unset
+    """
+    return os.getenv(name)
@@ -2,12 +2,25 @@
 Environment configuration management.
 """
 
+import functools
 import os
+import threading
 from enum import Enum
-from typing import Dict, Any, Optional
+from types import MappingProxyType
+from typing import Dict, Any, ItemsView, Iterator, KeysView, Mapping, Optional, ValuesView
 
 
-class Environment(str, Enum):
+try:
+    from enum import StrEnum
+except ImportError:  # Python < 3.11
+    class StrEnum(str, Enum):
+        """Minimal stand-in for enum.StrEnum."""
+        
+        def __str__(self) -> str:
+            return self.value
+
+
+class Environment(StrEnum):
     """Environment types."""
     
     DEVELOPMENT = "development"
@@ -16,24 +29,98 @@ class Environment(str, Enum):
     PRODUCTION = "production"
 
 
+# Value -> member lookup; sidesteps Enum.__call__ and its ValueError path
+_ENV_BY_NAME: Dict[str, Environment] = {env.value: env for env in Environment}
+
+
+@functools.lru_cache(maxsize=1)
 def get_environment() -> Environment:
     """
     Get the current environment from environment variables.
     
+    The result is cached; call reset_environment_cache() after changing
+    ``ENVIRONMENT`` at runtime.
+    
     Returns:
         Current environment (defaults to DEVELOPMENT)
     """
     env_name = os.getenv("ENVIRONMENT", "development").lower()
-    
-    try:
-        return Environment(env_name)
-    except ValueError:
-        return Environment.DEVELOPMENT
+    return _ENV_BY_NAME.get(env_name, Environment.DEVELOPMENT)
+
+
+def reset_environment_cache() -> None:
+    """Forget the cached get_environment() result (mainly for testing)."""
+    get_environment.cache_clear()
+
+
+# Per-environment defaults, merged once at import
+_BASE_CONFIG: Mapping[str, Any] = MappingProxyType({
+    "log_level": "INFO",
+    "debug": False,
+    "telemetry_enabled": True,
+    "cache_enabled": True,
+    "max_concurrent_tasks": 5,
+    "timeout_seconds": 300,
+    "retry_attempts": 3,
+})
+
+_CONFIGS: Dict[Environment, Mapping[str, Any]] = {
+    Environment.DEVELOPMENT: MappingProxyType({
+        **_BASE_CONFIG,
+        "log_level": "DEBUG",
+        "debug": True,
+        "telemetry_enabled": False,
+        "hot_reload": True,
+        "cache_ttl": 60,  # 1 minute
+        "max_concurrent_tasks": 3,
+    }),
+    Environment.TESTING: MappingProxyType({
+        **_BASE_CONFIG,
+        "log_level": "WARNING",
+        "debug": False,
+        "telemetry_enabled": False,
+        "cache_enabled": False,
+        "timeout_seconds": 30,
+        "max_concurrent_tasks": 2,
+        "retry_attempts": 1,
+    }),
+    Environment.STAGING: MappingProxyType({
+        **_BASE_CONFIG,
+        "log_level": "INFO",
+        "debug": False,
+        "telemetry_enabled": True,
+        "cache_ttl": 300,  # 5 minutes
+        "max_concurrent_tasks": 8,
+        "timeout_seconds": 600,
+    }),
+    Environment.PRODUCTION: MappingProxyType({
+        **_BASE_CONFIG,
+        "log_level": "WARNING",
+        "debug": False,
+        "telemetry_enabled": True,
+        "cache_ttl": 3600,  # 1 hour
+        "max_concurrent_tasks": 10,
+        "timeout_seconds": 900,
+        "retry_attempts": 5,
+        "monitoring_enabled": True,
+        "performance_tracking": True,
+    }),
+}
 
 
 class EnvironmentConfig:
     """Environment-specific configuration."""
     
+    __slots__ = (
+        "environment",
+        "is_development",
+        "is_testing",
+        "is_staging",
+        "is_production",
+        "_config",
+        "_view",
+    )
+    
     def __init__(self, environment: Environment):
         """
         Initialize environment configuration.
@@ -42,69 +129,20 @@ class EnvironmentConfig:
             environment: Target environment
         """
         self.environment = environment
+        # Plain attributes rather than properties: the environment never
+        # changes after construction, so these are checked without a call
+        self.is_development = environment == Environment.DEVELOPMENT
+        self.is_testing = environment == Environment.TESTING
+        self.is_staging = environment == Environment.STAGING
+        self.is_production = environment == Environment.PRODUCTION
         self._config = self._load_environment_config()
+        # Live read-only proxy; reflects update() without re-copying
+        self._view = MappingProxyType(self._config)
     
     def _load_environment_config(self) -> Dict[str, Any]:
         """Load configuration for the current environment."""
-        base_config = {
-            "log_level": "INFO",
-            "debug": False,
-            "telemetry_enabled": True,
-            "cache_enabled": True,
-            "max_concurrent_tasks": 5,
-            "timeout_seconds": 300,
-            "retry_attempts": 3,
-        }
-        
-        if self.environment == Environment.DEVELOPMENT:
-            return {
-                **base_config,
-                "log_level": "DEBUG",
-                "debug": True,
-                "telemetry_enabled": False,
-                "hot_reload": True,
-                "cache_ttl": 60,  # 1 minute
-                "max_concurrent_tasks": 3,
-            }
-        
-        elif self.environment == Environment.TESTING:
-            return {
-                **base_config,
-                "log_level": "WARNING",
-                "debug": False,
-                "telemetry_enabled": False,
-                "cache_enabled": False,
-                "timeout_seconds": 30,
-                "max_concurrent_tasks": 2,
-                "retry_attempts": 1,
-            }
-        
-        elif self.environment == Environment.STAGING:
-            return {
-                **base_config,
-                "log_level": "INFO",
-                "debug": False,
-                "telemetry_enabled": True,
-                "cache_ttl": 300,  # 5 minutes
-                "max_concurrent_tasks": 8,
-                "timeout_seconds": 600,
-            }
-        
-        elif self.environment == Environment.PRODUCTION:
-            return {
-                **base_config,
-                "log_level": "WARNING",
-                "debug": False,
-                "telemetry_enabled": True,
-                "cache_ttl": 3600,  # 1 hour
-                "max_concurrent_tasks": 10,
-                "timeout_seconds": 900,
-                "retry_attempts": 5,
-                "monitoring_enabled": True,
-                "performance_tracking": True,
-            }
-        
-        return base_config
+        # Copy, since update() mutates the instance's config in place
+        return dict(_CONFIGS.get(self.environment, _BASE_CONFIG))
     
     def get(self, key: str, default: Any = None) -> Any:
         """
@@ -119,15 +157,53 @@ class EnvironmentConfig:
         """
         return self._config.get(key, default)
     
-    def get_all(self) -> Dict[str, Any]:
+    def copy(self) -> Dict[str, Any]:
         """
-        Get all configuration values.
+        Get a mutable copy of all configuration values.
+        
+        Read-only callers should use view() or the mapping methods instead,
+        which don't allocate a new dict.
         
         Returns:
             Complete configuration dictionary
         """
         return self._config.copy()
     
+    # Backwards-compatible name for copy()
+    get_all = copy
+    
+    def keys(self) -> KeysView[str]:
+        """Get a view of the configuration keys."""
+        return self._config.keys()
+    
+    def values(self) -> ValuesView[Any]:
+        """Get a view of the configuration values."""
+        return self._config.values()
+    
+    def items(self) -> ItemsView[str, Any]:
+        """Get a view of the configuration items."""
+        return self._config.items()
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._config)
+    
+    def __contains__(self, key: object) -> bool:
+        return key in self._config
+    
+    def __len__(self) -> int:
+        return len(self._config)
+    
+    def view(self) -> Mapping[str, Any]:
+        """
+        Get a read-only view of all configuration values.
+        
+        Unlike get_all(), nothing is copied; the view reflects later updates.
+        
+        Returns:
+            Read-only mapping of the configuration
+        """
+        return self._view
+    
     def update(self, updates: Dict[str, Any]) -> None:
         """
         Update configuration values.
@@ -136,49 +212,48 @@ class EnvironmentConfig:
             updates: Dictionary of updates to apply
         """
         self._config.update(updates)
-    
-    @property
-    def is_development(self) -> bool:
-        """Check if environment is development."""
-        return self.environment == Environment.DEVELOPMENT
-    
-    @property
-    def is_testing(self) -> bool:
-        """Check if environment is testing."""
-        return self.environment == Environment.TESTING
-    
-    @property
-    def is_staging(self) -> bool:
-        """Check if environment is staging."""
-        return self.environment == Environment.STAGING
-    
-    @property
-    def is_production(self) -> bool:
-        """Check if environment is production."""
-        return self.environment == Environment.PRODUCTION
 
 
-# Global environment configuration instance
-_environment_config: Optional[EnvironmentConfig] = None
+_env_config: Optional[EnvironmentConfig] = None
+_env_config_lock = threading.Lock()
 
 
 def get_environment_config() -> EnvironmentConfig:
     """
-    Get the global environment configuration instance.
+    Get the global environment configuration instance, building it once.
+    
+    The instance is also published as the module attribute ``env_cfg``, for
+    hot read sites that can do a plain global lookup instead of a call.
     
     Returns:
         Environment configuration instance
     """
-    global _environment_config
-    
-    if _environment_config is None:
-        current_env = get_environment()
-        _environment_config = EnvironmentConfig(current_env)
+    global _env_config, env_cfg
+    if _env_config is not None:
+        return _env_config
     
-    return _environment_config
+    with _env_config_lock:
+        if _env_config is None:
+            env_cfg = _env_config = EnvironmentConfig(get_environment())
+    return _env_config
 
 
 def reset_environment_config() -> None:
-    """Reset the global environment configuration (mainly for testing)."""
-    global _environment_config
-    _environment_config = None
\ No newline at end of file
+    """
+    Reset the global environment configuration (mainly for testing).
+    
+    Names bound earlier with ``from .environments import env_cfg`` keep
+    pointing at the old instance.
+    """
+    global _env_config
+    with _env_config_lock:
+        _env_config = None
+        globals().pop("env_cfg", None)
+    reset_environment_cache()
+
+
+def __getattr__(name: str) -> Any:
+    """Build ``env_cfg`` on first access, before get_environment_config() has run."""
+    if name == "env_cfg":
+        return get_environment_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
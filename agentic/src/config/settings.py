@@ -2,16 +2,47 @@
 Application settings and configuration management.
 """
 
+import functools
 import os
 import json
-from typing import Any, Dict, Optional, List
+from typing import Callable, Dict, Optional, List
 from pathlib import Path
 from pydantic import BaseModel, Field, validator
 from pydantic_settings import BaseSettings
 
+try:
+    import orjson
+    _HAS_ORJSON = True
+except ImportError:  # optional: pip install ai-portfolio[performance]
+    _HAS_ORJSON = False
+
+from .env import get_env_var
 from .environments import Environment, get_environment, get_environment_config
 
 
+# (Settings field, environment config key) pairs applied in Settings.__init__
+_ENV_OVERRIDES = (
+    ("log_level", "log_level"),
+    ("debug", "debug"),
+    ("cache_enabled", "cache_enabled"),
+    ("cache_ttl", "cache_ttl"),
+    ("max_workers", "max_concurrent_tasks"),
+)
+_ENV_OVERRIDE_FIELDS = frozenset(field for field, _ in _ENV_OVERRIDES)
+
+
+# Accepted values for LLMConfig.provider and DatabaseConfig.type
+_ALLOWED_LLM_PROVIDERS = frozenset({"openai", "anthropic", "google", "azure"})
+_ALLOWED_DB_TYPES = frozenset({"chromadb", "postgres", "redis", "sqlite"})
+
+# (provider, Settings field holding its LLM config)
+_LLM_PROVIDER_FIELDS = (
+    ("openai", "default_llm"),
+    ("anthropic", "anthropic_llm"),
+    ("google", "google_llm"),
+)
+
+
 class LLMConfig(BaseModel):
     """LLM provider configuration."""
     
@@ -25,10 +56,10 @@ class LLMConfig(BaseModel):
     @validator('provider')
     def validate_provider(cls, v):
         """Validate LLM provider."""
-        allowed_providers = ["openai", "anthropic", "google", "azure"]
-        if v.lower() not in allowed_providers:
-            raise ValueError(f"Provider must be one of: {allowed_providers}")
-        return v.lower()
+        provider = v.lower()
+        if provider not in _ALLOWED_LLM_PROVIDERS:
+            raise ValueError(f"Provider must be one of: {sorted(_ALLOWED_LLM_PROVIDERS)}")
+        return provider
 
 
 class DatabaseConfig(BaseModel):
@@ -45,10 +76,25 @@ class DatabaseConfig(BaseModel):
     @validator('type')
     def validate_db_type(cls, v):
         """Validate database type."""
-        allowed_types = ["chromadb", "postgres", "redis", "sqlite"]
-        if v.lower() not in allowed_types:
-            raise ValueError(f"Database type must be one of: {allowed_types}")
-        return v.lower()
+        db_type = v.lower()
+        if db_type not in _ALLOWED_DB_TYPES:
+            raise ValueError(f"Database type must be one of: {sorted(_ALLOWED_DB_TYPES)}")
+        return db_type
+
+
+def _postgres_url(db: DatabaseConfig) -> str:
+    """Build a PostgreSQL URL, including credentials only when both are set."""
+    auth = f"{db.username}:{db.password}@" if db.username and db.password else ""
+    return f"postgresql://{auth}{db.host}:{db.port}/{db.database}"
+
+
+# Connection URL builder per DatabaseConfig.type
+_DB_URL_BUILDERS: Dict[str, Callable[[DatabaseConfig], str]] = {
+    "chromadb": lambda db: f"http://{db.host}:{db.port}",
+    "postgres": _postgres_url,
+    "redis": lambda db: f"redis://{db.host}:{db.port}",
+    "sqlite": lambda db: f"sqlite:///{db.database}.db",
+}
 
 
 class CrewConfig(BaseModel):
@@ -73,7 +119,7 @@ class Settings(BaseSettings):
         default_factory=lambda: LLMConfig(
             provider="openai",
             model="gpt-4o-mini",
-            api_key=os.getenv("OPENAI_API_KEY"),
+            api_key=get_env_var("OPENAI_API_KEY"),
             temperature=0.7
         )
     )
@@ -83,18 +129,18 @@ class Settings(BaseSettings):
         default_factory=lambda: LLMConfig(
             provider="anthropic",
             model="claude-3-haiku-20240307",
-            api_key=os.getenv("ANTHROPIC_API_KEY"),
+            api_key=get_env_var("ANTHROPIC_API_KEY"),
             temperature=0.7
-        ) if os.getenv("ANTHROPIC_API_KEY") else None
+        ) if get_env_var("ANTHROPIC_API_KEY") else None
     )
     
     google_llm: Optional[LLMConfig] = Field(
         default_factory=lambda: LLMConfig(
             provider="google",
             model="gemini-pro",
-            api_key=os.getenv("GOOGLE_API_KEY"),
+            api_key=get_env_var("GOOGLE_API_KEY"),
             temperature=0.7
-        ) if os.getenv("GOOGLE_API_KEY") else None
+        ) if get_env_var("GOOGLE_API_KEY") else None
     )
     
     # Database configuration
@@ -110,10 +156,16 @@ class Settings(BaseSettings):
     # Performance
     cache_enabled: bool = Field(default=True, description="Enable caching")
     cache_ttl: int = Field(default=3600, description="Cache TTL in seconds")
+    cache_dir: str = Field(default=".cache", description="Directory for on-disk caches")
     max_workers: int = Field(default=4, description="Maximum worker threads")
+    hash_buffer_size: int = Field(
+        default=1048576,
+        gt=0,
+        description="Read buffer size for file hashing (1MB)"
+    )
     
     # Security
-    api_rate_limit: int = Field(default=100, description="API rate limit per minute")
+    api_rate_limit: int = Field(default=100, description="API rate limit per minute (0 disables)")
     max_file_size: int = Field(default=10485760, description="Maximum file size (10MB)")
     allowed_file_types: List[str] = Field(
         default=["txt", "md", "json", "csv", "pdf"],
@@ -127,31 +179,31 @@ class Settings(BaseSettings):
         case_sensitive = False
         validate_assignment = True
     
+    @validator('allowed_file_types')
+    def normalize_file_types(cls, v):
+        """Store file types as lowercased extensions without a leading dot."""
+        return [t.lower().lstrip('.') for t in v]
+    
     def __init__(self, **kwargs):
         """Initialize settings with environment-specific defaults."""
         super().__init__(**kwargs)
         
         # Apply environment-specific configuration
         env_config = get_environment_config()
+        cfg_get = env_config.get
         
-        # Update settings based on environment
-        if hasattr(self, 'log_level'):
-            self.log_level = env_config.get('log_level', self.log_level)
-        
-        if hasattr(self, 'debug'):
-            self.debug = env_config.get('debug', self.debug)
-        
-        if hasattr(self, 'cache_enabled'):
-            self.cache_enabled = env_config.get('cache_enabled', self.cache_enabled)
-        
-        if hasattr(self, 'cache_ttl'):
-            self.cache_ttl = env_config.get('cache_ttl', self.cache_ttl)
-        
-        if hasattr(self, 'max_workers'):
-            self.max_workers = env_config.get('max_concurrent_tasks', self.max_workers)
+        # Update settings based on environment. The values come from the
+        # static per-environment tables, so skip validate_assignment's
+        # per-field revalidation and write them in one batch. Record the
+        # fields as set, as a validated assignment would have.
+        self.__dict__.update({
+            field: cfg_get(key, getattr(self, field))
+            for field, key in _ENV_OVERRIDES
+        })
+        self.__pydantic_fields_set__.update(_ENV_OVERRIDE_FIELDS)
         
         # Set CrewAI telemetry
-        if env_config.get('telemetry_enabled', True) is False:
+        if cfg_get('telemetry_enabled', True) is False:
             os.environ['CREWAI_TELEMETRY_OPT_OUT'] = 'true'
     
     @classmethod
@@ -165,16 +217,19 @@ class Settings(BaseSettings):
         Returns:
             Settings instance
         """
-        config_file = Path(config_path)
+        # Opening doubles as the existence check (no separate stat), and
+        # still reports a missing file before an unsupported suffix
+        try:
+            f = open(config_path, 'rb')
+        except FileNotFoundError as e:
+            raise FileNotFoundError(f"Configuration file not found: {config_path}") from e
         
-        if not config_file.exists():
-            raise FileNotFoundError(f"Configuration file not found: {config_path}")
+        with f:
+            if Path(config_path).suffix.lower() != '.json':
+                raise ValueError("Only JSON configuration files are supported")
+            raw = f.read()
         
-        if config_file.suffix.lower() == '.json':
-            with open(config_file, 'r') as f:
-                config_data = json.load(f)
-        else:
-            raise ValueError("Only JSON configuration files are supported")
+        config_data = orjson.loads(raw) if _HAS_ORJSON else json.loads(raw)
         
         return cls(**config_data)
     
@@ -188,6 +243,8 @@ class Settings(BaseSettings):
         config_file = Path(config_path)
         config_file.parent.mkdir(parents=True, exist_ok=True)
         
+        # The stdlib encoder even when orjson is installed: orjson would write
+        # NaN as null and leave non-ASCII text unescaped
         with open(config_file, 'w') as f:
             json.dump(self.model_dump(), f, indent=2, default=str)
     
@@ -205,29 +262,66 @@ class Settings(BaseSettings):
             return self.default_llm
         
         provider = provider.lower()
-        
-        if provider == "anthropic" and self.anthropic_llm:
-            return self.anthropic_llm
-        elif provider == "google" and self.google_llm:
-            return self.google_llm
-        elif provider == "openai":
-            return self.default_llm
-        else:
+        config = self.llms.get(provider)
+        if config is None:
             raise ValueError(f"Unknown or unconfigured LLM provider: {provider}")
+        return config
     
-    def validate_api_keys(self) -> Dict[str, bool]:
+    @property
+    def llms(self) -> Dict[str, LLMConfig]:
         """
-        Validate that required API keys are available.
+        Configured LLMs keyed by provider name.
+        
+        The per-provider fields stay the source of truth, so config files and
+        model_dump() keep their shape; unconfigured providers are omitted.
+        
+        Returns:
+            Dictionary mapping provider names to LLM configurations
+        """
+        llms = {}
+        for provider, field in _LLM_PROVIDER_FIELDS:
+            config = getattr(self, field)
+            if config:
+                llms[provider] = config
+        return llms
+    
+    @property
+    def api_key_status(self) -> Dict[str, bool]:
+        """
+        Which API keys are available.
         
         Returns:
             Dictionary showing which API keys are available
         """
+        llms = self.llms
         return {
-            "openai": bool(self.default_llm.api_key),
-            "anthropic": bool(self.anthropic_llm and self.anthropic_llm.api_key),
-            "google": bool(self.google_llm and self.google_llm.api_key),
+            provider: provider in llms and bool(llms[provider].api_key)
+            for provider, _ in _LLM_PROVIDER_FIELDS
         }
     
+    def validate_api_keys(self) -> Dict[str, bool]:
+        """
+        Validate that required API keys are available.
+        
+        Returns:
+            Dictionary showing which API keys are available
+        """
+        return self.api_key_status
+    
+    @property
+    def database_url(self) -> str:
+        """
+        Database connection URL for the current database configuration.
+        
+        Returns:
+            Database connection URL
+        """
+        database = self.database
+        builder = _DB_URL_BUILDERS.get(database.type)
+        if builder is None:
+            raise ValueError(f"Unsupported database type: {database.type}")
+        return builder(database)
+    
     def get_database_url(self) -> str:
         """
         Get database connection URL.
@@ -235,19 +329,7 @@ class Settings(BaseSettings):
         Returns:
             Database connection URL
         """
-        if self.database.type == "chromadb":
-            return f"http://{self.database.host}:{self.database.port}"
-        elif self.database.type == "postgres":
-            auth = ""
-            if self.database.username and self.database.password:
-                auth = f"{self.database.username}:{self.database.password}@"
-            return f"postgresql://{auth}{self.database.host}:{self.database.port}/{self.database.database}"
-        elif self.database.type == "redis":
-            return f"redis://{self.database.host}:{self.database.port}"
-        elif self.database.type == "sqlite":
-            return f"sqlite:///{self.database.database}.db"
-        else:
-            raise ValueError(f"Unsupported database type: {self.database.type}")
+        return self.database_url
     
     def is_development(self) -> bool:
         """Check if running in development environment."""
@@ -255,4 +337,23 @@ class Settings(BaseSettings):
     
     def is_production(self) -> bool:
         """Check if running in production environment."""
-        return self.environment == Environment.PRODUCTION
\ No newline at end of file
+        return self.environment == Environment.PRODUCTION
+
+
+@functools.lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Get the shared application settings, constructing them on first use.
+    
+    Settings.from_file() and direct Settings() calls still create separate
+    instances.
+    
+    Returns:
+        Shared Settings instance
+    """
+    return Settings()
+
+
+def reset_settings() -> None:
+    """Discard the shared settings so the next get_settings() rebuilds them (mainly for testing)."""
+    get_settings.cache_clear()
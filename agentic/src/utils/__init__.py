@@ -1,16 +1,50 @@
 """Utilities module for AI Portfolio."""
 
-from .logging_utils import setup_logging, get_logger
-from .crew_factory import CrewFactory
-from .performance_monitor import PerformanceMonitor
-from .file_utils import FileUtils
-from .validation_utils import ValidationUtils
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .logging_utils import setup_logging, get_logger
+    from .crew_factory import CrewFactory
+    from .performance_monitor import PerformanceMonitor
+    from .file_utils import FileUtils
+    from .validation_utils import ValidationUtils
+    from .rate_limiter import TokenBucket
+
+# Public name -> defining submodule. Submodules are imported on first access
+# (PEP 562), so e.g. importing logging_utils doesn't pull in crewai.
+_LAZY = {
+    "setup_logging": "logging_utils",
+    "get_logger": "logging_utils",
+    "CrewFactory": "crew_factory",
+    "PerformanceMonitor": "performance_monitor",
+    "FileUtils": "file_utils",
+    "ValidationUtils": "validation_utils",
+    "TokenBucket": "rate_limiter",
+}
 
 __all__ = [
     "setup_logging",
-    "get_logger", 
+    "get_logger",
     "CrewFactory",
     "PerformanceMonitor",
     "FileUtils",
-    "ValidationUtils"
-]
\ No newline at end of file
+    "ValidationUtils",
+    "TokenBucket"
+]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a public name's submodule on first access and cache the value."""
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -2,7 +2,14 @@
 CrewAI factory for creating and managing different crew configurations.
 """
 
-from typing import Dict, Any, List, Optional, Type
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import (
+    Callable, ClassVar, Deque, Final, FrozenSet, Dict, Any, Hashable, Iterator, List, Optional,
+    Tuple, Type
+)
 from crewai import Crew, Agent, Task, Process
 from crewai_tools import SerperDevTool, FileReaderTool, FileWriterTool
 
@@ -11,9 +18,308 @@ from ..agents.base_agent import BaseAgent, AgentConfig
 from .logging_utils import get_logger
 
 
+# Agent backstories and task descriptions, shared by every crew built.
+# Whitespace is kept exactly as in the original inline prompts.
+_RESEARCH_RESEARCHER_BACKSTORY: Final[str] = (
+    "You are an experienced researcher with a keen eye for detail.\n"
+    "            You excel at finding reliable sources and extracting key insights from complex "
+    "information.\n"
+    "            Your research forms the foundation for high-quality content creation."
+)
+
+_RESEARCH_WRITER_BACKSTORY: Final[str] = (
+    "You are a skilled writer who transforms research into compelling narratives.\n"
+    "            You have a talent for making complex topics accessible and engaging for various "
+    "audiences.\n"
+    "            Your writing is clear, well-structured, and factually accurate."
+)
+
+_RESEARCH_RESEARCH_TASK_DESCRIPTION: Final[str] = (
+    "Research the topic: {topic}\n"
+    "            \n"
+    "            Focus on:\n"
+    "            - Key concepts and definitions\n"
+    "            - Recent developments and trends\n"
+    "            - Important statistics or data points\n"
+    "            - Expert opinions and perspectives\n"
+    "            \n"
+    "            Provide a comprehensive research summary with sources."
+)
+
+_RESEARCH_WRITING_TASK_DESCRIPTION: Final[str] = (
+    "Using the research findings, write a comprehensive article about {topic}.\n"
+    "            \n"
+    "            The article should:\n"
+    "            - Be 800-1200 words long\n"
+    "            - Include an engaging introduction\n"
+    "            - Cover all key points from the research\n"
+    "            - Have a clear structure with headings\n"
+    "            - End with a meaningful conclusion\n"
+    "            \n"
+    "            Save the article to a file named '{topic}_article.md'"
+)
+
+_CONTENT_ANALYSIS_ANALYZER_BACKSTORY: Final[str] = (
+    "You are an expert content analyst with deep expertise in natural language processing.\n"
+    "            You excel at identifying patterns, themes, and sentiment in written content.\n"
+    "            Your analyses provide valuable insights for content strategy and optimization."
+)
+
+_CONTENT_ANALYSIS_DATA_SCIENTIST_BACKSTORY: Final[str] = (
+    "You are a data scientist specializing in text analytics and metrics.\n"
+    "            You transform qualitative content analysis into actionable quantitative "
+    "insights.\n"
+    "            Your statistical approach provides objective measurements and trends."
+)
+
+_CONTENT_ANALYSIS_REPORT_WRITER_BACKSTORY: Final[str] = (
+    "You are a professional report writer who specializes in business intelligence.\n"
+    "            You transform complex analysis into clear, actionable business recommendations.\n"
+    "            Your reports drive strategic decision-making and content optimization."
+)
+
+_CONTENT_ANALYSIS_ANALYSIS_TASK_DESCRIPTION: Final[str] = (
+    "Analyze the content in the file: {content_file}\n"
+    "            \n"
+    "            Perform comprehensive analysis including:\n"
+    "            - Main themes and topics identification\n"
+    "            - Sentiment analysis (positive, negative, neutral)\n"
+    "            - Key message extraction\n"
+    "            - Writing style assessment\n"
+    "            - Target audience identification\n"
+    "            - Content structure evaluation\n"
+    "            \n"
+    "            Provide detailed findings with specific examples from the text."
+)
+
+_CONTENT_ANALYSIS_STATISTICAL_TASK_DESCRIPTION: Final[str] = (
+    "Based on the content analysis, perform statistical evaluation:\n"
+    "            \n"
+    "            Calculate and analyze:\n"
+    "            - Word count and readability metrics\n"
+    "            - Sentence structure patterns\n"
+    "            - Keyword density and frequency\n"
+    "            - Sentiment score distribution\n"
+    "            - Content complexity metrics\n"
+    "            - Engagement potential indicators\n"
+    "            \n"
+    "            Provide quantitative metrics and statistical insights."
+)
+
+_CONTENT_ANALYSIS_REPORT_TASK_DESCRIPTION: Final[str] = (
+    "Create a comprehensive content analysis report based on previous findings.\n"
+    "            \n"
+    "            The report should include:\n"
+    "            - Executive summary of key findings\n"
+    "            - Detailed analysis results\n"
+    "            - Statistical metrics and trends\n"
+    "            - Content strengths and weaknesses\n"
+    "            - Actionable recommendations for improvement\n"
+    "            - Conclusion with strategic insights\n"
+    "            \n"
+    "            Save the report as '{content_file}_analysis_report.md'"
+)
+
+_CREATIVE_WRITING_PLANNER_BACKSTORY: Final[str] = (
+    "You are a master storyteller with expertise in narrative structure and character "
+    "development.\n"
+    "            You create detailed outlines that serve as blueprints for engaging stories.\n"
+    "            Your planning ensures stories have strong arcs, memorable characters, and "
+    "satisfying conclusions."
+)
+
+_CREATIVE_WRITING_WRITER_BACKSTORY: Final[str] = (
+    "You are a talented creative writer with a gift for bringing stories to life.\n"
+    "            You excel at dialogue, descriptive prose, and maintaining reader engagement.\n"
+    "            Your writing style adapts to different genres while maintaining quality and "
+    "authenticity."
+)
+
+_CREATIVE_WRITING_EDITOR_BACKSTORY: Final[str] = (
+    "You are an experienced editor with a keen eye for detail and flow.\n"
+    "            You enhance clarity, fix inconsistencies, and ensure the narrative maintains its "
+    "intended tone.\n"
+    "            Your editing transforms good writing into exceptional storytelling."
+)
+
+_CREATIVE_WRITING_PLANNING_TASK_DESCRIPTION: Final[str] = (
+    "Create a detailed story plan for: {story_prompt}\n"
+    "            \n"
+    "            Develop:\n"
+    "            - Main character profiles with motivations and backgrounds\n"
+    "            - Plot structure with beginning, middle, and end\n"
+    "            - Key scenes and story beats\n"
+    "            - Setting and world-building elements\n"
+    "            - Conflict and resolution framework\n"
+    "            - Themes and underlying messages\n"
+    "            \n"
+    "            Genre: {genre}\n"
+    "            Target length: {target_length} words\n"
+    "            \n"
+    "            Provide a comprehensive story outline ready for writing."
+)
+
+_CREATIVE_WRITING_WRITING_TASK_DESCRIPTION: Final[str] = (
+    "Using the story plan, write the complete story.\n"
+    "            \n"
+    "            Requirements:\n"
+    "            - Follow the planned structure and character development\n"
+    "            - Write approximately {target_length} words\n"
+    "            - Maintain consistent tone and style for {genre} genre\n"
+    "            - Include engaging dialogue and vivid descriptions\n"
+    "            - Ensure proper pacing and narrative flow\n"
+    "            - Create compelling opening and satisfying conclusion\n"
+    "            \n"
+    "            Save the story as '{story_title}.md'"
+)
+
+_CREATIVE_WRITING_EDITING_TASK_DESCRIPTION: Final[str] = (
+    "Edit and refine the written story for publication quality.\n"
+    "            \n"
+    "            Focus on:\n"
+    "            - Grammar, punctuation, and spelling corrections\n"
+    "            - Sentence structure and flow improvements\n"
+    "            - Character consistency and development\n"
+    "            - Plot coherence and pacing\n"
+    "            - Dialogue naturalness and effectiveness\n"
+    "            - Overall readability and engagement\n"
+    "            \n"
+    "            Save the edited version as '{story_title}_final.md'"
+)
+
+
+_PoolKey = Tuple[str, Hashable]
+
+
+def _config_key(config: Optional[Dict[str, Any]]) -> Optional[Hashable]:
+    """
+    Build a hashable pool key from a config override.
+    
+    Returns:
+        Sorted tuple of the config items, or None if a value is unhashable
+        (such crews are simply not pooled)
+    """
+    if not config:
+        return ()
+    key = tuple(sorted(config.items()))
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+class _CrewPool:
+    """Bounded pool of idle Crew instances, keyed by crew type and config."""
+    
+    def __init__(self, max_size: int = 50, idle_timeout: float = 300.0):
+        """
+        Initialize the pool.
+        
+        Args:
+            max_size: Maximum number of idle crews kept across all keys
+            idle_timeout: Seconds after which an idle crew is discarded
+        """
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self._idle: Dict[_PoolKey, Deque[Tuple[Crew, float]]] = {}
+        self._size = 0
+        self._lock = threading.Lock()
+    
+    def _evict_expired(self, now: float) -> None:
+        """Drop crews idle for longer than idle_timeout. Caller holds the lock."""
+        cutoff = now - self.idle_timeout
+        for key in list(self._idle):
+            idle = self._idle[key]
+            # Oldest entries sit at the left
+            while idle and idle[0][1] < cutoff:
+                idle.popleft()
+                self._size -= 1
+            if not idle:
+                del self._idle[key]
+    
+    def acquire(self, key: _PoolKey) -> Optional[Crew]:
+        """
+        Take an idle crew for the key, if one is available.
+        
+        Args:
+            key: (crew type, config key) pair
+            
+        Returns:
+            A previously released Crew, or None on a miss
+        """
+        with self._lock:
+            self._evict_expired(time.monotonic())
+            idle = self._idle.get(key)
+            if not idle:
+                return None
+            # Most recently released first; it is the least likely to expire
+            crew, _ = idle.pop()
+            self._size -= 1
+            return crew
+    
+    def release(self, key: _PoolKey, crew: Crew) -> None:
+        """
+        Return a crew to the pool for reuse, unless the pool is full.
+        
+        Crews built with memory enabled are never pooled: their short-term
+        and entity memory would carry one caller's context into the next
+        caller's run.
+        
+        Args:
+            key: (crew type, config key) pair the crew was built for
+            crew: Crew to return
+        """
+        if crew.memory:
+            return
+        
+        # Clear the previous run's results so they don't leak into the next
+        for task in crew.tasks:
+            task.output = None
+        for agent in crew.agents:
+            if getattr(agent, "tools_results", None):
+                agent.tools_results = []
+        
+        with self._lock:
+            now = time.monotonic()
+            self._evict_expired(now)
+            if self._size >= self.max_size:
+                return
+            self._idle.setdefault(key, deque()).append((crew, now))
+            self._size += 1
+    
+    def clear(self) -> None:
+        """Discard all idle crews."""
+        with self._lock:
+            self._idle.clear()
+            self._size = 0
+
+
 class CrewFactory:
     """Factory for creating CrewAI crews with standardized configurations."""
     
+    # Common tools, built on first use and shared by every factory
+    _TOOL_FACTORIES: ClassVar[Dict[str, Callable[[], Any]]] = {
+        "search": SerperDevTool,
+        "file_reader": FileReaderTool,
+        "file_writer": FileWriterTool,
+    }
+    _SHARED_TOOLS: ClassVar[Dict[str, Any]] = {}
+    # Frozen tool sets by tool names, shared by every agent that uses them
+    _SHARED_TOOLSETS: ClassVar[Dict[Tuple[str, ...], Tuple[Any, ...]]] = {}
+    
+    # Builder method for each crew type accepted by create_crew()
+    _CREW_BUILDERS: ClassVar[Dict[str, str]] = {
+        "research": "_create_research_crew",
+        "content_analysis": "_create_content_analysis_crew",
+        "creative_writing": "_create_creative_writing_crew",
+        "data_analysis": "_create_data_analysis_crew",
+        "social_media": "_create_social_media_crew",
+    }
+    # Crew types whose builders are still placeholders
+    _PLANNED_CREWS: ClassVar[FrozenSet[str]] = frozenset({"data_analysis", "social_media"})
+    _tools_lock: ClassVar[threading.Lock] = threading.Lock()
+    
     def __init__(self, settings: Settings):
         """
         Initialize the crew factory.
@@ -23,13 +329,52 @@ class CrewFactory:
         """
         self.settings = settings
         self.logger = get_logger("crew_factory")
+        self._pool = _CrewPool()
+    
+    @classmethod
+    def _tool(cls, name: str) -> Any:
+        """
+        Get a shared common tool, instantiating it on first use.
         
-        # Initialize common tools
-        self.common_tools = {
-            "search": SerperDevTool(),
-            "file_reader": FileReaderTool(),
-            "file_writer": FileWriterTool(),
-        }
+        Args:
+            name: Tool name (search, file_reader, file_writer)
+            
+        Returns:
+            Tool instance
+        """
+        tool = cls._SHARED_TOOLS.get(name)
+        if tool is None:
+            with cls._tools_lock:
+                tool = cls._SHARED_TOOLS.get(name)
+                if tool is None:
+                    tool = cls._SHARED_TOOLS[name] = cls._TOOL_FACTORIES[name]()
+        return tool
+    
+    @classmethod
+    def _tools(cls, *names: str) -> Tuple[Any, ...]:
+        """
+        Get a shared, immutable tool set for an agent.
+        
+        Agent validates ``tools`` into a list of its own, so one tuple can be
+        handed to every agent instead of building a new list per agent.
+        
+        Args:
+            *names: Tool names (search, file_reader, file_writer)
+            
+        Returns:
+            Tuple of tool instances, in the order given
+        """
+        toolset = cls._SHARED_TOOLSETS.get(names)
+        if toolset is None:
+            toolset = tuple(cls._tool(name) for name in names)
+            # Racing threads build equal tuples of the same shared tools
+            cls._SHARED_TOOLSETS[names] = toolset
+        return toolset
+    
+    @property
+    def common_tools(self) -> Dict[str, Any]:
+        """All common tools by name; instantiates any not yet built."""
+        return {name: self._tool(name) for name in self._TOOL_FACTORIES}
     
     def create_crew(
         self,
@@ -39,6 +384,9 @@ class CrewFactory:
         """
         Create a crew of the specified type.
         
+        A crew previously handed back with release_crew() for the same type
+        and overrides is reused instead of building a new one.
+        
         Args:
             crew_type: Type of crew to create
             config_override: Optional configuration overrides
@@ -46,74 +394,98 @@ class CrewFactory:
         Returns:
             Configured Crew instance
         """
-        self.logger.info(f"Creating crew of type: {crew_type}")
-        
         config = config_override or {}
         
-        if crew_type == "research":
-            return self._create_research_crew(config)
-        elif crew_type == "content_analysis":
-            return self._create_content_analysis_crew(config)
-        elif crew_type == "creative_writing":
-            return self._create_creative_writing_crew(config)
-        elif crew_type == "data_analysis":
-            return self._create_data_analysis_crew(config)
-        elif crew_type == "social_media":
-            return self._create_social_media_crew(config)
-        else:
+        cfg_key = _config_key(config)
+        if cfg_key is not None:
+            crew = self._pool.acquire((crew_type, cfg_key))
+            if crew is not None:
+                self.logger.debug(f"Reusing pooled crew of type: {crew_type}")
+                return crew
+        
+        self.logger.info(f"Creating crew of type: {crew_type}")
+        
+        builder = self._CREW_BUILDERS.get(crew_type)
+        if builder is None:
             raise ValueError(f"Unknown crew type: {crew_type}")
+        return getattr(self, builder)(config)
+    
+    def release_crew(
+        self,
+        crew_type: str,
+        crew: Crew,
+        config_override: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """
+        Hand a crew back for reuse by later create_crew() calls.
+        
+        Only release crews whose run completed normally, and don't use the
+        crew again afterwards.
+        
+        Args:
+            crew_type: Type the crew was created as
+            crew: Crew returned by create_crew()
+            config_override: The overrides the crew was created with
+        """
+        cfg_key = _config_key(config_override)
+        if cfg_key is not None:
+            self._pool.release((crew_type, cfg_key), crew)
+    
+    @contextmanager
+    def with_crew(
+        self,
+        crew_type: str,
+        config_override: Optional[Dict[str, Any]] = None
+    ) -> Iterator[Crew]:
+        """
+        Borrow a crew for the duration of a with block.
+        
+        The crew is returned to the pool when the block exits normally; if
+        the block raises, it is discarded.
+        
+        Args:
+            crew_type: Type of crew to create
+            config_override: Optional configuration overrides
+            
+        Yields:
+            Configured Crew instance
+        """
+        crew = self.create_crew(crew_type, config_override)
+        yield crew
+        self.release_crew(crew_type, crew, config_override)
     
     def _create_research_crew(self, config: Dict[str, Any]) -> Crew:
         """Create a research crew."""
+        verbose = config.get("verbose", self.settings.crew.verbose)
+        
         # Create agents
         researcher = Agent(
             role="Research Specialist",
             goal="Conduct thorough research on given topics and gather accurate information",
-            backstory="""You are an experienced researcher with a keen eye for detail.
-            You excel at finding reliable sources and extracting key insights from complex information.
-            Your research forms the foundation for high-quality content creation.""",
-            tools=[self.common_tools["search"]],
-            verbose=config.get("verbose", self.settings.crew.verbose),
+            backstory=_RESEARCH_RESEARCHER_BACKSTORY,
+            tools=self._tools("search"),
+            verbose=verbose,
             allow_delegation=False
         )
         
         writer = Agent(
             role="Content Writer",
             goal="Create engaging and informative content based on research findings",
-            backstory="""You are a skilled writer who transforms research into compelling narratives.
-            You have a talent for making complex topics accessible and engaging for various audiences.
-            Your writing is clear, well-structured, and factually accurate.""",
-            tools=[self.common_tools["file_writer"]],
-            verbose=config.get("verbose", self.settings.crew.verbose),
+            backstory=_RESEARCH_WRITER_BACKSTORY,
+            tools=self._tools("file_writer"),
+            verbose=verbose,
             allow_delegation=False
         )
         
         # Create tasks
         research_task = Task(
-            description="""Research the topic: {topic}
-            
-            Focus on:
-            - Key concepts and definitions
-            - Recent developments and trends
-            - Important statistics or data points
-            - Expert opinions and perspectives
-            
-            Provide a comprehensive research summary with sources.""",
+            description=_RESEARCH_RESEARCH_TASK_DESCRIPTION,
             agent=researcher,
             expected_output="A detailed research summary with key findings and source references"
         )
         
         writing_task = Task(
-            description="""Using the research findings, write a comprehensive article about {topic}.
-            
-            The article should:
-            - Be 800-1200 words long
-            - Include an engaging introduction
-            - Cover all key points from the research
-            - Have a clear structure with headings
-            - End with a meaningful conclusion
-            
-            Save the article to a file named '{topic}_article.md'""",
+            description=_RESEARCH_WRITING_TASK_DESCRIPTION,
             agent=writer,
             expected_output="A well-written article saved to a markdown file",
             context=[research_task]
@@ -123,92 +495,58 @@ class CrewFactory:
             agents=[researcher, writer],
             tasks=[research_task, writing_task],
             process=Process.sequential,
-            verbose=config.get("verbose", self.settings.crew.verbose),
+            verbose=verbose,
             memory=config.get("memory", self.settings.crew.memory_enabled)
         )
     
     def _create_content_analysis_crew(self, config: Dict[str, Any]) -> Crew:
         """Create a content analysis crew."""
+        verbose = config.get("verbose", self.settings.crew.verbose)
+        
         # Create agents
         analyzer = Agent(
             role="Content Analyst",
             goal="Analyze text content for themes, sentiment, and key insights",
-            backstory="""You are an expert content analyst with deep expertise in natural language processing.
-            You excel at identifying patterns, themes, and sentiment in written content.
-            Your analyses provide valuable insights for content strategy and optimization.""",
-            tools=[self.common_tools["file_reader"]],
-            verbose=config.get("verbose", self.settings.crew.verbose),
+            backstory=_CONTENT_ANALYSIS_ANALYZER_BACKSTORY,
+            tools=self._tools("file_reader"),
+            verbose=verbose,
             allow_delegation=False
         )
         
         data_scientist = Agent(
             role="Data Scientist",
             goal="Perform statistical analysis and extract quantitative insights",
-            backstory="""You are a data scientist specializing in text analytics and metrics.
-            You transform qualitative content analysis into actionable quantitative insights.
-            Your statistical approach provides objective measurements and trends.""",
-            tools=[],
-            verbose=config.get("verbose", self.settings.crew.verbose),
+            backstory=_CONTENT_ANALYSIS_DATA_SCIENTIST_BACKSTORY,
+            tools=self._tools(),
+            verbose=verbose,
             allow_delegation=False
         )
         
         report_writer = Agent(
             role="Report Writer",
             goal="Create comprehensive analysis reports with actionable recommendations",
-            backstory="""You are a professional report writer who specializes in business intelligence.
-            You transform complex analysis into clear, actionable business recommendations.
-            Your reports drive strategic decision-making and content optimization.""",
-            tools=[self.common_tools["file_writer"]],
-            verbose=config.get("verbose", self.settings.crew.verbose),
+            backstory=_CONTENT_ANALYSIS_REPORT_WRITER_BACKSTORY,
+            tools=self._tools("file_writer"),
+            verbose=verbose,
             allow_delegation=False
         )
         
         # Create tasks
         analysis_task = Task(
-            description="""Analyze the content in the file: {content_file}
-            
-            Perform comprehensive analysis including:
-            - Main themes and topics identification
-            - Sentiment analysis (positive, negative, neutral)
-            - Key message extraction
-            - Writing style assessment
-            - Target audience identification
-            - Content structure evaluation
-            
-            Provide detailed findings with specific examples from the text.""",
+            description=_CONTENT_ANALYSIS_ANALYSIS_TASK_DESCRIPTION,
             agent=analyzer,
             expected_output="Detailed content analysis with themes, sentiment, and key insights"
         )
         
         statistical_task = Task(
-            description="""Based on the content analysis, perform statistical evaluation:
-            
-            Calculate and analyze:
-            - Word count and readability metrics
-            - Sentence structure patterns
-            - Keyword density and frequency
-            - Sentiment score distribution
-            - Content complexity metrics
-            - Engagement potential indicators
-            
-            Provide quantitative metrics and statistical insights.""",
+            description=_CONTENT_ANALYSIS_STATISTICAL_TASK_DESCRIPTION,
             agent=data_scientist,
             expected_output="Statistical analysis with metrics and quantitative insights",
             context=[analysis_task]
         )
         
         report_task = Task(
-            description="""Create a comprehensive content analysis report based on previous findings.
-            
-            The report should include:
-            - Executive summary of key findings
-            - Detailed analysis results
-            - Statistical metrics and trends
-            - Content strengths and weaknesses
-            - Actionable recommendations for improvement
-            - Conclusion with strategic insights
-            
-            Save the report as '{content_file}_analysis_report.md'""",
+            description=_CONTENT_ANALYSIS_REPORT_TASK_DESCRIPTION,
             agent=report_writer,
             expected_output="Professional analysis report saved to markdown file",
             context=[analysis_task, statistical_task]
@@ -218,95 +556,58 @@ class CrewFactory:
             agents=[analyzer, data_scientist, report_writer],
             tasks=[analysis_task, statistical_task, report_task],
             process=Process.sequential,
-            verbose=config.get("verbose", self.settings.crew.verbose),
+            verbose=verbose,
             memory=config.get("memory", self.settings.crew.memory_enabled)
         )
     
     def _create_creative_writing_crew(self, config: Dict[str, Any]) -> Crew:
         """Create a creative writing crew."""
+        verbose = config.get("verbose", self.settings.crew.verbose)
+        
         # Create agents
         planner = Agent(
             role="Story Planner",
             goal="Develop compelling story structures, characters, and plot outlines",
-            backstory="""You are a master storyteller with expertise in narrative structure and character development.
-            You create detailed outlines that serve as blueprints for engaging stories.
-            Your planning ensures stories have strong arcs, memorable characters, and satisfying conclusions.""",
-            tools=[],
-            verbose=config.get("verbose", self.settings.crew.verbose),
+            backstory=_CREATIVE_WRITING_PLANNER_BACKSTORY,
+            tools=self._tools(),
+            verbose=verbose,
             allow_delegation=False
         )
         
         writer = Agent(
             role="Creative Writer",
             goal="Transform story plans into engaging, well-written narratives",
-            backstory="""You are a talented creative writer with a gift for bringing stories to life.
-            You excel at dialogue, descriptive prose, and maintaining reader engagement.
-            Your writing style adapts to different genres while maintaining quality and authenticity.""",
-            tools=[self.common_tools["file_writer"]],
-            verbose=config.get("verbose", self.settings.crew.verbose),
+            backstory=_CREATIVE_WRITING_WRITER_BACKSTORY,
+            tools=self._tools("file_writer"),
+            verbose=verbose,
             allow_delegation=False
         )
         
         editor = Agent(
             role="Editor",
             goal="Refine and polish written content for maximum impact and readability",
-            backstory="""You are an experienced editor with a keen eye for detail and flow.
-            You enhance clarity, fix inconsistencies, and ensure the narrative maintains its intended tone.
-            Your editing transforms good writing into exceptional storytelling.""",
-            tools=[self.common_tools["file_writer"]],
-            verbose=config.get("verbose", self.settings.crew.verbose),
+            backstory=_CREATIVE_WRITING_EDITOR_BACKSTORY,
+            tools=self._tools("file_writer"),
+            verbose=verbose,
             allow_delegation=False
         )
         
         # Create tasks
         planning_task = Task(
-            description="""Create a detailed story plan for: {story_prompt}
-            
-            Develop:
-            - Main character profiles with motivations and backgrounds
-            - Plot structure with beginning, middle, and end
-            - Key scenes and story beats
-            - Setting and world-building elements
-            - Conflict and resolution framework
-            - Themes and underlying messages
-            
-            Genre: {genre}
-            Target length: {target_length} words
-            
-            Provide a comprehensive story outline ready for writing.""",
+            description=_CREATIVE_WRITING_PLANNING_TASK_DESCRIPTION,
             agent=planner,
             expected_output="Detailed story plan with characters, plot structure, and key scenes"
         )
         
         writing_task = Task(
-            description="""Using the story plan, write the complete story.
-            
-            Requirements:
-            - Follow the planned structure and character development
-            - Write approximately {target_length} words
-            - Maintain consistent tone and style for {genre} genre
-            - Include engaging dialogue and vivid descriptions
-            - Ensure proper pacing and narrative flow
-            - Create compelling opening and satisfying conclusion
-            
-            Save the story as '{story_title}.md'""",
+            description=_CREATIVE_WRITING_WRITING_TASK_DESCRIPTION,
             agent=writer,
             expected_output="Complete story written and saved to file",
             context=[planning_task]
         )
         
         editing_task = Task(
-            description="""Edit and refine the written story for publication quality.
-            
-            Focus on:
-            - Grammar, punctuation, and spelling corrections
-            - Sentence structure and flow improvements
-            - Character consistency and development
-            - Plot coherence and pacing
-            - Dialogue naturalness and effectiveness
-            - Overall readability and engagement
-            
-            Save the edited version as '{story_title}_final.md'""",
+            description=_CREATIVE_WRITING_EDITING_TASK_DESCRIPTION,
             agent=editor,
             expected_output="Polished, publication-ready story saved to file",
             context=[writing_task]
@@ -316,7 +617,7 @@ class CrewFactory:
             agents=[planner, writer, editor],
             tasks=[planning_task, writing_task, editing_task],
             process=Process.sequential,
-            verbose=config.get("verbose", self.settings.crew.verbose),
+            verbose=verbose,
             memory=config.get("memory", self.settings.crew.memory_enabled)
         )
     
@@ -339,7 +640,7 @@ class CrewFactory:
         Returns:
             List of crew type names
         """
-        return ["research", "content_analysis", "creative_writing"]
+        return [name for name in self._CREW_BUILDERS if name not in self._PLANNED_CREWS]
     
     def get_crew_description(self, crew_type: str) -> str:
         """
@@ -2,30 +2,109 @@
 File utilities for AI Portfolio project.
 """
 
+import atexit
 import os
-import json
-import csv
-import hashlib
+import logging
+import stat as stat_module
+import time
+import weakref
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union, TextIO
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union, TextIO
 from datetime import datetime
 
-from ..config.settings import Settings
+try:
+    import blake3
+except ImportError:  # optional: pip install ai-portfolio[performance]
+    blake3 = None
+
+try:
+    import orjson
+    _HAS_ORJSON = True
+except ImportError:  # optional: pip install ai-portfolio[performance]
+    _HAS_ORJSON = False
+
+from ..config.settings import Settings, get_settings
 from .logging_utils import get_logger
 
+# Default read buffer for hashing; large reads keep the Python loop and
+# syscall count low
+_HASH_BUFFER_SIZE = 1 << 20
+
+# Inputs at least this large are hashed on multiple threads by blake3
+_BLAKE3_THREADING_MIN = 1 << 20
+
+# Files at least this large are memory-mapped and hashed in one update() call
+# instead of being copied through a read buffer
+_MMAP_HASH_MIN = 8 << 20
+
+# safe_filename: invalid characters become '_', then runs of '_' collapse
+_INVALID_FILENAME_TRANS = str.maketrans({c: '_' for c in '<>:"/\\|?*'})
+
+# write_json_file(use_orjson=True): orjson writes datetimes/dataclasses
+# natively; pass them through to default=str as the stdlib encoder would
+_ORJSON_WRITE_OPTS = (
+    orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+    if _HAS_ORJSON else 0
+)
+
+# read_text_file warns above this size; iter_text_file streams instead
+_LARGE_TEXT_FILE = 64 << 20
+_TEXT_CHUNK_SIZE = 1 << 20
+
+_BYTE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
+# cleanup_old_files deletes matches in batches of this many paths
+_UNLINK_BATCH = 1024
+
+# Persisted hash cache, stored under Settings.cache_dir
+_HASH_CACHE_FILE = "file_hashes.json"
+
+# (resolved path, size, mtime_ns, algorithm)
+_HashKey = Tuple[str, int, int, str]
+
+# Live FileUtils instances created with persist_hash_cache=True; held weakly
+# so a single exit hook doesn't keep every instance alive
+_persisted_instances: "weakref.WeakSet[FileUtils]" = weakref.WeakSet()
+
+
+def _save_persisted_hash_caches() -> None:
+    """Save the hash cache of every live persist-enabled FileUtils instance."""
+    for instance in list(_persisted_instances):
+        instance.save_hash_cache()
+
+
+atexit.register(_save_persisted_hash_caches)
+
+
+def _iso(timestamp: float) -> str:
+    """Format a POSIX timestamp as local-time ISO-8601, at second resolution."""
+    t = time.localtime(timestamp)
+    return (
+        f"{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d}"
+        f"T{t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}"
+    )
+
 
 class FileUtils:
     """Utility class for file operations."""
     
-    def __init__(self, settings: Optional[Settings] = None):
+    def __init__(self, settings: Optional[Settings] = None, persist_hash_cache: bool = False):
         """
         Initialize file utilities.
         
         Args:
             settings: Application settings
+            persist_hash_cache: Load the file hash cache from Settings.cache_dir
+                and save it back at interpreter exit, if this instance is
+                still alive then
         """
-        self.settings = settings or Settings()
+        self.settings = settings or get_settings()
         self.logger = get_logger("file_utils")
+        self._hash_cache: Dict[_HashKey, str] = {}
+        
+        if persist_hash_cache:
+            self.load_hash_cache()
+            _persisted_instances.add(self)
     
     @staticmethod
     def ensure_directory(directory: Union[str, Path]) -> Path:
@@ -54,16 +133,13 @@ class FileUtils:
         Returns:
             Safe filename
         """
-        # Replace invalid characters
-        invalid_chars = '<>:"/\\|?*'
-        safe_name = filename
+        import re
         
-        for char in invalid_chars:
-            safe_name = safe_name.replace(char, '_')
+        # Replace invalid characters in a single pass
+        safe_name = filename.translate(_INVALID_FILENAME_TRANS)
         
-        # Remove multiple consecutive underscores
-        while '__' in safe_name:
-            safe_name = safe_name.replace('__', '_')
+        # Remove multiple consecutive underscores (re caches the compiled pattern)
+        safe_name = re.sub(r'_{2,}', '_', safe_name)
         
         # Trim to max length
         if len(safe_name) > max_length:
@@ -74,25 +150,185 @@ class FileUtils:
         return safe_name.strip('_')
     
     @staticmethod
-    def get_file_hash(filepath: Union[str, Path], algorithm: str = 'md5') -> str:
+    def get_file_hash(
+        filepath: Union[str, Path],
+        algorithm: str = 'md5',
+        buffer_size: int = _HASH_BUFFER_SIZE
+    ) -> str:
         """
         Calculate hash of a file.
         
         Args:
             filepath: Path to file
-            algorithm: Hashing algorithm ('md5', 'sha1', 'sha256')
+            algorithm: Hashing algorithm ('md5', 'sha1', 'sha256', or 'blake3'
+                if the blake3 package is installed)
+            buffer_size: Read buffer size in bytes (see Settings.hash_buffer_size);
+                only used on interpreters without hashlib.file_digest
             
         Returns:
             File hash as hexadecimal string
         """
-        hash_func = hashlib.new(algorithm)
+        if algorithm == 'blake3':
+            return FileUtils._blake3_hash(filepath, buffer_size)
         
-        with open(filepath, 'rb') as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                hash_func.update(chunk)
+        import hashlib
+        
+        with open(filepath, 'rb', buffering=0) as f:
+            if os.fstat(f.fileno()).st_size >= _MMAP_HASH_MIN:
+                import mmap
+                
+                hash_func = hashlib.new(algorithm)
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    if hasattr(mm, 'madvise'):
+                        mm.madvise(mmap.MADV_SEQUENTIAL)
+                    hash_func.update(mm)
+                return hash_func.hexdigest()
+            
+            # Python 3.11+ runs the whole read/update loop in C
+            if hasattr(hashlib, 'file_digest'):
+                return hashlib.file_digest(f, algorithm).hexdigest()
+            
+            hash_func = hashlib.new(algorithm)
+            
+            # One reusable buffer; unbuffered reads go straight into it
+            buf = bytearray(buffer_size)
+            view = memoryview(buf)
+            
+            while True:
+                n = f.readinto(buf)
+                if not n:
+                    break
+                hash_func.update(view[:n])
         
         return hash_func.hexdigest()
     
+    def get_cached_file_hash(self, filepath: Union[str, Path], algorithm: str = 'md5') -> str:
+        """
+        Calculate hash of a file, reusing the result while the file is unchanged.
+        
+        Results are keyed on the file's resolved path, size and mtime, so
+        re-hashing an unmodified file costs a single stat() call.
+        Caching is skipped when Settings.cache_enabled is off.
+        
+        Args:
+            filepath: Path to file
+            algorithm: Hashing algorithm (see get_file_hash)
+            
+        Returns:
+            File hash as hexadecimal string
+        """
+        if not self.settings.cache_enabled:
+            return self.get_file_hash(filepath, algorithm, self.settings.hash_buffer_size)
+        
+        st = os.stat(filepath)
+        key = (str(Path(filepath).resolve()), st.st_size, st.st_mtime_ns, algorithm)
+        
+        digest = self._hash_cache.get(key)
+        if digest is None:
+            digest = self.get_file_hash(filepath, algorithm, self.settings.hash_buffer_size)
+            self._hash_cache[key] = digest
+        
+        return digest
+    
+    def get_file_hashes(
+        self,
+        paths: Iterable[Union[str, Path]],
+        algorithm: str = 'md5',
+        workers: Optional[int] = None
+    ) -> Dict[Union[str, Path], str]:
+        """
+        Calculate hashes of many files concurrently.
+        
+        hashlib releases the GIL while hashing, so threads overlap both the
+        file reads and the hash computation. Unchanged files are served from
+        the hash cache (see get_cached_file_hash).
+        
+        Args:
+            paths: Paths to files
+            algorithm: Hashing algorithm (see get_file_hash)
+            workers: Number of worker threads (defaults to 2x CPU count, max 32)
+            
+        Returns:
+            Dictionary mapping each path to its hash
+        """
+        paths = list(paths)
+        if not paths:
+            return {}
+        
+        from concurrent.futures import ThreadPoolExecutor
+        
+        workers = workers or min(32, (os.cpu_count() or 4) * 2)
+        
+        with ThreadPoolExecutor(max_workers=min(workers, len(paths))) as executor:
+            hashes = executor.map(
+                lambda path: self.get_cached_file_hash(path, algorithm),
+                paths
+            )
+            return dict(zip(paths, hashes))
+    
+    @staticmethod
+    def _blake3_hash(filepath: Union[str, Path], buffer_size: int) -> str:
+        """Hash a file with BLAKE3 (SIMD, multithreaded for large files)."""
+        if blake3 is None:
+            raise ValueError("blake3 hashing requires the 'blake3' package")
+        
+        file_size = os.stat(filepath).st_size
+        if file_size >= _BLAKE3_THREADING_MIN:
+            hash_func = blake3.blake3(max_threads=blake3.blake3.AUTO)
+        else:
+            hash_func = blake3.blake3()
+        
+        if file_size >= _MMAP_HASH_MIN:
+            # blake3 maps the file itself and hashes it across threads
+            hash_func.update_mmap(filepath)
+            return hash_func.hexdigest()
+        
+        buf = bytearray(buffer_size)
+        view = memoryview(buf)
+        
+        with open(filepath, 'rb', buffering=0) as f:
+            while True:
+                n = f.readinto(buf)
+                if not n:
+                    break
+                hash_func.update(view[:n])
+        
+        return hash_func.hexdigest()
+    
+    def save_hash_cache(self) -> None:
+        """Write the file hash cache to Settings.cache_dir."""
+        if not self._hash_cache:
+            return
+        
+        entries = [[*key, digest] for key, digest in self._hash_cache.items()]
+        try:
+            self.write_json_file(
+                {"entries": entries},
+                Path(self.settings.cache_dir) / _HASH_CACHE_FILE,
+                compact=True,
+                # Plain str/int entries, only ever read back by load_hash_cache
+                use_orjson=True
+            )
+        except OSError:
+            # Best-effort; a missing cache only costs a re-hash
+            pass
+    
+    def load_hash_cache(self) -> None:
+        """Merge previously saved file hashes from Settings.cache_dir."""
+        import json
+        
+        cache_path = Path(self.settings.cache_dir) / _HASH_CACHE_FILE
+        
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            for path, size, mtime_ns, algorithm, digest in data["entries"]:
+                self._hash_cache[(path, size, mtime_ns, algorithm)] = digest
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            self.logger.warning(f"Ignoring unreadable hash cache {cache_path}: {e}")
+    
     def validate_file_type(self, filepath: Union[str, Path]) -> bool:
         """
         Validate if file type is allowed.
@@ -121,20 +357,39 @@ class FileUtils:
         file_size = Path(filepath).stat().st_size
         return file_size <= self.settings.max_file_size
     
-    def read_text_file(self, filepath: Union[str, Path], encoding: str = 'utf-8') -> str:
+    def read_text_file(
+        self,
+        filepath: Union[str, Path],
+        encoding: str = 'utf-8',
+        errors: str = 'strict'
+    ) -> str:
         """
         Read text file content.
         
+        The file is read as bytes and decoded in one call, which is faster than
+        decoding incrementally through a text-mode file. Newlines are
+        normalized to '\\n' as in text mode. For very large files prefer
+        iter_text_file, which does not hold the whole content in memory.
+        
         Args:
             filepath: Path to file
             encoding: File encoding
+            errors: Decoding error handling ('strict', 'replace', ...)
             
         Returns:
             File content as string
         """
         try:
-            with open(filepath, 'r', encoding=encoding) as f:
-                content = f.read()
+            data = Path(filepath).read_bytes()
+            if len(data) > _LARGE_TEXT_FILE:
+                self.logger.warning(
+                    f"Read {self._format_bytes(len(data))} text file {filepath} into memory; "
+                    f"consider iter_text_file()"
+                )
+            
+            content = data.decode(encoding, errors)
+            if '\r' in content:
+                content = content.replace('\r\n', '\n').replace('\r', '\n')
             
             self.logger.debug(f"Read text file: {filepath}")
             return content
@@ -143,6 +398,32 @@ class FileUtils:
             self.logger.error(f"Error reading file {filepath}: {e}")
             raise
     
+    def iter_text_file(
+        self,
+        filepath: Union[str, Path],
+        encoding: str = 'utf-8',
+        errors: str = 'strict',
+        chunk_size: int = _TEXT_CHUNK_SIZE
+    ) -> Iterator[str]:
+        """
+        Read a text file incrementally.
+        
+        Args:
+            filepath: Path to file
+            encoding: File encoding
+            errors: Decoding error handling ('strict', 'replace', ...)
+            chunk_size: Number of characters per chunk
+            
+        Yields:
+            Consecutive chunks of the file's content
+        """
+        with open(filepath, 'r', encoding=encoding, errors=errors) as f:
+            while True:
+                chunk = f.read(chunk_size)
+                if not chunk:
+                    break
+                yield chunk
+    
     def write_text_file(
         self,
         content: str,
@@ -185,8 +466,18 @@ class FileUtils:
             Parsed JSON data
         """
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            if _HAS_ORJSON:
+                raw = Path(filepath).read_bytes()
+                try:
+                    data = orjson.loads(raw)
+                except orjson.JSONDecodeError:
+                    # Stdlib accepts a few extensions orjson rejects (NaN, BOM)
+                    import json
+                    data = json.loads(raw)
+            else:
+                import json
+                with open(filepath, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
             
             self.logger.debug(f"Read JSON file: {filepath}")
             return data
@@ -200,7 +491,9 @@ class FileUtils:
         data: Dict[str, Any],
         filepath: Union[str, Path],
         indent: int = 2,
-        ensure_dir: bool = True
+        ensure_dir: bool = True,
+        compact: bool = False,
+        use_orjson: bool = False
     ) -> None:
         """
         Write data to JSON file.
@@ -210,15 +503,43 @@ class FileUtils:
             filepath: Path to file
             indent: JSON indentation
             ensure_dir: Whether to create directory if it doesn't exist
+            compact: Write minified JSON (no indentation or spaces), for
+                machine-consumed files such as caches and metrics dumps
+            use_orjson: Encode with orjson, if installed, for compact or
+                2-space output. Only for plain str/int/bool/list/dict data:
+                unlike json.dump, orjson writes NaN/Infinity as null, leaves
+                non-ASCII text unescaped, and encodes numpy scalars and enums
+                by value rather than through default=str.
         """
         file_path = Path(filepath)
         
         if ensure_dir:
             self.ensure_directory(file_path.parent)
         
+        if compact:
+            indent = None
+        separators = (',', ':') if compact else None
+        
         try:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=indent, default=str)
+            encoded = None
+            # orjson only supports 2-space indentation or none at all
+            if use_orjson and _HAS_ORJSON and (compact or indent == 2):
+                option = _ORJSON_WRITE_OPTS | (0 if compact else orjson.OPT_INDENT_2)
+                try:
+                    encoded = orjson.dumps(data, default=str, option=option)
+                except orjson.JSONEncodeError:
+                    # e.g. integers wider than 64 bits; let the stdlib handle it
+                    pass
+            
+            if encoded is not None:
+                with open(file_path, 'wb') as f:
+                    f.write(encoded)
+            else:
+                import json
+                
+                # Large buffer: json.dump emits many tiny writes
+                with open(file_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+                    json.dump(data, f, indent=indent, separators=separators, default=str)
             
             self.logger.debug(f"Wrote JSON file: {filepath}")
             
@@ -230,7 +551,8 @@ class FileUtils:
         self,
         filepath: Union[str, Path],
         delimiter: str = ',',
-        has_header: bool = True
+        has_header: bool = True,
+        fast: bool = False
     ) -> List[Dict[str, Any]]:
         """
         Read CSV file.
@@ -239,12 +561,22 @@ class FileUtils:
             filepath: Path to CSV file
             delimiter: CSV delimiter
             has_header: Whether CSV has header row
+            fast: Parse with pyarrow's multithreaded reader when installed;
+                rows have the same shape and string values as the csv module's
             
         Returns:
             List of dictionaries representing rows
         """
+        import csv
+        
         try:
-            rows = []
+            rows = None
+            if fast:
+                rows = self._read_csv_pyarrow(filepath, delimiter, has_header)
+            
+            if rows is not None:
+                self.logger.debug(f"Read CSV file: {filepath}")
+                return rows
             
             with open(filepath, 'r', encoding='utf-8') as f:
                 if has_header:
@@ -262,12 +594,40 @@ class FileUtils:
             self.logger.error(f"Error reading CSV file {filepath}: {e}")
             raise
     
+    def read_csv_lazy(
+        self,
+        filepath: Union[str, Path],
+        delimiter: str = ',',
+        has_header: bool = True
+    ):
+        """
+        Scan a CSV file lazily with polars, without materializing rows.
+        
+        Prefer this over read_csv_file for large files that are only filtered
+        or aggregated: nothing is read until the returned LazyFrame is
+        collected, and the data is stored column-wise rather than as one dict
+        per row. Requires the optional polars package.
+        
+        Args:
+            filepath: Path to CSV file
+            delimiter: CSV delimiter
+            has_header: Whether CSV has header row
+            
+        Returns:
+            polars.LazyFrame over the file
+        """
+        import polars as pl
+        
+        self.logger.debug(f"Scanning CSV file: {filepath}")
+        return pl.scan_csv(str(filepath), separator=delimiter, has_header=has_header)
+    
     def write_csv_file(
         self,
         data: List[Dict[str, Any]],
         filepath: Union[str, Path],
         delimiter: str = ',',
-        ensure_dir: bool = True
+        ensure_dir: bool = True,
+        fast: bool = False
     ) -> None:
         """
         Write data to CSV file.
@@ -277,6 +637,8 @@ class FileUtils:
             filepath: Path to file
             delimiter: CSV delimiter
             ensure_dir: Whether to create directory if it doesn't exist
+            fast: Write with pyarrow when installed; non-string values are
+                rendered by Arrow (e.g. booleans as true/false)
         """
         if not data:
             raise ValueError("No data to write")
@@ -286,13 +648,16 @@ class FileUtils:
         if ensure_dir:
             self.ensure_directory(file_path.parent)
         
+        import csv
+        
         try:
-            fieldnames = data[0].keys()
-            
-            with open(file_path, 'w', encoding='utf-8', newline='') as f:
-                writer = csv.DictWriter(f, fieldnames=fieldnames, delimiter=delimiter)
-                writer.writeheader()
-                writer.writerows(data)
+            if not (fast and self._write_csv_pyarrow(data, file_path, delimiter)):
+                fieldnames = data[0].keys()
+                
+                with open(file_path, 'w', encoding='utf-8', newline='') as f:
+                    writer = csv.DictWriter(f, fieldnames=fieldnames, delimiter=delimiter)
+                    writer.writeheader()
+                    writer.writerows(data)
             
             self.logger.debug(f"Wrote CSV file: {filepath}")
             
@@ -300,13 +665,80 @@ class FileUtils:
             self.logger.error(f"Error writing CSV file {filepath}: {e}")
             raise
     
-    def backup_file(self, filepath: Union[str, Path], backup_dir: Optional[str] = None) -> Path:
+    @staticmethod
+    def _read_csv_pyarrow(
+        filepath: Union[str, Path],
+        delimiter: str,
+        has_header: bool
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Read a CSV file with pyarrow; returns None if pyarrow is unavailable."""
+        try:
+            import pyarrow as pa
+            import pyarrow.csv as pacsv
+        except ImportError:
+            return None
+        
+        import csv
+        
+        # The first row gives the column names, so every column can be read
+        # as a string exactly like the csv module does
+        with open(filepath, 'r', encoding='utf-8', newline='') as f:
+            first_row = next(csv.reader(f, delimiter=delimiter), None)
+        
+        if first_row is None:
+            return []
+        
+        if has_header:
+            names = first_row
+            read_options = pacsv.ReadOptions()
+        else:
+            names = ["col_" + str(i) for i in range(len(first_row))]
+            read_options = pacsv.ReadOptions(column_names=names)
+        
+        table = pacsv.read_csv(
+            filepath,
+            read_options=read_options,
+            parse_options=pacsv.ParseOptions(delimiter=delimiter),
+            convert_options=pacsv.ConvertOptions(
+                column_types={name: pa.string() for name in names}
+            )
+        )
+        return table.to_pylist()
+    
+    @staticmethod
+    def _write_csv_pyarrow(data: List[Dict[str, Any]], file_path: Path, delimiter: str) -> bool:
+        """Write rows with pyarrow; returns False if pyarrow is unavailable."""
+        try:
+            import pyarrow as pa
+            import pyarrow.csv as pacsv
+        except ImportError:
+            return False
+        
+        table = pa.Table.from_pylist(data)
+        pacsv.write_csv(
+            table,
+            str(file_path),
+            write_options=pacsv.WriteOptions(delimiter=delimiter, quoting_style="needed")
+        )
+        return True
+    
+    def backup_file(
+        self,
+        filepath: Union[str, Path],
+        backup_dir: Optional[str] = None,
+        preserve_metadata: bool = True
+    ) -> Path:
         """
         Create a backup of a file.
         
+        File contents are copied with shutil.copyfile, which uses the kernel's
+        zero-copy path (sendfile on Linux, fcopyfile on macOS, CopyFile on
+        Windows) instead of bouncing data through Python buffers.
+        
         Args:
             filepath: Path to file to backup
             backup_dir: Directory to store backup (defaults to backups/)
+            preserve_metadata: Also copy permissions and timestamps
             
         Returns:
             Path to backup file
@@ -330,58 +762,171 @@ class FileUtils:
         
         # Copy file
         import shutil
-        shutil.copy2(file_path, backup_path)
+        shutil.copyfile(file_path, backup_path)
+        if preserve_metadata:
+            shutil.copystat(file_path, backup_path)
         
         self.logger.info(f"Created backup: {backup_path}")
         return backup_path
     
+    def iter_old_files(
+        self,
+        directory: Union[str, Path],
+        max_age_days: int,
+        pattern: str = "*"
+    ) -> Iterator[Path]:
+        """
+        Lazily find files older than a given age.
+        
+        Args:
+            directory: Directory to search
+            max_age_days: Maximum file age in days
+            pattern: File pattern to match
+            
+        Yields:
+            Paths of files last modified more than max_age_days ago
+        """
+        dir_path = Path(directory)
+        
+        if not dir_path.exists():
+            return
+        
+        cutoff_time = datetime.now().timestamp() - (max_age_days * 24 * 3600)
+        
+        for file_path, file_mtime in self._iter_files_with_mtime(dir_path, pattern):
+            if file_mtime < cutoff_time:
+                yield file_path
+    
     def cleanup_old_files(
         self,
         directory: Union[str, Path],
         max_age_days: int,
         pattern: str = "*",
-        dry_run: bool = False
-    ) -> List[Path]:
+        dry_run: bool = False,
+        return_list: bool = True
+    ) -> Union[List[Path], int]:
         """
         Clean up old files in a directory.
         
+        Files are streamed from iter_old_files and deleted in batches, so with
+        return_list=False memory use stays constant however many files match.
+        
         Args:
             directory: Directory to clean
             max_age_days: Maximum file age in days
             pattern: File pattern to match
             dry_run: If True, only return files that would be deleted
+            return_list: Return the list of files; if False, return only their count
             
         Returns:
-            List of files that were (or would be) deleted
+            List of files that were (or would be) deleted, or their count
         """
-        dir_path = Path(directory)
+        old_files = self.iter_old_files(directory, max_age_days, pattern)
+        matched: Optional[List[Path]] = [] if return_list else None
         
-        if not dir_path.exists():
-            return []
+        if dry_run:
+            count = 0
+            for file_path in old_files:
+                count += 1
+                if matched is not None:
+                    matched.append(file_path)
+            self.logger.info(f"Would delete {count} old files")
+        else:
+            count = self._unlink_files(old_files, matched)
+            self.logger.info(f"Deleted {count} old files")
         
-        cutoff_time = datetime.now().timestamp() - (max_age_days * 24 * 3600)
-        deleted_files = []
+        return matched if matched is not None else count
+    
+    def _unlink_files(
+        self,
+        file_paths: Iterable[Path],
+        collected: Optional[List[Path]] = None
+    ) -> int:
+        """
+        Delete files on a small thread pool so unlink() latency overlaps.
         
-        for file_path in dir_path.glob(pattern):
-            if file_path.is_file():
-                file_mtime = file_path.stat().st_mtime
-                
-                if file_mtime < cutoff_time:
-                    deleted_files.append(file_path)
-                    
-                    if not dry_run:
-                        try:
-                            file_path.unlink()
-                            self.logger.debug(f"Deleted old file: {file_path}")
-                        except Exception as e:
-                            self.logger.error(f"Error deleting file {file_path}: {e}")
+        Args:
+            file_paths: Files to delete, consumed in batches of _UNLINK_BATCH
+            collected: If given, every path handled is appended to it
+            
+        Returns:
+            Number of files handled (including any that failed to delete)
+        """
+        from concurrent.futures import ThreadPoolExecutor
+        from itertools import islice
+        
+        log_each = self.logger.isEnabledFor(logging.DEBUG)
+        
+        def unlink(file_path: Path) -> None:
+            try:
+                file_path.unlink()
+                if log_each:
+                    self.logger.debug("Deleted old file: %s", file_path)
+            except Exception as e:
+                self.logger.error(f"Error deleting file {file_path}: {e}")
+        
+        count = 0
+        file_paths = iter(file_paths)
+        
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            while True:
+                batch = list(islice(file_paths, _UNLINK_BATCH))
+                if not batch:
+                    break
+                # Drain the iterator so every unlink in the batch has run
+                for _ in executor.map(unlink, batch):
+                    pass
+                count += len(batch)
+                if collected is not None:
+                    collected.extend(batch)
+        
+        return count
+    
+    @staticmethod
+    def _iter_files_with_mtime(dir_path: Path, pattern: str) -> Iterator[Tuple[Path, float]]:
+        """
+        Yield (path, mtime) for files matching a glob pattern under dir_path.
         
-        if dry_run:
-            self.logger.info(f"Would delete {len(deleted_files)} old files")
-        else:
-            self.logger.info(f"Deleted {len(deleted_files)} old files")
+        Plain name patterns ("*.log") and recursive ones ("**/*.log") are
+        matched against os.scandir entries, whose type information comes from
+        the directory listing itself; other patterns fall back to Path.glob.
+        """
+        recursive = pattern.startswith("**/")
+        name_pattern = pattern[3:] if recursive else pattern
+        
+        if "/" in name_pattern or os.sep in name_pattern or "**" in name_pattern:
+            for file_path in dir_path.glob(pattern):
+                if file_path.is_file():
+                    yield file_path, file_path.stat().st_mtime
+            return
+        
+        import fnmatch
+        
+        match_all = name_pattern == "*"
         
-        return deleted_files
+        if recursive:
+            # os.walk is built on os.scandir
+            for root, _dirs, files in os.walk(dir_path):
+                for name in files:
+                    if match_all or fnmatch.fnmatch(name, name_pattern):
+                        file_path = os.path.join(root, name)
+                        try:
+                            st = os.stat(file_path)
+                        except OSError:
+                            # Dangling symlink or file removed mid-walk
+                            continue
+                        # os.walk lists fifos, sockets and devices as files too
+                        if stat_module.S_ISREG(st.st_mode):
+                            yield Path(file_path), st.st_mtime
+            return
+        
+        with os.scandir(dir_path) as entries:
+            for entry in entries:
+                if not entry.is_file():
+                    continue
+                if not match_all and not fnmatch.fnmatch(entry.name, name_pattern):
+                    continue
+                yield Path(entry.path), entry.stat().st_mtime
     
     @staticmethod
     def get_file_info(filepath: Union[str, Path]) -> Dict[str, Any]:
@@ -392,14 +937,16 @@ class FileUtils:
             filepath: Path to file
             
         Returns:
-            Dictionary with file information
+            Dictionary with file information; the *_ts entries are the raw
+            float timestamps behind the formatted created/modified/accessed
         """
         file_path = Path(filepath)
         
-        if not file_path.exists():
-            raise FileNotFoundError(f"File not found: {filepath}")
-        
-        stat = file_path.stat()
+        # One stat() answers exists, is_file and is_dir as well
+        try:
+            stat = file_path.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"File not found: {filepath}") from None
         
         return {
             "name": file_path.name,
@@ -407,11 +954,14 @@ class FileUtils:
             "suffix": file_path.suffix,
             "size": stat.st_size,
             "size_human": FileUtils._format_bytes(stat.st_size),
-            "created": datetime.fromtimestamp(stat.st_ctime).isoformat(),
-            "modified": datetime.fromtimestamp(stat.st_mtime).isoformat(),
-            "accessed": datetime.fromtimestamp(stat.st_atime).isoformat(),
-            "is_file": file_path.is_file(),
-            "is_directory": file_path.is_dir(),
+            "created": _iso(stat.st_ctime),
+            "modified": _iso(stat.st_mtime),
+            "accessed": _iso(stat.st_atime),
+            "created_ts": stat.st_ctime,
+            "modified_ts": stat.st_mtime,
+            "accessed_ts": stat.st_atime,
+            "is_file": stat_module.S_ISREG(stat.st_mode),
+            "is_directory": stat_module.S_ISDIR(stat.st_mode),
             "absolute_path": str(file_path.absolute()),
             "parent": str(file_path.parent)
         }
@@ -419,8 +969,8 @@ class FileUtils:
     @staticmethod
     def _format_bytes(bytes_size: int) -> str:
         """Format bytes size in human readable format."""
-        for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-            if bytes_size < 1024.0:
-                return f"{bytes_size:.1f} {unit}"
-            bytes_size /= 1024.0
-        return f"{bytes_size:.1f} PB"
\ No newline at end of file
+        if bytes_size < 1024:
+            return f"{bytes_size:.1f} B"
+        # Each unit is 10 more bits, so the bit length picks it directly
+        i = min((int(bytes_size).bit_length() - 1) // 10, len(_BYTE_UNITS) - 1)
+        return f"{bytes_size / (1 << (10 * i)):.1f} {_BYTE_UNITS[i]}"
\ No newline at end of file
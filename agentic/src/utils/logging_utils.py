@@ -2,13 +2,130 @@
 Enhanced logging utilities for AI Portfolio project.
 """
 
+import atexit
+import copy
+import enum
 import logging
 import logging.config
+import logging.handlers
 import os
+import queue
 import json
+import time
 from pathlib import Path
-from typing import Optional, Dict, Any
-from datetime import datetime
+from typing import Optional, Dict, Any, List, Tuple, Union
+
+try:
+    import yaml
+    # libyaml's C parser when available, else the pure-Python one
+    _YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+except ImportError:
+    yaml = None
+
+
+class CrewStatus(enum.IntEnum):
+    """Crew execution status codes for log_crew_execution()."""
+    
+    STARTED = 0
+    COMPLETED = 1
+    FAILED = 2
+
+
+# Status names as written to log records, and the reverse lookup that lets
+# callers keep passing plain strings
+_CREW_STATUS_NAMES = {status: status.name.lower() for status in CrewStatus}
+_CREW_STATUS_BY_NAME = {name: status for status, name in _CREW_STATUS_NAMES.items()}
+
+
+# (epoch second, formatted timestamp) for the most recent _fast_ts() call;
+# swapped as one tuple so concurrent callers never see a torn pair
+_ts_cache = (0, "")
+
+
+def _fast_ts() -> str:
+    """
+    Return the current local time as an ISO-8601 string, at second resolution.
+    
+    The formatted string is reused until the wall-clock second changes, so
+    bursts of log calls pay for a single strftime.
+    """
+    global _ts_cache
+    now = int(time.time())
+    cached_sec, cached_str = _ts_cache
+    if now != cached_sec:
+        cached_str = time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(now))
+        _ts_cache = (now, cached_str)
+    return cached_str
+
+
+# Parsed YAML logging configs keyed by (path, mtime_ns)
+_LOG_CFG_CACHE: Dict[Tuple[str, int], Dict[str, Any]] = {}
+
+
+def _load_yaml_config(config_path: Path) -> Dict[str, Any]:
+    """
+    Parse a YAML logging config, reusing the result while the file is unchanged.
+    
+    Args:
+        config_path: Path to the YAML file
+        
+    Returns:
+        A fresh copy of the parsed configuration (dictConfig may modify it)
+    """
+    key = (str(config_path), config_path.stat().st_mtime_ns)
+    config = _LOG_CFG_CACHE.get(key)
+    if config is None:
+        with open(config_path, 'rb') as f:
+            # _YamlLoader is CSafeLoader or SafeLoader, never the unsafe Loader
+            config = yaml.load(f, Loader=_YamlLoader)  # nosec B506
+        _LOG_CFG_CACHE[key] = config
+    return copy.deepcopy(config)
+
+
+# Background thread that drains the root QueueHandler into the real handlers
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+_queue_handler: Optional[logging.handlers.QueueHandler] = None
+
+
+def _stop_queue_listener() -> None:
+    """Flush and stop the active queue listener, handing its handlers back to root."""
+    global _queue_listener, _queue_handler
+    if _queue_listener is None:
+        return
+    
+    _queue_listener.stop()
+    root = logging.getLogger()
+    root.removeHandler(_queue_handler)
+    for handler in _queue_listener.handlers:
+        root.addHandler(handler)
+    
+    _queue_listener = None
+    _queue_handler = None
+
+
+def _install_queue_handler(root: logging.Logger, handlers: List[logging.Handler]) -> None:
+    """
+    Route root logging through a queue so handler I/O runs on a background thread.
+    
+    Args:
+        root: Root logger
+        handlers: Handlers that should receive the records (removed from root)
+    """
+    global _queue_listener, _queue_handler
+    
+    log_queue = queue.SimpleQueue()
+    for handler in handlers:
+        root.removeHandler(handler)
+    _queue_handler = logging.handlers.QueueHandler(log_queue)
+    root.addHandler(_queue_handler)
+    
+    _queue_listener = logging.handlers.QueueListener(
+        log_queue, *handlers, respect_handler_level=True
+    )
+    _queue_listener.start()
+
+
+atexit.register(_stop_queue_listener)
 
 
 def setup_logging(
@@ -38,23 +155,35 @@ def setup_logging(
     
     config_path = Path(config_path)
     
-    if config_path.exists() and config_path.suffix.lower() == '.yaml':
-        import yaml
-        with open(config_path, 'r') as f:
-            config = yaml.safe_load(f.read())
+    # Drain records queued under any previous configuration before replacing it
+    _stop_queue_listener()
+    root = logging.getLogger()
+    
+    if yaml is not None and config_path.exists() and config_path.suffix.lower() == '.yaml':
+        config = _load_yaml_config(config_path)
         logging.config.dictConfig(config)
     else:
-        # Fallback to basic configuration
-        logging.basicConfig(
-            level=default_level,
-            format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-            datefmt="%Y-%m-%d %H:%M:%S",
-            handlers=[
+        # Fallback to basic configuration; as with basicConfig(), an already
+        # configured root logger is left alone
+        if not root.handlers:
+            formatter = logging.Formatter(
+                "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+                datefmt="%Y-%m-%d %H:%M:%S"
+            )
+            handlers = [
                 logging.StreamHandler(),
                 logging.FileHandler(logs_dir / "ai_portfolio.log")
             ]
-        )
+            for handler in handlers:
+                handler.setFormatter(formatter)
+                root.addHandler(handler)
+            root.setLevel(default_level)
         logging.warning(f"Logging config file not found at {config_path}. Using basic configuration.")
+    
+    # Callers only enqueue records; a listener thread does the blocking I/O
+    handlers = list(root.handlers)
+    if handlers and not any(isinstance(h, logging.handlers.QueueHandler) for h in handlers):
+        _install_queue_handler(root, handlers)
 
 
 def get_logger(name: str) -> logging.Logger:
@@ -80,39 +209,52 @@ def log_agent_action(agent_name: str, action: str, details: Optional[Dict[str, A
         details: Additional details about the action
     """
     logger = get_logger("agentic.agents")
+    if not logger.isEnabledFor(logging.INFO):
+        return
     
     log_data = {
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": _fast_ts(),
         "agent": agent_name,
         "action": action,
         "details": details or {}
     }
     
-    logger.info(f"Agent {agent_name} - {action}", extra=log_data)
+    logger.info("Agent %s - %s", agent_name, action, extra=log_data)
 
 
-def log_crew_execution(crew_name: str, status: str, metrics: Optional[Dict[str, Any]] = None) -> None:
+def log_crew_execution(
+    crew_name: str,
+    status: Union[CrewStatus, str],
+    metrics: Optional[Dict[str, Any]] = None
+) -> None:
     """
     Log crew execution status and metrics.
     
     Args:
         crew_name: Name of the crew
-        status: Execution status (started, completed, failed, etc.)
+        status: Execution status, a CrewStatus or its name (started, completed,
+            failed); other strings are logged as-is
         metrics: Execution metrics (duration, tasks completed, etc.)
     """
+    if status.__class__ is CrewStatus:
+        status_name = _CREW_STATUS_NAMES[status]
+    else:
+        status_name = status
+        status = _CREW_STATUS_BY_NAME.get(status, status)
+    
     logger = get_logger("agentic.crews")
+    level = logging.ERROR if status is CrewStatus.FAILED else logging.INFO
+    if not logger.isEnabledFor(level):
+        return
     
     log_data = {
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": _fast_ts(),
         "crew": crew_name,
-        "status": status,
+        "status": status_name,
         "metrics": metrics or {}
     }
     
-    if status == "failed":
-        logger.error(f"Crew {crew_name} - {status}", extra=log_data)
-    else:
-        logger.info(f"Crew {crew_name} - {status}", extra=log_data)
+    logger.log(level, "Crew %s - %s", crew_name, status_name, extra=log_data)
 
 
 def log_task_progress(task_name: str, progress: float, details: Optional[str] = None) -> None:
@@ -125,15 +267,17 @@ def log_task_progress(task_name: str, progress: float, details: Optional[str] =
         details: Additional progress details
     """
     logger = get_logger("agentic.tasks")
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
     
     log_data = {
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": _fast_ts(),
         "task": task_name,
         "progress": progress,
         "details": details
     }
     
-    logger.debug(f"Task {task_name} - {progress:.1%}", extra=log_data)
+    logger.debug("Task %s - %.1f%%", task_name, progress * 100, extra=log_data)
 
 
 def log_performance_metrics(component: str, metrics: Dict[str, Any]) -> None:
@@ -145,14 +289,29 @@ def log_performance_metrics(component: str, metrics: Dict[str, Any]) -> None:
         metrics: Performance metrics dictionary
     """
     logger = get_logger("performance")
+    if not logger.isEnabledFor(logging.INFO):
+        return
     
     log_data = {
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": _fast_ts(),
         "component": component,
         "metrics": metrics
     }
     
-    logger.info(f"Performance metrics for {component}", extra=log_data)
+    logger.info("Performance metrics for %s", component, extra=log_data)
+
+
+class _StructuredAdapter(logging.LoggerAdapter):
+    """LoggerAdapter that fills in fixed structured fields without overriding per-call ones."""
+    
+    def process(self, msg, kwargs):
+        extra = kwargs.get("extra")
+        if extra is None:
+            kwargs["extra"] = self.extra
+        else:
+            for key, value in self.extra.items():
+                extra.setdefault(key, value)
+        return msg, kwargs
 
 
 class StructuredLogger:
@@ -167,6 +326,8 @@ class StructuredLogger:
         """
         self.logger = get_logger(name)
         self.name = name
+        # Fields that are the same for every event, bound once
+        self._adapter = _StructuredAdapter(self.logger, {"logger_name": name})
     
     def log_event(
         self,
@@ -184,14 +345,16 @@ class StructuredLogger:
             level: Log level
             **kwargs: Additional structured data
         """
+        if not self.logger.isEnabledFor(level):
+            return
+        
         extra_data = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _fast_ts(),
             "event_type": event_type,
-            "logger_name": self.name,
             **kwargs
         }
         
-        self.logger.log(level, message, extra=extra_data)
+        self._adapter.log(level, message, extra=extra_data)
     
     def log_agent_event(self, agent_name: str, event: str, **kwargs) -> None:
         """Log an agent-specific event."""
@@ -2,55 +2,234 @@
 Performance monitoring utilities for CrewAI applications.
 """
 
+import sys
 import time
+import numpy as np
 import psutil
 import threading
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, Sequence, Tuple, Union
 from dataclasses import dataclass, field
 from datetime import datetime
-from collections import defaultdict
 
 from .logging_utils import get_logger, log_performance_metrics
 
+try:
+    import numba
+except ImportError:  # optional: pip install ai-portfolio[performance]
+    numba = None
 
-@dataclass
+try:
+    import orjson
+    _HAS_ORJSON = True
+except ImportError:  # optional: pip install ai-portfolio[performance]
+    _HAS_ORJSON = False
+
+
+# dataclass(slots=True) is only available on Python 3.10+
+_DATACLASS_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Samples kept per session: 24 hours at the default 1 s interval
+_SAMPLE_CAPACITY = 86400
+
+
+def _aggregate_loop(
+    durations: np.ndarray,
+    cpus: np.ndarray,
+    mems: np.ndarray
+) -> Tuple[float, float, float]:
+    """
+    Average session durations, CPU averages and memory peaks in one pass.
+    
+    Only finite durations (NaN marks an unfinished session) and positive CPU
+    and memory values count, as in get_global_metrics(). Plain loops so that
+    numba can compile it.
+    
+    Returns:
+        (average duration, average CPU usage, average peak memory), 0.0 where
+        there is nothing to average
+    """
+    dur_sum = cpu_sum = mem_sum = 0.0
+    dur_n = cpu_n = mem_n = 0
+    for i in range(durations.shape[0]):
+        d = durations[i]
+        if d == d:
+            dur_sum += d
+            dur_n += 1
+        c = cpus[i]
+        if c > 0:
+            cpu_sum += c
+            cpu_n += 1
+        m = mems[i]
+        if m > 0:
+            mem_sum += m
+            mem_n += 1
+    return (
+        dur_sum / dur_n if dur_n else 0.0,
+        cpu_sum / cpu_n if cpu_n else 0.0,
+        mem_sum / mem_n if mem_n else 0.0,
+    )
+
+
+def _aggregate_numpy(
+    durations: np.ndarray,
+    cpus: np.ndarray,
+    mems: np.ndarray
+) -> Tuple[float, float, float]:
+    """Vectorized fallback for _aggregate_loop when numba is unavailable."""
+    def mean(values: np.ndarray) -> float:
+        return float(values.mean()) if values.size else 0.0
+    
+    return (
+        mean(durations[~np.isnan(durations)]),
+        mean(cpus[cpus > 0]),
+        mean(mems[mems > 0]),
+    )
+
+
+# Compiled once and cached on disk, so later processes skip the JIT cost
+_aggregate_history = (
+    numba.njit(cache=True)(_aggregate_loop) if numba is not None else _aggregate_numpy
+)
+
+
+# eq=False: the generated __eq__ would compare the ndarray buffers, which
+# raises instead of returning a bool
+@dataclass(eq=False, **_DATACLASS_SLOTS)
 class PerformanceMetrics:
-    """Performance metrics data structure."""
+    """
+    Performance metrics data structure.
+    
+    CPU and memory samples live in fixed-size float32 ring buffers, so a
+    long session overwrites its oldest samples instead of growing without
+    bound. ``sample_count`` counts every sample taken, including overwritten
+    ones. A running CPU sum and memory peak over all samples are kept too,
+    so summaries never need to scan the buffers.
+    """
     
     start_time: float
     end_time: Optional[float] = None
     duration: Optional[float] = None
-    cpu_usage: List[float] = field(default_factory=list)
-    memory_usage: List[float] = field(default_factory=list)
+    cpu_usage: Union[np.ndarray, Sequence[float], None] = None
+    memory_usage: Union[np.ndarray, Sequence[float], None] = None
+    capacity: int = _SAMPLE_CAPACITY
+    sample_count: int = 0
     peak_memory: float = 0.0
     average_cpu: float = 0.0
     total_tasks: int = 0
     completed_tasks: int = 0
     failed_tasks: int = 0
+    _cpu_sum: float = field(default=0.0, init=False, repr=False)
+    _mem_peak: float = field(default=0.0, init=False, repr=False)
+    # Guards the sample buffers and running totals
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+    # to_dict() output, built once by finalize(); a finished session no longer changes
+    _cached_dict: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False)
+    
+    def __post_init__(self) -> None:
+        """Allocate the sample buffers, or adopt samples passed in."""
+        if self.cpu_usage is None and self.memory_usage is None:
+            self.cpu_usage = np.empty(self.capacity, dtype=np.float32)
+            self.memory_usage = np.empty(self.capacity, dtype=np.float32)
+            return
+        
+        cpu = self.cpu_usage if self.cpu_usage is not None else ()
+        memory = self.memory_usage if self.memory_usage is not None else ()
+        self.cpu_usage = np.asarray(cpu, dtype=np.float32)
+        self.memory_usage = np.asarray(memory, dtype=np.float32)
+        if not self.sample_count:
+            self.sample_count = min(len(self.cpu_usage), len(self.memory_usage))
+        self.capacity = max(len(self.cpu_usage), len(self.memory_usage), 1)
+        
+        stored = self._stored()
+        if stored:
+            self._cpu_sum = float(self.cpu_usage[:stored].sum(dtype=np.float64))
+            self._mem_peak = float(self.memory_usage[:stored].max())
+    
+    def add_sample(self, cpu_percent: float, memory_mb: float) -> None:
+        """
+        Record one CPU/memory sample, overwriting the oldest once full.
+        
+        Args:
+            cpu_percent: Process CPU usage in percent
+            memory_mb: Process resident memory in MB
+        """
+        with self._lock:
+            idx = self.sample_count % self.capacity
+            self.cpu_usage[idx] = cpu_percent
+            self.memory_usage[idx] = memory_mb
+            self.sample_count += 1
+            self._cpu_sum += cpu_percent
+            if memory_mb > self._mem_peak:
+                self._mem_peak = memory_mb
+    
+    def _stored(self) -> int:
+        """Number of valid samples currently held in the buffers."""
+        return min(self.sample_count, self.capacity)
+    
+    def compact(self) -> None:
+        """Release unused buffer space once no more samples will be added."""
+        with self._lock:
+            stored = self._stored()
+            if stored < self.capacity:
+                self.cpu_usage = self.cpu_usage[:stored].copy()
+                self.memory_usage = self.memory_usage[:stored].copy()
+                self.capacity = max(stored, 1)
     
     def finalize(self) -> None:
         """Finalize metrics calculation."""
         if self.end_time:
             self.duration = self.end_time - self.start_time
+        
+        with self._lock:
+            if self.sample_count:
+                self.average_cpu = self._cpu_sum / self.sample_count
+                self.peak_memory = self._mem_peak
+            self._cached_dict = self._as_dict(self.duration, self.average_cpu, self.peak_memory)
+    
+    def live_summary(self, now: float) -> Dict[str, Any]:
+        """
+        Summarize a session that is still running, in O(1).
+        
+        Args:
+            now: Current time, as from time.time()
             
-        if self.cpu_usage:
-            self.average_cpu = sum(self.cpu_usage) / len(self.cpu_usage)
-            
-        if self.memory_usage:
-            self.peak_memory = max(self.memory_usage)
+        Returns:
+            Metrics dictionary in the same shape as to_dict()
+        """
+        with self._lock:
+            count = self.sample_count
+            average_cpu = self._cpu_sum / count if count else 0.0
+            peak_memory = self._mem_peak
+        return self._as_dict(now - self.start_time, average_cpu, peak_memory)
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert metrics to dictionary."""
+        """
+        Convert metrics to dictionary.
+        
+        Once finalized, the same dictionary is returned on every call, so
+        callers must treat it as read-only.
+        """
+        if self._cached_dict is not None:
+            return self._cached_dict
+        return self._as_dict(self.duration, self.average_cpu, self.peak_memory)
+    
+    def _as_dict(
+        self,
+        duration: Optional[float],
+        average_cpu: float,
+        peak_memory: float
+    ) -> Dict[str, Any]:
+        """Build the metrics dictionary from the given summary values."""
         return {
-            "duration": self.duration,
-            "average_cpu": self.average_cpu,
-            "peak_memory": self.peak_memory,
+            "duration": duration,
+            "average_cpu": average_cpu,
+            "peak_memory": peak_memory,
             "total_tasks": self.total_tasks,
             "completed_tasks": self.completed_tasks,
             "failed_tasks": self.failed_tasks,
             "success_rate": self.completed_tasks / max(self.total_tasks, 1),
-            "cpu_samples": len(self.cpu_usage),
-            "memory_samples": len(self.memory_usage)
+            "cpu_samples": self.sample_count,
+            "memory_samples": self.sample_count
         }
 
 
@@ -67,13 +246,16 @@ class PerformanceMonitor:
         self.sample_interval = sample_interval
         self.logger = get_logger("performance_monitor")
         
-        # Active monitoring sessions
+        # Active monitoring sessions, all fed by one shared sampler thread.
+        # Each sampler generation gets its own stop event, so a sampler that
+        # is shutting down is never mistaken for a running one.
         self._active_sessions: Dict[str, PerformanceMetrics] = {}
-        self._monitoring_threads: Dict[str, threading.Thread] = {}
-        self._stop_events: Dict[str, threading.Event] = {}
+        # Guards the session dicts; reentrant so helpers can nest under it
+        self._sessions_lock = threading.RLock()
+        self._sampler_thread: Optional[threading.Thread] = None
+        self._sampler_stop: Optional[threading.Event] = None
         
-        # Global metrics
-        self._global_metrics = defaultdict(list)
+        # Completed sessions
         self._session_history: Dict[str, PerformanceMetrics] = {}
         
         self.logger.info("Performance monitor initialized")
@@ -85,27 +267,26 @@ class PerformanceMonitor:
         Args:
             session_id: Unique identifier for the monitoring session
         """
-        if session_id in self._active_sessions:
-            self.logger.warning(f"Session {session_id} is already being monitored")
-            return
-        
-        # Initialize metrics
-        metrics = PerformanceMetrics(start_time=time.time())
-        self._active_sessions[session_id] = metrics
-        
-        # Create stop event
-        stop_event = threading.Event()
-        self._stop_events[session_id] = stop_event
-        
-        # Start monitoring thread
-        monitor_thread = threading.Thread(
-            target=self._monitor_session,
-            args=(session_id, metrics, stop_event),
-            daemon=True
-        )
-        
-        self._monitoring_threads[session_id] = monitor_thread
-        monitor_thread.start()
+        with self._sessions_lock:
+            if session_id in self._active_sessions:
+                self.logger.warning(f"Session {session_id} is already being monitored")
+                return
+            
+            # Initialize metrics
+            self._active_sessions[session_id] = PerformanceMetrics(start_time=time.time())
+            
+            # Start the shared sampler if no live generation is running
+            if self._sampler_stop is None or self._sampler_stop.is_set():
+                stop_event = threading.Event()
+                sampler = threading.Thread(
+                    target=self._sample_loop,
+                    args=(stop_event,),
+                    name="performance-sampler",
+                    daemon=True
+                )
+                self._sampler_stop = stop_event
+                self._sampler_thread = sampler
+                sampler.start()
         
         self.logger.info(f"Started monitoring session: {session_id}")
     
@@ -119,32 +300,24 @@ class PerformanceMonitor:
         Returns:
             Performance metrics dictionary
         """
-        if session_id not in self._active_sessions:
-            self.logger.warning(f"Session {session_id} is not being monitored")
-            return None
-        
-        # Stop monitoring thread
-        stop_event = self._stop_events.get(session_id)
-        if stop_event:
-            stop_event.set()
-        
-        # Wait for thread to finish
-        monitor_thread = self._monitoring_threads.get(session_id)
-        if monitor_thread and monitor_thread.is_alive():
-            monitor_thread.join(timeout=5.0)
-        
-        # Finalize metrics
-        metrics = self._active_sessions[session_id]
-        metrics.end_time = time.time()
-        metrics.finalize()
-        
-        # Store in history
-        self._session_history[session_id] = metrics
-        
-        # Clean up
-        self._active_sessions.pop(session_id, None)
-        self._monitoring_threads.pop(session_id, None)
-        self._stop_events.pop(session_id, None)
+        with self._sessions_lock:
+            metrics = self._active_sessions.pop(session_id, None)
+            if metrics is None:
+                self.logger.warning(f"Session {session_id} is not being monitored")
+                return None
+            
+            # Signal the shared sampler once its last session ends. It's a daemon
+            # that exits on its own at its next wakeup, so it isn't joined here:
+            # crew completion shouldn't wait out a sampling interval.
+            if not self._active_sessions and self._sampler_stop is not None:
+                self._sampler_stop.set()
+                self._sampler_thread = None
+            
+            # Finalize metrics and store in history
+            metrics.end_time = time.time()
+            metrics.finalize()
+            metrics.compact()
+            self._session_history[session_id] = metrics
         
         # Log metrics
         metrics_dict = metrics.to_dict()
@@ -153,45 +326,59 @@ class PerformanceMonitor:
         self.logger.info(f"Stopped monitoring session: {session_id}")
         return metrics_dict
     
-    def _monitor_session(
-        self,
-        session_id: str,
-        metrics: PerformanceMetrics,
-        stop_event: threading.Event
-    ) -> None:
+    def _sample_loop(self, stop_event: threading.Event) -> None:
         """
-        Monitor system performance for a session.
+        Sample system performance once per interval for all active sessions.
         
         Args:
-            session_id: Session identifier
-            metrics: Metrics object to update
-            stop_event: Event to signal monitoring stop
+            stop_event: Event to signal this sampler generation to stop
         """
         process = psutil.Process()
-        
-        while not stop_event.is_set():
+        interval = self.sample_interval
+        # Bound once: the loop body then does local loads instead of repeated
+        # global and attribute lookups
+        oneshot = process.oneshot
+        cpu_percent_of = process.cpu_percent
+        memory_info_of = process.memory_info
+        monotonic = time.monotonic
+        is_stopped = stop_event.is_set
+        wait = stop_event.wait
+        sessions = self._active_sessions
+        sessions_lock = self._sessions_lock
+        # Samples are scheduled against fixed monotonic deadlines, so the time
+        # spent sampling doesn't stretch the interval
+        next_tick = monotonic()
+        
+        while not is_stopped():
             try:
-                # Sample CPU usage
-                cpu_percent = process.cpu_percent()
-                metrics.cpu_usage.append(cpu_percent)
-                
-                # Sample memory usage (in MB)
-                memory_info = process.memory_info()
-                memory_mb = memory_info.rss / 1024 / 1024
-                metrics.memory_usage.append(memory_mb)
+                # oneshot() lets both readings share one set of /proc reads
+                with oneshot():
+                    # Sample CPU usage
+                    cpu_percent = cpu_percent_of()
+                    
+                    # Sample memory usage (in MB)
+                    memory_mb = memory_info_of().rss / 1048576
                 
-                # Update global metrics
-                self._global_metrics[session_id].append({
-                    "timestamp": time.time(),
-                    "cpu": cpu_percent,
-                    "memory": memory_mb
-                })
+                # Fan the one sample out to every active session
+                with sessions_lock:
+                    # A stopped generation may still be mid-sample while its
+                    # successor runs; drop its reading instead of doubling up
+                    if is_stopped():
+                        break
+                    for metrics in sessions.values():
+                        metrics.add_sample(cpu_percent, memory_mb)
                 
             except (psutil.NoSuchProcess, psutil.AccessDenied) as e:
-                self.logger.warning(f"Error sampling performance for {session_id}: {e}")
+                self.logger.warning(f"Error sampling performance: {e}")
             
-            # Wait for next sample
-            stop_event.wait(self.sample_interval)
+            # Wait for next sample; if sampling overran a whole interval,
+            # skip the missed ticks rather than sampling in a burst
+            next_tick += interval
+            now = monotonic()
+            if next_tick < now:
+                next_tick = now
+            if wait(next_tick - now):
+                break
     
     def update_task_metrics(
         self,
@@ -209,17 +396,17 @@ class PerformanceMonitor:
             completed_tasks: Number of completed tasks
             failed_tasks: Number of failed tasks
         """
-        if session_id not in self._active_sessions:
-            return
-        
-        metrics = self._active_sessions[session_id]
-        
-        if total_tasks is not None:
-            metrics.total_tasks = total_tasks
-        if completed_tasks is not None:
-            metrics.completed_tasks = completed_tasks
-        if failed_tasks is not None:
-            metrics.failed_tasks = failed_tasks
+        with self._sessions_lock:
+            metrics = self._active_sessions.get(session_id)
+            if metrics is None:
+                return
+            
+            if total_tasks is not None:
+                metrics.total_tasks = total_tasks
+            if completed_tasks is not None:
+                metrics.completed_tasks = completed_tasks
+            if failed_tasks is not None:
+                metrics.failed_tasks = failed_tasks
     
     def get_session_metrics(self, session_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -231,25 +418,15 @@ class PerformanceMonitor:
         Returns:
             Current metrics dictionary
         """
-        if session_id in self._active_sessions:
-            metrics = self._active_sessions[session_id]
-            # Create temporary metrics for current state
-            temp_metrics = PerformanceMetrics(
-                start_time=metrics.start_time,
-                end_time=time.time(),
-                cpu_usage=metrics.cpu_usage.copy(),
-                memory_usage=metrics.memory_usage.copy(),
-                total_tasks=metrics.total_tasks,
-                completed_tasks=metrics.completed_tasks,
-                failed_tasks=metrics.failed_tasks
-            )
-            temp_metrics.finalize()
-            return temp_metrics.to_dict()
-        
-        elif session_id in self._session_history:
-            return self._session_history[session_id].to_dict()
+        with self._sessions_lock:
+            metrics = self._active_sessions.get(session_id)
+            if metrics is not None:
+                # Running totals: no sample copies, O(1) however long the session
+                return metrics.live_summary(time.time())
+            
+            metrics = self._session_history.get(session_id)
         
-        return None
+        return metrics.to_dict() if metrics is not None else None
     
     def get_global_metrics(self) -> Dict[str, Any]:
         """
@@ -258,41 +435,29 @@ class PerformanceMonitor:
         Returns:
             Global metrics dictionary
         """
-        total_sessions = len(self._session_history) + len(self._active_sessions)
-        active_sessions = len(self._active_sessions)
+        with self._sessions_lock:
+            active_sessions = len(self._active_sessions)
+            history = list(self._session_history.values())
+        count = len(history)
+        total_sessions = count + active_sessions
         
         # Calculate averages from completed sessions
-        completed_durations = [
-            m.duration for m in self._session_history.values()
-            if m.duration is not None
-        ]
-        
-        completed_cpu_averages = [
-            m.average_cpu for m in self._session_history.values()
-            if m.average_cpu > 0
-        ]
-        
-        completed_memory_peaks = [
-            m.peak_memory for m in self._session_history.values()
-            if m.peak_memory > 0
-        ]
+        durations = np.fromiter(
+            (np.nan if m.duration is None else m.duration for m in history),
+            dtype=np.float64,
+            count=count
+        )
+        cpus = np.fromiter((m.average_cpu for m in history), dtype=np.float64, count=count)
+        mems = np.fromiter((m.peak_memory for m in history), dtype=np.float64, count=count)
+        average_duration, average_cpu, average_memory = _aggregate_history(durations, cpus, mems)
         
         return {
             "total_sessions": total_sessions,
             "active_sessions": active_sessions,
-            "completed_sessions": len(self._session_history),
-            "average_duration": (
-                sum(completed_durations) / len(completed_durations)
-                if completed_durations else 0
-            ),
-            "average_cpu_usage": (
-                sum(completed_cpu_averages) / len(completed_cpu_averages)
-                if completed_cpu_averages else 0
-            ),
-            "average_peak_memory": (
-                sum(completed_memory_peaks) / len(completed_memory_peaks)
-                if completed_memory_peaks else 0
-            ),
+            "completed_sessions": count,
+            "average_duration": average_duration,
+            "average_cpu_usage": average_cpu,
+            "average_peak_memory": average_memory,
             "system_cpu_count": psutil.cpu_count(),
             "system_memory_total": psutil.virtual_memory().total / 1024 / 1024 / 1024,  # GB
         }
@@ -302,17 +467,20 @@ class PerformanceMonitor:
         Get performance history for all completed sessions.
         
         Returns:
-            Dictionary mapping session IDs to metrics
+            Dictionary mapping session IDs to their (shared, read-only) metrics
         """
-        return {
-            session_id: metrics.to_dict()
-            for session_id, metrics in self._session_history.items()
-        }
+        # Finished sessions hand out the dict built at finalize(), so this
+        # just collects references
+        with self._sessions_lock:
+            return {
+                session_id: metrics.to_dict()
+                for session_id, metrics in self._session_history.items()
+            }
     
     def clear_history(self) -> None:
         """Clear performance history."""
-        self._session_history.clear()
-        self._global_metrics.clear()
+        with self._sessions_lock:
+            self._session_history.clear()
         self.logger.info("Performance history cleared")
     
     def export_metrics(self, filepath: str, format: str = "json") -> None:
@@ -323,7 +491,6 @@ class PerformanceMonitor:
             filepath: Path to save metrics
             format: Export format ('json' or 'csv')
         """
-        import json
         from pathlib import Path
         
         data = {
@@ -335,19 +502,32 @@ class PerformanceMonitor:
         filepath = Path(filepath)
         
         if format.lower() == "json":
-            with open(filepath, 'w') as f:
-                json.dump(data, f, indent=2)
+            if _HAS_ORJSON:
+                # Serialized in C straight to UTF-8 bytes
+                with open(filepath, 'wb') as f:
+                    f.write(orjson.dumps(
+                        data,
+                        option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+                    ))
+            else:
+                import json
+                
+                with open(filepath, 'w') as f:
+                    json.dump(data, f, indent=2)
         elif format.lower() == "csv":
-            import pandas as pd
+            # Flat rows, so the stdlib writer does; no need to import pandas
+            import csv
             
-            # Convert session history to DataFrame
-            rows = []
-            for session_id, metrics in self._session_history.items():
-                row = {"session_id": session_id, **metrics.to_dict()}
-                rows.append(row)
+            rows = [
+                {"session_id": session_id, **metrics}
+                for session_id, metrics in data["session_history"].items()
+            ]
             
-            df = pd.DataFrame(rows)
-            df.to_csv(filepath, index=False)
+            with open(filepath, 'w', newline='') as f:
+                if rows:
+                    writer = csv.DictWriter(f, fieldnames=list(rows[0]), lineterminator='\n')
+                    writer.writeheader()
+                    writer.writerows(rows)
         else:
             raise ValueError(f"Unsupported export format: {format}")
         
@@ -0,0 +1,70 @@
+"""
+Rate limiting utilities for AI Portfolio project.
+"""
+
+import threading
+import time
+
+
+class TokenBucket:
+    """Thread-safe token-bucket rate limiter."""
+    
+    def __init__(self, rate_per_sec: float, capacity: float = 1.0):
+        """
+        Initialize the bucket, starting full.
+        
+        Args:
+            rate_per_sec: Tokens added per second
+            capacity: Maximum number of tokens, i.e. the permitted burst size
+        """
+        if rate_per_sec <= 0:
+            raise ValueError("rate_per_sec must be positive")
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        
+        self.rate = float(rate_per_sec)
+        self.capacity = float(capacity)
+        self._tokens = self.capacity
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def _refill(self, now: float) -> None:
+        """Add the tokens accrued since the last refill. Caller holds the lock."""
+        self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+        self._last = now
+    
+    def try_acquire(self, tokens: float = 1.0) -> bool:
+        """
+        Take tokens if they are available right now.
+        
+        Args:
+            tokens: Number of tokens to take
+        
+        Returns:
+            True if the tokens were taken, False otherwise
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return True
+            return False
+    
+    def acquire(self, tokens: float = 1.0) -> None:
+        """
+        Take tokens, sleeping only as long as needed for them to accrue.
+        
+        Args:
+            tokens: Number of tokens to take (at most the bucket capacity)
+        """
+        if tokens > self.capacity:
+            raise ValueError("Cannot acquire more tokens than the bucket capacity")
+        
+        while True:
+            with self._lock:
+                self._refill(time.monotonic())
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                wait = (tokens - self._tokens) / self.rate
+            time.sleep(wait)
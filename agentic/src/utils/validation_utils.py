@@ -2,15 +2,181 @@
 Validation utilities for AI Portfolio project.
 """
 
+import copy
+import functools
+import math
+import os
 import re
+import stat
 import json
-from typing import Any, Dict, List, Optional, Union, Callable
+import string
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple, Union, Callable
 from pathlib import Path
 from datetime import datetime
 
-from ..config.settings import Settings
+from ..config.settings import Settings, get_settings
 from .logging_utils import get_logger
 
+# Compiled once at import rather than looked up in re's cache per call
+_API_KEY_GENERIC_RE = re.compile(r'^[a-zA-Z0-9_-]+$')
+
+# sanitize_input: control characters to drop (everything below 0x20 except
+# tab, newline and carriage return, plus DEL)
+_CTRL_CHARS_TRANS = dict.fromkeys(
+    [*range(0x00, 0x09), 0x0B, 0x0C, *range(0x0E, 0x20), 0x7F]
+)
+
+# Character sets for the structural email/URL checks. They accept exactly what
+# the former patterns did:
+#   email: ^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$
+#   url:   ^https?://(?:[-\w.])+(?::[0-9]+)?(?:/(?:[\w/_.])*(?:\?(?:[\w&=%.])*)?(?:#(?:[\w.])*)?)?$
+_ASCII_WORD_CHARS = frozenset(string.ascii_letters + string.digits + "_")
+_EMAIL_LOCAL_CHARS = frozenset(string.ascii_letters + string.digits + "._%+-")
+_EMAIL_DOMAIN_CHARS = frozenset(string.ascii_letters + string.digits + ".-")
+_URL_HOST_CHARS = _ASCII_WORD_CHARS | frozenset("-.")
+_URL_PATH_CHARS = _ASCII_WORD_CHARS | frozenset("/.")
+_URL_QUERY_CHARS = _ASCII_WORD_CHARS | frozenset("&=%.")
+_URL_FRAGMENT_CHARS = _ASCII_WORD_CHARS | frozenset(".")
+
+
+def _word_chars_only(text: str, allowed: frozenset) -> bool:
+    """True if every character is in allowed or is a non-ASCII word character (regex \\w)."""
+    if text.isascii():
+        return allowed.issuperset(text)
+    return all(c in allowed or (not c.isascii() and c.isalnum()) for c in text)
+
+
+def _validate_generic_api_key(api_key: str) -> bool:
+    """Generic validation: at least 20 characters, alphanumeric + some special chars."""
+    return len(api_key) >= 20 and _API_KEY_GENERIC_RE.match(api_key) is not None
+
+
+# Per-provider API key format checks, looked up by lowercased provider name
+_API_KEY_VALIDATORS: Dict[str, Callable[[str], bool]] = {
+    # OpenAI keys start with 'sk-' and are 51 characters long
+    "openai": lambda key: key.startswith("sk-") and len(key) == 51,
+    # Anthropic keys start with 'sk-ant-'
+    "anthropic": lambda key: key.startswith("sk-ant-") and len(key) > 20,
+    # Google API keys are typically 39 characters long
+    "google": lambda key: len(key) == 39 and key.isalnum(),
+}
+
+
+# validate_with_schema field types: (python type, article + name for errors,
+# which constraints apply: "sized" = length, "numeric" = value).
+# isinstance() semantics are kept, so bools still pass as integers.
+_TYPE_MAP = {
+    "string": (str, "a string", "sized"),
+    "integer": (int, "an integer", "numeric"),
+    "boolean": (bool, "a boolean", "numeric"),
+    "list": (list, "a list", "sized"),
+}
+
+
+# validate_settings numeric fields: (min, max), inclusive
+_NUMERIC_SETTING_RANGES = {
+    "cache_ttl": (1, 86400),  # 1 second to 1 day
+    "max_workers": (1, 50),   # 1 to 50 workers
+    "api_rate_limit": (1, 10000),  # 1 to 10000 requests per minute
+    "max_file_size": (1024, 1073741824)  # 1KB to 1GB
+}
+
+
+def _numeric_setting_value(settings: Dict[str, Any], field: str) -> float:
+    """Column value for validate_settings_batch: NaN if absent, -inf if not an integer."""
+    if field not in settings:
+        return math.nan
+    value = settings[field]
+    if not isinstance(value, int):
+        return -math.inf
+    try:
+        return float(value)
+    except OverflowError:
+        return math.inf
+
+
+@functools.lru_cache(maxsize=128)
+def _build_allowed(required: Tuple[str, ...], optional: Tuple[str, ...]) -> frozenset:
+    """Field-name set for validate_json_structure, built once per field combination."""
+    allowed = set(required)
+    allowed.update(optional)
+    return frozenset(allowed)
+
+
+def _file_extension(filepath: Union[str, Path]) -> str:
+    """Lowercased extension without the dot, following Path.suffix's rules."""
+    name = os.path.basename(os.fspath(filepath).rstrip("/" + os.sep))
+    dot = name.rfind('.')
+    if 0 < dot < len(name) - 1:
+        return name[dot + 1:].lower()
+    return ""
+
+
+class _FieldSpec(NamedTuple):
+    """One schema field definition with its constraints pulled out."""
+    name: str
+    expected: Optional[Tuple[type, str, str]]
+    min_length: Any
+    max_length: Any
+    min_value: Any
+    max_value: Any
+    choices: Any
+    choices_set: Optional[frozenset]
+
+
+class CompiledSchema(NamedTuple):
+    """
+    Flattened form of a validate_with_schema schema, from compile_schema().
+    
+    Callers that validate many records against one schema can compile it
+    once and pass the result to validate_with_schema in place of the dict.
+    """
+    required: Tuple[str, ...]
+    fields: Tuple[_FieldSpec, ...]
+
+
+def compile_schema(schema: Dict[str, Any]) -> CompiledSchema:
+    """
+    Flatten a schema for repeated validate_with_schema calls.
+    
+    The compiled form is a snapshot: recompile after changing the schema.
+    
+    Args:
+        schema: Schema dictionary with field definitions
+        
+    Returns:
+        Compiled schema
+    """
+    fields = []
+    for field_name, definition in schema.get("fields", {}).items():
+        # Copied so later edits to the caller's container don't reach the snapshot
+        choices = copy.copy(definition.get("choices"))
+        choices_set = None
+        # Only containers get a set; `in` on a string choices value is a
+        # substring test, which a set of its characters would not preserve
+        if isinstance(choices, (list, tuple, set, frozenset)):
+            try:
+                choices_set = frozenset(choices)
+            except TypeError:
+                # Unhashable choices; membership falls back to the original container
+                pass
+        
+        fields.append(_FieldSpec(
+            name=field_name,
+            expected=_TYPE_MAP.get(definition.get("type")),
+            min_length=definition.get("min_length"),
+            max_length=definition.get("max_length"),
+            min_value=definition.get("min_value"),
+            max_value=definition.get("max_value"),
+            choices=choices,
+            choices_set=choices_set
+        ))
+    
+    return CompiledSchema(
+        required=tuple(schema.get("required", [])),
+        fields=tuple(fields)
+    )
+
 
 class ValidationError(Exception):
     """Custom validation error."""
@@ -27,7 +193,7 @@ class ValidationUtils:
         Args:
             settings: Application settings
         """
-        self.settings = settings or Settings()
+        self.settings = settings or get_settings()
         self.logger = get_logger("validation_utils")
     
     @staticmethod
@@ -41,8 +207,25 @@ class ValidationUtils:
         Returns:
             True if email is valid
         """
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return bool(re.match(pattern, email))
+        # The former pattern's '$' also matched before a final newline
+        if email.endswith('\n'):
+            email = email[:-1]
+        
+        local, at, domain = email.partition('@')
+        if not at or not local:
+            return False
+        
+        # Top-level domain: at least two letters after the last dot
+        dot = domain.rfind('.')
+        tld = domain[dot + 1:]
+        
+        return (
+            dot > 0
+            and len(tld) >= 2
+            and tld.isalpha()
+            and _EMAIL_LOCAL_CHARS.issuperset(local)
+            and _EMAIL_DOMAIN_CHARS.issuperset(domain)
+        )
     
     @staticmethod
     def validate_url(url: str) -> bool:
@@ -55,8 +238,37 @@ class ValidationUtils:
         Returns:
             True if URL is valid
         """
-        pattern = r'^https?://(?:[-\w.])+(?::[0-9]+)?(?:/(?:[\w/_.])*(?:\?(?:[\w&=%.])*)?(?:#(?:[\w.])*)?)?$'
-        return bool(re.match(pattern, url))
+        # The former pattern's '$' also matched before a final newline
+        if url.endswith('\n'):
+            url = url[:-1]
+        
+        if url.startswith('https://'):
+            rest = url[8:]
+        elif url.startswith('http://'):
+            rest = url[7:]
+        else:
+            return False
+        
+        # host[:port] up to the first '/'
+        authority, slash, tail = rest.partition('/')
+        host, colon, port = authority.partition(':')
+        if not host or not _word_chars_only(host, _URL_HOST_CHARS):
+            return False
+        if colon and not (port.isascii() and port.isdigit()):
+            return False
+        
+        # Query and fragment are only accepted after a path
+        if not slash:
+            return True
+        
+        tail, _, fragment = tail.partition('#')
+        path, _, query = tail.partition('?')
+        
+        return (
+            _word_chars_only(path, _URL_PATH_CHARS)
+            and _word_chars_only(query, _URL_QUERY_CHARS)
+            and _word_chars_only(fragment, _URL_FRAGMENT_CHARS)
+        )
     
     @staticmethod
     def validate_api_key_format(api_key: str, provider: str) -> bool:
@@ -73,23 +285,8 @@ class ValidationUtils:
         if not api_key or not isinstance(api_key, str):
             return False
         
-        provider = provider.lower()
-        
-        if provider == "openai":
-            # OpenAI keys start with 'sk-' and are 51 characters long
-            return api_key.startswith("sk-") and len(api_key) == 51
-        
-        elif provider == "anthropic":
-            # Anthropic keys start with 'sk-ant-'
-            return api_key.startswith("sk-ant-") and len(api_key) > 20
-        
-        elif provider == "google":
-            # Google API keys are typically 39 characters long
-            return len(api_key) == 39 and api_key.isalnum()
-        
-        else:
-            # Generic validation: at least 20 characters, alphanumeric + some special chars
-            return len(api_key) >= 20 and re.match(r'^[a-zA-Z0-9_-]+$', api_key)
+        validator = _API_KEY_VALIDATORS.get(provider.lower(), _validate_generic_api_key)
+        return validator(api_key)
     
     @staticmethod
     def validate_json_structure(
@@ -117,17 +314,18 @@ class ValidationUtils:
         if not isinstance(data, dict):
             return False
         
+        # Key-view comparisons run the membership loops in C
+        data_keys = data.keys()
+        required = tuple(required_fields)
+        
         # Check required fields
-        for field in required_fields:
-            if field not in data:
-                return False
+        if not data_keys >= _build_allowed(required, ()):
+            return False
         
         # Check that no unexpected fields are present
         if optional_fields:
-            allowed_fields = set(required_fields + optional_fields)
-            for field in data:
-                if field not in allowed_fields:
-                    return False
+            if not data_keys <= _build_allowed(required, tuple(optional_fields)):
+                return False
         
         return True
     
@@ -142,24 +340,23 @@ class ValidationUtils:
         Returns:
             True if file is valid
         """
-        file_path = Path(filepath)
-        
-        if not file_path.exists():
+        # One stat() covers existence, file type and size
+        try:
+            st = os.stat(filepath)
+        except (OSError, ValueError):
             return False
         
-        if not file_path.is_file():
+        if not stat.S_ISREG(st.st_mode):
             return False
         
         # Check file size
-        file_size = file_path.stat().st_size
         max_allowed = max_size or self.settings.max_file_size
         
-        if file_size > max_allowed:
+        if st.st_size > max_allowed:
             return False
         
         # Check file type
-        extension = file_path.suffix.lower().lstrip('.')
-        if extension not in self.settings.allowed_file_types:
+        if _file_extension(filepath) not in self.settings.allowed_file_types:
             return False
         
         return True
@@ -297,6 +494,53 @@ class ValidationUtils:
         Returns:
             List of validation errors (empty if valid)
         """
+        errors = self._validate_settings_sections(settings)
+        
+        # Validate numeric fields
+        for field, (min_val, max_val) in _NUMERIC_SETTING_RANGES.items():
+            if field in settings:
+                value = settings[field]
+                if not isinstance(value, int) or not (min_val <= value <= max_val):
+                    errors.append(f"Field '{field}' must be an integer between {min_val} and {max_val}")
+        
+        return errors
+    
+    def validate_settings_batch(self, settings_list: Iterable[Dict[str, Any]]) -> List[List[str]]:
+        """
+        Validate many settings dictionaries at once.
+        
+        Equivalent to calling validate_settings on each entry, but the numeric
+        range checks run as vectorized NumPy comparisons over one column per
+        field instead of a Python loop per record.
+        
+        Args:
+            settings_list: Settings dictionaries
+            
+        Returns:
+            One list of validation errors per settings dictionary, in order
+        """
+        import numpy as np
+        
+        settings_list = list(settings_list)
+        all_errors = [self._validate_settings_sections(settings) for settings in settings_list]
+        
+        for field, (min_val, max_val) in _NUMERIC_SETTING_RANGES.items():
+            values = np.fromiter(
+                (_numeric_setting_value(settings, field) for settings in settings_list),
+                dtype=np.float64,
+                count=len(settings_list)
+            )
+            # NaN marks "field absent", which is not an error
+            invalid = ~np.isnan(values) & ~((values >= min_val) & (values <= max_val))
+            
+            message = f"Field '{field}' must be an integer between {min_val} and {max_val}"
+            for index in np.flatnonzero(invalid):
+                all_errors[index].append(message)
+        
+        return all_errors
+    
+    def _validate_settings_sections(self, settings: Dict[str, Any]) -> List[str]:
+        """Validate the nested LLM and database sections of a settings dictionary."""
         errors = []
         
         # Validate LLM configurations
@@ -329,20 +573,6 @@ class ValidationUtils:
                     if db_config["type"] not in allowed_types:
                         errors.append(f"Database type must be one of: {allowed_types}")
         
-        # Validate numeric fields
-        numeric_fields = {
-            "cache_ttl": (1, 86400),  # 1 second to 1 day
-            "max_workers": (1, 50),   # 1 to 50 workers
-            "api_rate_limit": (1, 10000),  # 1 to 10000 requests per minute
-            "max_file_size": (1024, 1073741824)  # 1KB to 1GB
-        }
-        
-        for field, (min_val, max_val) in numeric_fields.items():
-            if field in settings:
-                value = settings[field]
-                if not isinstance(value, int) or not (min_val <= value <= max_val):
-                    errors.append(f"Field '{field}' must be an integer between {min_val} and {max_val}")
-        
         return errors
     
     @staticmethod
@@ -360,8 +590,12 @@ class ValidationUtils:
         if not isinstance(text, str):
             return ""
         
-        # Remove control characters except newline and tab
-        sanitized = re.sub(r'[\x00-\x08\x0B-\x0C\x0E-\x1F\x7F]', '', text)
+        # Remove control characters except newline and tab. Printable ASCII
+        # (the common case) has none, so skip the translate pass entirely.
+        if text.isascii() and text.isprintable():
+            sanitized = text
+        else:
+            sanitized = text.translate(_CTRL_CHARS_TRANS)
         
         # Limit length if specified
         if max_length and len(sanitized) > max_length:
@@ -375,66 +609,100 @@ class ValidationUtils:
     @staticmethod
     def validate_with_schema(
         data: Dict[str, Any],
-        schema: Dict[str, Any]
+        schema: Union[Dict[str, Any], CompiledSchema]
     ) -> List[str]:
         """
         Validate data against a simple schema.
         
         Args:
             data: Data to validate
-            schema: Schema dictionary with field definitions
+            schema: Schema dictionary with field definitions, or the result
+                of compile_schema() for a schema used many times
             
         Returns:
             List of validation errors
         """
         errors = []
         
+        compiled = isinstance(schema, CompiledSchema)
+        if compiled:
+            required = schema.required
+            fields: Iterable[Any] = schema.fields
+        else:
+            # One-off schema: read the definitions in place rather than compiling
+            required = schema.get("required", [])
+            fields = schema.get("fields", {}).items()
+        
         # Check required fields
-        required_fields = schema.get("required", [])
-        for field in required_fields:
+        for field in required:
             if field not in data:
                 errors.append(f"Missing required field: {field}")
         
         # Check field types and constraints
-        field_definitions = schema.get("fields", {})
-        for field_name, definition in field_definitions.items():
-            if field_name not in data:
-                continue
+        for entry in fields:
+            if compiled:
+                (field_name, expected, min_length, max_length,
+                 min_value, max_value, choices, choices_set) = entry
+                if field_name not in data:
+                    continue
+            else:
+                field_name, definition = entry
+                if field_name not in data:
+                    continue
+                get = definition.get
+                expected = _TYPE_MAP.get(get("type"))
+                min_length = get("min_length")
+                max_length = get("max_length")
+                min_value = get("min_value")
+                max_value = get("max_value")
+                choices = get("choices")
+                choices_set = None
             
             value = data[field_name]
-            field_type = definition.get("type")
             
-            # Type validation
-            if field_type == "string" and not isinstance(value, str):
-                errors.append(f"Field '{field_name}' must be a string")
-            elif field_type == "integer" and not isinstance(value, int):
-                errors.append(f"Field '{field_name}' must be an integer")
-            elif field_type == "boolean" and not isinstance(value, bool):
-                errors.append(f"Field '{field_name}' must be a boolean")
-            elif field_type == "list" and not isinstance(value, list):
-                errors.append(f"Field '{field_name}' must be a list")
+            # Type validation; once it passes, the type's kind tells which
+            # constraints can apply without probing the value again
+            kind = None
+            if expected is not None:
+                if isinstance(value, expected[0]):
+                    kind = expected[2]
+                else:
+                    errors.append(f"Field '{field_name}' must be {expected[1]}")
             
             # Length constraints
-            if "min_length" in definition:
-                if hasattr(value, "__len__") and len(value) < definition["min_length"]:
-                    errors.append(f"Field '{field_name}' must have at least {definition['min_length']} characters/items")
-            
-            if "max_length" in definition:
-                if hasattr(value, "__len__") and len(value) > definition["max_length"]:
-                    errors.append(f"Field '{field_name}' must have at most {definition['max_length']} characters/items")
+            if min_length is not None or max_length is not None:
+                sized = kind == "sized" if kind is not None else hasattr(value, "__len__")
+                if sized:
+                    length = len(value)
+                    if min_length is not None and length < min_length:
+                        errors.append(
+                            f"Field '{field_name}' must have at least {min_length} characters/items"
+                        )
+                    if max_length is not None and length > max_length:
+                        errors.append(
+                            f"Field '{field_name}' must have at most {max_length} characters/items"
+                        )
             
             # Value constraints
-            if "min_value" in definition:
-                if isinstance(value, (int, float)) and value < definition["min_value"]:
-                    errors.append(f"Field '{field_name}' must be at least {definition['min_value']}")
-            
-            if "max_value" in definition:
-                if isinstance(value, (int, float)) and value > definition["max_value"]:
-                    errors.append(f"Field '{field_name}' must be at most {definition['max_value']}")
+            if min_value is not None or max_value is not None:
+                numeric = kind == "numeric" if kind is not None else isinstance(value, (int, float))
+                if numeric:
+                    if min_value is not None and value < min_value:
+                        errors.append(f"Field '{field_name}' must be at least {min_value}")
+                    if max_value is not None and value > max_value:
+                        errors.append(f"Field '{field_name}' must be at most {max_value}")
             
             # Choices validation
-            if "choices" in definition:
-                if value not in definition["choices"]:
-                    errors.append(f"Field '{field_name}' must be one of: {definition['choices']}")
+            if choices is not None:
+                if choices_set is not None:
+                    try:
+                        allowed = value in choices_set
+                    except TypeError:
+                        # Unhashable value; fall back to the original container
+                        allowed = value in choices
+                else:
+                    allowed = value in choices
+                if not allowed:
+                    errors.append(f"Field '{field_name}' must be one of: {choices}")
         
-        return errors
\ No newline at end of file
+        return errors
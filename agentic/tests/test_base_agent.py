@@ -0,0 +1,67 @@
+"""
+Tests for agent configuration.
+"""
+
+import pytest
+
+pytest.importorskip("crewai")
+
+from src.agents.base_agent import AgentConfig  # noqa: E402
+
+_REQUIRED = {"role": "Researcher", "goal": "Find facts", "backstory": "Seasoned analyst"}
+
+
+@pytest.mark.unit
+def test_defaults():
+    """Only role, goal and backstory are required."""
+    config = AgentConfig(**_REQUIRED)
+
+    assert config.verbose is True
+    assert config.allow_delegation is False
+    assert config.max_iter == 5
+    assert config.memory is True
+    assert config.max_execution_time is None
+
+
+@pytest.mark.unit
+def test_numeric_and_bool_fields_are_coerced():
+    """Strings and integral floats are coerced as the pydantic model did."""
+    config = AgentConfig(
+        **_REQUIRED,
+        max_iter="7",
+        max_execution_time=30.0,
+        verbose="false",
+        allow_delegation="yes",
+        memory=0,
+    )
+
+    assert config.max_iter == 7
+    assert config.max_execution_time == 30
+    assert config.verbose is False
+    assert config.allow_delegation is True
+    assert config.memory is False
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("overrides", [
+    {"max_iter": "five"},
+    {"max_iter": 2.5},
+    {"max_iter": True},
+    {"max_execution_time": "soon"},
+    {"verbose": "maybe"},
+    {"memory": 2},
+    {"role": "   "},
+    {"goal": ""},
+    {"backstory": "\n"},
+])
+def test_invalid_values_raise_value_error(overrides):
+    """Bad values and blank text fields are rejected with ValueError."""
+    with pytest.raises(ValueError):
+        AgentConfig(**{**_REQUIRED, **overrides})
+
+
+@pytest.mark.unit
+def test_unknown_keyword_raises_type_error():
+    """Unlike the pydantic model, the dataclass rejects unknown keyword arguments."""
+    with pytest.raises(TypeError):
+        AgentConfig(**_REQUIRED, temperature=0.2)
@@ -0,0 +1,42 @@
+"""
+Tests for crew pooling in the crew factory.
+"""
+
+from unittest.mock import Mock
+
+import pytest
+
+pytest.importorskip("crewai")
+
+from src.utils.crew_factory import _CrewPool  # noqa: E402
+
+
+def _make_crew(memory: bool) -> Mock:
+    """Build a stand-in crew that has finished a run."""
+    agent = Mock(tools_results=[{"tool": "search", "result": "previous run"}])
+    task = Mock(output="previous run output")
+    return Mock(memory=memory, agents=[agent], tasks=[task])
+
+
+@pytest.mark.unit
+def test_reused_crew_starts_without_previous_run_state():
+    """A pooled crew comes back with no task outputs or tool results."""
+    pool = _CrewPool()
+    crew = _make_crew(memory=False)
+
+    pool.release(("research", ()), crew)
+    reused = pool.acquire(("research", ()))
+
+    assert reused is crew
+    assert all(task.output is None for task in reused.tasks)
+    assert all(agent.tools_results == [] for agent in reused.agents)
+
+
+@pytest.mark.unit
+def test_crew_with_memory_is_not_pooled():
+    """A crew built with memory is dropped so its memory can't reach another run."""
+    pool = _CrewPool()
+
+    pool.release(("research", ()), _make_crew(memory=True))
+
+    assert pool.acquire(("research", ())) is None
@@ -0,0 +1,179 @@
+"""
+Tests for file utilities.
+"""
+
+import enum
+import json
+import math
+import os
+import time
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from src.utils import file_utils
+from src.utils.file_utils import FileUtils
+
+
+class _Color(enum.Enum):
+    """Plain (non-str) enum, which json.dump writes through default=str."""
+    
+    RED = 1
+
+
+@pytest.fixture
+def file_utils_instance(mock_env_vars):
+    """FileUtils with default settings."""
+    return FileUtils()
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("kwargs", [{}, {"indent": 0}, {"indent": None}, {"compact": True}])
+def test_write_json_file_matches_json_dump(file_utils_instance, tmp_path, kwargs):
+    """By default the output is exactly what json.dump writes, whatever the payload."""
+    data = {
+        "nan": math.nan,
+        "inf": math.inf,
+        "numpy": np.float64(1.5),
+        "enum": _Color.RED,
+        "text": "café",
+        "nested": [1, 2.5, None, True],
+    }
+    target = tmp_path / "out.json"
+    
+    file_utils_instance.write_json_file(data, target, **kwargs)
+    
+    indent = None if kwargs.get("compact") else kwargs.get("indent", 2)
+    separators = (',', ':') if kwargs.get("compact") else None
+    expected = json.dumps(data, indent=indent, separators=separators, default=str)
+    assert target.read_text(encoding="utf-8") == expected
+
+
+@pytest.mark.unit
+@pytest.mark.skipif(not file_utils._HAS_ORJSON, reason="orjson not installed")
+@pytest.mark.parametrize("kwargs", [{}, {"compact": True}])
+def test_write_json_file_orjson_matches_json_dump_for_plain_data(
+    file_utils_instance, tmp_path, kwargs
+):
+    """Opting into orjson gives the stdlib's output for plain ASCII data."""
+    data = {"name": "report", "count": 3, "ok": True, "items": [1, "two", None], "empty": {}}
+    orjson_path = tmp_path / "orjson.json"
+    stdlib_path = tmp_path / "stdlib.json"
+    
+    file_utils_instance.write_json_file(data, orjson_path, use_orjson=True, **kwargs)
+    file_utils_instance.write_json_file(data, stdlib_path, **kwargs)
+    
+    assert orjson_path.read_bytes() == stdlib_path.read_bytes()
+
+
+def _age(path, days: float) -> None:
+    """Backdate a file's access and modification times by the given number of days."""
+    past = time.time() - days * 24 * 3600
+    os.utime(path, (past, past))
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("pattern", ["*", "*.log", "**/*.log"])
+def test_cleanup_old_files_selects_only_old_matching_files(
+    file_utils_instance, tmp_path, pattern
+):
+    """Only regular files older than the cutoff that match the pattern are removed."""
+    (tmp_path / "sub").mkdir()
+    old_log = tmp_path / "old.log"
+    new_log = tmp_path / "new.log"
+    old_txt = tmp_path / "old.txt"
+    nested_log = tmp_path / "sub" / "nested.log"
+    for path in (old_log, new_log, old_txt, nested_log):
+        path.write_text("x")
+    for path in (old_log, old_txt, nested_log):
+        _age(path, 10)
+    
+    deleted = file_utils_instance.cleanup_old_files(tmp_path, max_age_days=5, pattern=pattern)
+    
+    expected = {
+        "*": {old_log, old_txt},
+        "*.log": {old_log},
+        "**/*.log": {old_log, nested_log},
+    }[pattern]
+    assert set(deleted) == expected
+    assert not any(path.exists() for path in expected)
+    assert new_log.exists()
+    assert (tmp_path / "sub").is_dir()
+
+
+@pytest.mark.unit
+def test_cleanup_old_files_dry_run_and_count(file_utils_instance, tmp_path):
+    """A dry run deletes nothing, and return_list=False returns only the count."""
+    for name in ("a.log", "b.log"):
+        (tmp_path / name).write_text("x")
+        _age(tmp_path / name, 10)
+    
+    would_delete = file_utils_instance.cleanup_old_files(tmp_path, 5, dry_run=True)
+    assert len(would_delete) == 2
+    assert all(path.exists() for path in would_delete)
+    
+    assert file_utils_instance.cleanup_old_files(tmp_path, 5, return_list=False) == 2
+    assert not any(tmp_path.iterdir())
+
+
+@pytest.mark.unit
+@pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="requires os.mkfifo")
+def test_recursive_cleanup_skips_special_files(file_utils_instance, tmp_path):
+    """The recursive scan never selects fifos, even when they match and are old."""
+    (tmp_path / "sub").mkdir()
+    fifo = tmp_path / "sub" / "pipe.log"
+    os.mkfifo(fifo)
+    _age(fifo, 10)
+    
+    assert file_utils_instance.cleanup_old_files(tmp_path, 5, pattern="**/*.log") == []
+    assert fifo.exists()
+
+
+@pytest.mark.unit
+def test_cleanup_old_files_missing_directory(file_utils_instance, tmp_path):
+    """A directory that doesn't exist has nothing to clean up."""
+    assert file_utils_instance.cleanup_old_files(tmp_path / "missing", 5) == []
+
+
+@pytest.mark.unit
+def test_get_file_info_timestamps(temp_file):
+    """Timestamps are local-time ISO-8601 at second resolution, with raw floats alongside."""
+    path = temp_file("hello")
+    stat = os.stat(path)
+    
+    info = FileUtils.get_file_info(path)
+    
+    for key, raw in (("created", stat.st_ctime), ("modified", stat.st_mtime),
+                     ("accessed", stat.st_atime)):
+        assert info[f"{key}_ts"] == raw
+        assert info[key] == datetime.fromtimestamp(raw).replace(microsecond=0).isoformat()
+    assert info["size"] == 5
+    assert info["is_file"] is True
+    assert info["is_directory"] is False
+
+
+@pytest.mark.unit
+def test_get_file_info_missing_file(tmp_path):
+    """A missing file raises FileNotFoundError naming the path."""
+    with pytest.raises(FileNotFoundError, match="missing.txt"):
+        FileUtils.get_file_info(tmp_path / "missing.txt")
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("filename, expected", [
+    ("report.txt", "report.txt"),
+    ('a<b>c:d"e/f\\g|h?i*j.txt', "a_b_c_d_e_f_g_h_i_j.txt"),
+    ("a::??b", "a_b"),
+    ("__name__", "name"),
+    ("a___b", "a_b"),
+])
+def test_safe_filename(filename, expected):
+    """Invalid characters become single underscores, trimmed from the ends."""
+    assert FileUtils.safe_filename(filename) == expected
+
+
+@pytest.mark.unit
+def test_safe_filename_keeps_extension_when_trimming():
+    """Over-long names are cut before the extension."""
+    assert FileUtils.safe_filename("a" * 20 + ".txt", max_length=10) == "aaaaaa.txt"
@@ -0,0 +1,90 @@
+"""
+Tests for performance metrics collection.
+"""
+
+import numpy as np
+import pytest
+
+from src.utils.performance_monitor import PerformanceMetrics
+
+
+@pytest.mark.unit
+def test_ring_buffer_wraps_around():
+    """Once full, new samples overwrite the oldest; totals still cover every sample."""
+    metrics = PerformanceMetrics(start_time=0.0, capacity=3)
+    samples = [(10.0, 100.0), (20.0, 300.0), (30.0, 200.0), (40.0, 150.0), (50.0, 120.0)]
+
+    for cpu, memory in samples:
+        metrics.add_sample(cpu, memory)
+
+    assert metrics.sample_count == 5
+    assert metrics.cpu_usage.tolist() == [40.0, 50.0, 30.0]
+    assert metrics.memory_usage.tolist() == [150.0, 120.0, 200.0]
+
+    summary = metrics.live_summary(now=2.0)
+    assert summary["duration"] == 2.0
+    assert summary["average_cpu"] == pytest.approx(30.0)
+    assert summary["peak_memory"] == 300.0
+    assert summary["cpu_samples"] == 5
+
+
+@pytest.mark.unit
+def test_finalize_computes_summary_and_caches_dict():
+    """finalize() fills in the summary, and to_dict() then returns one cached dict."""
+    metrics = PerformanceMetrics(start_time=10.0, capacity=8)
+    metrics.add_sample(10.0, 50.0)
+    metrics.add_sample(30.0, 70.0)
+    metrics.total_tasks = 4
+    metrics.completed_tasks = 3
+    metrics.end_time = 15.0
+
+    metrics.finalize()
+    result = metrics.to_dict()
+
+    assert metrics.duration == 5.0
+    assert metrics.average_cpu == pytest.approx(20.0)
+    assert metrics.peak_memory == 70.0
+    assert result["success_rate"] == 0.75
+    assert result["cpu_samples"] == result["memory_samples"] == 2
+    assert metrics.to_dict() is result
+
+
+@pytest.mark.unit
+def test_finalize_without_samples():
+    """A session with no samples finalizes to zeroed CPU and memory figures."""
+    metrics = PerformanceMetrics(start_time=1.0, end_time=3.0, capacity=4)
+
+    metrics.finalize()
+
+    result = metrics.to_dict()
+    assert result["duration"] == 2.0
+    assert result["average_cpu"] == 0.0
+    assert result["peak_memory"] == 0.0
+    assert result["cpu_samples"] == 0
+
+
+@pytest.mark.unit
+def test_compact_keeps_stored_samples():
+    """compact() trims the unused buffer tail without losing samples."""
+    metrics = PerformanceMetrics(start_time=0.0, capacity=10)
+    metrics.add_sample(5.0, 60.0)
+    metrics.add_sample(15.0, 80.0)
+
+    metrics.compact()
+
+    assert metrics.capacity == 2
+    assert metrics.cpu_usage.tolist() == [5.0, 15.0]
+    assert metrics.memory_usage.tolist() == [60.0, 80.0]
+
+
+@pytest.mark.unit
+def test_samples_passed_in_are_adopted():
+    """Samples given to the constructor count towards the running totals."""
+    metrics = PerformanceMetrics(start_time=0.0, cpu_usage=[10.0, 20.0], memory_usage=[40.0, 90.0])
+
+    assert isinstance(metrics.cpu_usage, np.ndarray)
+    assert metrics.sample_count == 2
+
+    metrics.finalize()
+    assert metrics.average_cpu == pytest.approx(15.0)
+    assert metrics.peak_memory == 90.0
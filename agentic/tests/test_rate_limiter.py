@@ -0,0 +1,80 @@
+"""
+Tests for the token-bucket rate limiter.
+"""
+
+import pytest
+
+from src.utils import rate_limiter
+from src.utils.rate_limiter import TokenBucket
+
+
+class _FakeClock:
+    """Stands in for time.monotonic and time.sleep; sleeping advances the clock."""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Replace the rate limiter's clock with a fake one."""
+    fake = _FakeClock()
+    monkeypatch.setattr(rate_limiter.time, "monotonic", fake.monotonic)
+    monkeypatch.setattr(rate_limiter.time, "sleep", fake.sleep)
+    return fake
+
+
+@pytest.mark.unit
+def test_bucket_starts_full_and_refills_at_rate(clock):
+    """A full bucket allows a burst of `capacity`, then refills at `rate` per second."""
+    bucket = TokenBucket(rate_per_sec=2, capacity=3)
+
+    assert [bucket.try_acquire() for _ in range(4)] == [True, True, True, False]
+
+    clock.now += 0.5
+    assert bucket.try_acquire()
+    assert not bucket.try_acquire()
+
+    # Refill never exceeds capacity
+    clock.now += 60
+    assert [bucket.try_acquire() for _ in range(4)] == [True, True, True, False]
+
+
+@pytest.mark.unit
+def test_acquire_sleeps_only_until_tokens_accrue(clock):
+    """acquire() sleeps just long enough for the missing tokens."""
+    bucket = TokenBucket(rate_per_sec=4, capacity=1)
+
+    bucket.acquire()
+    assert clock.sleeps == []
+
+    clock.now += 0.1
+    bucket.acquire()
+    assert clock.sleeps == [pytest.approx(0.15)]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("kwargs", [
+    {"rate_per_sec": 0},
+    {"rate_per_sec": -1},
+    {"rate_per_sec": 1, "capacity": 0.5},
+])
+def test_invalid_bucket_parameters(kwargs):
+    """Non-positive rates and capacities below one token are rejected."""
+    with pytest.raises(ValueError):
+        TokenBucket(**kwargs)
+
+
+@pytest.mark.unit
+def test_acquire_more_than_capacity(clock):
+    """Asking for more tokens than the bucket can hold fails instead of waiting forever."""
+    with pytest.raises(ValueError):
+        TokenBucket(rate_per_sec=1, capacity=2).acquire(3)
@@ -0,0 +1,50 @@
+"""
+Tests for application settings.
+"""
+
+import pytest
+
+from src.config.settings import Settings
+from src.utils.file_utils import FileUtils
+from src.utils.validation_utils import ValidationUtils
+
+
+@pytest.mark.unit
+def test_allowed_file_types_are_normalized(mock_env_vars):
+    """File types are stored lower-cased, without a leading dot."""
+    settings = Settings(allowed_file_types=[".TXT", "Md", "json"])
+
+    assert settings.allowed_file_types == ["txt", "md", "json"]
+
+
+@pytest.mark.unit
+def test_allowed_file_types_are_normalized_on_assignment(mock_env_vars):
+    """Assigning a new list normalizes it too, and checks see the change at once."""
+    settings = Settings()
+    file_utils = FileUtils(settings)
+
+    assert not file_utils.validate_file_type("image.PNG")
+
+    settings.allowed_file_types = [".PNG"]
+
+    assert settings.allowed_file_types == ["png"]
+    assert file_utils.validate_file_type("image.PNG")
+    assert not file_utils.validate_file_type("notes.txt")
+
+
+@pytest.mark.unit
+def test_validate_file_content_checks_allowed_types(mock_env_vars, temp_file):
+    """validate_file_content accepts allowed extensions in any case."""
+    validator = ValidationUtils(Settings(allowed_file_types=[".md"]))
+
+    assert validator.validate_file_content(temp_file("# notes", "notes.MD"))
+    assert not validator.validate_file_content(temp_file("notes", "notes.txt"))
+
+
+@pytest.mark.unit
+def test_settings_file_round_trip(mock_env_vars, tmp_path):
+    """Settings written by to_file load back with the same file types."""
+    path = tmp_path / "settings.json"
+    Settings(allowed_file_types=["CSV"]).to_file(str(path))
+
+    assert Settings.from_file(str(path)).allowed_file_types == ["csv"]
@@ -0,0 +1,128 @@
+"""
+Tests for validation utilities.
+"""
+
+import re
+
+import pytest
+
+from src.utils.validation_utils import ValidationUtils, compile_schema
+
+# The regexes validate_email/validate_url used before the structural checks
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_URL_RE = re.compile(
+    r'^https?://(?:[-\w.])+(?::[0-9]+)?(?:/(?:[\w/_.])*(?:\?(?:[\w&=%.])*)?(?:#(?:[\w.])*)?)?$'
+)
+
+_EMAILS = [
+    "user@example.com",
+    "first.last+tag@sub.example.co.uk",
+    "user_%-1@ex-ample.org",
+    "user@example.com\n",
+    "user@example.c",
+    "user@example.c0m",
+    "user@.com",
+    "@example.com",
+    "user@",
+    "user",
+    "user@@example.com",
+    "us er@example.com",
+    "user@exa_mple.com",
+    "user@example.com\n\n",
+    "",
+]
+
+_URLS = [
+    "http://example.com",
+    "https://example.com:8080",
+    "https://example.com/path/to/page.html",
+    "https://example.com/search?q=1&r=2%20",
+    "https://example.com/page#section.2",
+    "https://example.com/?q=1",
+    "https://exämple.com/päth",
+    "https://example.com\n",
+    "https://example.com?q=1",
+    "https://example.com:port",
+    "https://example.com:",
+    "https://",
+    "ftp://example.com",
+    "https://example.com/a b",
+    "https://example.com/path-with-dash",
+    "https://example.com/#frag#ment",
+    "",
+]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("email", _EMAILS)
+def test_validate_email_matches_former_regex(email):
+    """The structural check accepts exactly what the former regex accepted."""
+    assert ValidationUtils.validate_email(email) == bool(_EMAIL_RE.match(email))
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("url", _URLS)
+def test_validate_url_matches_former_regex(url):
+    """The structural check accepts exactly what the former regex accepted."""
+    assert ValidationUtils.validate_url(url) == bool(_URL_RE.match(url))
+
+
+_SCHEMA = {
+    "required": ["name", "age"],
+    "fields": {
+        "name": {"type": "string", "min_length": 2, "max_length": 5},
+        "age": {"type": "integer", "min_value": 0, "max_value": 120},
+        "tags": {"type": "list", "max_length": 2},
+        "color": {"choices": ["red", "green"]},
+        "grade": {"choices": "ABC"},
+        "payload": {"choices": [{"a": 1}]},
+    },
+}
+
+_SCHEMA_CASES = [
+    ({"name": "Ann", "age": 30}, []),
+    ({"name": "Ann"}, ["Missing required field: age"]),
+    ({"name": "A", "age": 30}, ["Field 'name' must have at least 2 characters/items"]),
+    ({"name": "Annabel", "age": 30}, ["Field 'name' must have at most 5 characters/items"]),
+    ({"name": 7, "age": 30}, ["Field 'name' must be a string"]),
+    ({"name": "Ann", "age": -1}, ["Field 'age' must be at least 0"]),
+    ({"name": "Ann", "age": 121}, ["Field 'age' must be at most 120"]),
+    ({"name": "Ann", "age": 30, "tags": [1, 2, 3]},
+     ["Field 'tags' must have at most 2 characters/items"]),
+    ({"name": "Ann", "age": 30, "color": "red"}, []),
+    ({"name": "Ann", "age": 30, "color": "blue"},
+     ["Field 'color' must be one of: ['red', 'green']"]),
+    ({"name": "Ann", "age": 30, "color": ["red"]},
+     ["Field 'color' must be one of: ['red', 'green']"]),
+    # String choices keep str's substring semantics
+    ({"name": "Ann", "age": 30, "grade": "AB"}, []),
+    ({"name": "Ann", "age": 30, "grade": "D"}, ["Field 'grade' must be one of: ABC"]),
+    ({"name": "Ann", "age": 30, "payload": {"a": 1}}, []),
+    ({"name": "Ann", "age": 30, "payload": {"a": 2}},
+     ["Field 'payload' must be one of: [{'a': 1}]"]),
+]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("data, expected", _SCHEMA_CASES)
+def test_validate_with_schema(data, expected):
+    """Schema dicts and compiled schemas report the same errors."""
+    errors = ValidationUtils.validate_with_schema(data, _SCHEMA)
+
+    assert errors == expected
+    assert ValidationUtils.validate_with_schema(data, compile_schema(_SCHEMA)) == expected
+
+
+@pytest.mark.unit
+def test_compiled_schema_is_a_snapshot():
+    """Editing the schema after compiling it doesn't change the compiled form."""
+    choices = ["red", "green"]
+    schema = {"fields": {"color": {"choices": choices}}}
+    compiled = compile_schema(schema)
+
+    choices.append("blue")
+
+    assert ValidationUtils.validate_with_schema({"color": "blue"}, schema) == []
+    assert ValidationUtils.validate_with_schema({"color": "blue"}, compiled) == [
+        "Field 'color' must be one of: ['red', 'green']"
+    ]